@@ -11,13 +11,22 @@ Strategy:
 - Position stop-loss: 40%
 - Quarterly rebalancing
 
+IncrementalHybridAllocator keeps rolling per-symbol windows and the current
+regime between calls, updates on new bars only and persists its state to
+JSON, so a restarted bot resumes with the same regime (hysteresis) instead
+of recomputing every MA and TQS over the full history.
+
 Author: Strategy Factory
 Date: 2025-10-15
 """
 
+import json
+import math
+from collections import deque
+from pathlib import Path
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -149,7 +158,8 @@ class NickRadgeCryptoHybrid:
     def generate_allocations(
         self,
         prices: pd.DataFrame,
-        btc_prices: pd.Series = None
+        btc_prices: pd.Series = None,
+        regime: Optional[str] = None
     ) -> Dict[str, float]:
         """
         Generate target allocations for all assets
@@ -157,15 +167,17 @@ class NickRadgeCryptoHybrid:
         Args:
             prices: DataFrame with price data for all assets (columns = symbols)
             btc_prices: BTC price series for regime detection (optional)
+            regime: Regime to allocate for (default: detect_regime(btc_prices))
 
         Returns:
             Dictionary mapping symbol to target allocation (0.0 to 1.0)
         """
         # Detect regime
-        if btc_prices is None:
-            btc_prices = prices['BTC/USDT'] if 'BTC/USDT' in prices.columns else prices.iloc[:, 0]
+        if regime is None:
+            if btc_prices is None:
+                btc_prices = prices['BTC/USDT'] if 'BTC/USDT' in prices.columns else prices.iloc[:, 0]
 
-        regime = self.detect_regime(btc_prices)
+            regime = self.detect_regime(btc_prices)
 
         # Initialize allocations
         allocations = {}
@@ -233,6 +245,303 @@ class NickRadgeCryptoHybrid:
         return stop_signals
 
 
+# Regime states of IncrementalHybridAllocator (same state machine as the
+# backtest engine's hysteresis regime filter)
+REGIME_UNKNOWN = 'UNKNOWN'
+REGIME_BEAR = 'BEAR'
+REGIME_WEAK_BULL = 'WEAK_BULL'
+REGIME_STRONG_BULL = 'STRONG_BULL'
+
+
+class IncrementalHybridAllocator:
+    """
+    Stateful, bar-by-bar allocator for NickRadgeCryptoHybrid (live)
+
+    generate_allocations recomputes the regime MAs and every symbol's TQS
+    over the full price history on each call and forgets the previous
+    regime. This allocator keeps, per symbol, a rolling window of the last
+    ma_period closes (plus the BTC regime windows) and the current regime,
+    and only processes bars newer than the last one it has seen.
+
+    Allocation rules are those of NickRadgeCryptoHybrid.generate_allocations.
+    The regime comes from the backtest engine's hysteresis state machine
+    (strategies/06_nick_radge_crypto_hybrid.py, on the latest close rather
+    than the previous one) instead of the memoryless detect_regime, so
+    replay() on a price history reproduces generate_allocations(prefix,
+    regime=<engine regime>) on every prefix of it.
+
+    State is saved to state_path after each replay() (or via save_state).
+    Loading a state saved with other window/regime settings raises ValueError.
+    """
+
+    def __init__(self,
+                 strategy: Optional[NickRadgeCryptoHybrid] = None,
+                 regime_hysteresis: float = 0.02,
+                 btc_symbol: str = 'BTC/USDT',
+                 state_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize incremental allocator
+
+        Args:
+            strategy: Live strategy providing the parameters (default: NickRadgeCryptoHybrid())
+            regime_hysteresis: Buffer % around the regime MAs to prevent whipsaw (default: 0.02)
+            btc_symbol: Symbol driving the regime filter (bars without it count as missing)
+            state_path: JSON file to load state from (if it exists) and save it to
+        """
+        self.strategy = strategy or NickRadgeCryptoHybrid()
+        self.regime_hysteresis = regime_hysteresis
+        self.btc_symbol = btc_symbol
+        self.state_path = Path(state_path) if state_path is not None else None
+
+        self.symbols: List[str] = []
+        self.windows: Dict[str, deque] = {}
+        self.bar_counts: Dict[str, int] = {}
+        self.btc_window: deque = deque(maxlen=self.strategy.regime_ma_long)
+        self.btc_bars = 0
+        self.regime_state = REGIME_UNKNOWN
+        self.last_timestamp: Optional[pd.Timestamp] = None
+        self.allocations: Dict[str, float] = {}
+
+        if self.state_path is not None and self.state_path.exists():
+            self.load_state(self.state_path)
+
+    @property
+    def regime(self) -> str:
+        """Current regime ('STRONG_BULL' until the long regime MA has enough bars, as detect_regime)"""
+        return REGIME_STRONG_BULL if self.regime_state == REGIME_UNKNOWN else self.regime_state
+
+    def update(self, timestamp, closes: Dict[str, float]) -> Dict[str, float]:
+        """
+        Process one new bar
+
+        Bars at or before the last processed timestamp are ignored.
+
+        Args:
+            timestamp: Bar timestamp
+            closes: Close price per symbol (symbols missing from the bar get NaN)
+
+        Returns:
+            Target allocations after this bar (symbol -> weight)
+        """
+        timestamp = pd.Timestamp(timestamp)
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return self.allocations
+
+        for symbol in closes:
+            if symbol not in self.windows:
+                self._add_symbol(symbol)
+
+        for symbol in self.symbols:
+            close = closes.get(symbol, np.nan)
+            self.windows[symbol].append(np.nan if close is None else float(close))
+            self.bar_counts[symbol] += 1
+
+        # Regime window only ever holds btc_symbol closes (NaN when the bar has none)
+        btc_close = closes.get(self.btc_symbol)
+        self.btc_window.append(np.nan if btc_close is None else float(btc_close))
+        self.btc_bars += 1
+        self._update_regime()
+
+        self.last_timestamp = timestamp
+        self.allocations = self._allocations()
+        return self.allocations
+
+    def replay(self, prices: pd.DataFrame) -> pd.DataFrame:
+        """
+        Feed a price history bar by bar (only bars newer than the current state)
+
+        Args:
+            prices: DataFrame with close prices (rows = bars, columns = symbols)
+
+        Returns:
+            DataFrame of target allocations after each processed bar
+        """
+        if self.last_timestamp is not None:
+            prices = prices[prices.index > self.last_timestamp]
+
+        columns = list(prices.columns)
+        rows = {}
+        for timestamp, values in zip(prices.index, prices.values.tolist()):
+            rows[timestamp] = self.update(timestamp, dict(zip(columns, values)))
+
+        if self.state_path is not None and rows:
+            self.save_state(self.state_path)
+
+        return pd.DataFrame.from_dict(rows, orient='index').fillna(0.0)
+
+    def _add_symbol(self, symbol: str) -> None:
+        """Start tracking a symbol (earlier bars count as missing, as in a joined DataFrame)"""
+        window = deque(maxlen=self.strategy.ma_period)
+        bars = self.btc_bars
+        window.extend([np.nan] * min(bars, self.strategy.ma_period))
+        self.symbols.append(symbol)
+        self.windows[symbol] = window
+        self.bar_counts[symbol] = bars
+
+    def _window_mean(self, window: deque, period: int) -> float:
+        """Mean of the last period values (NaN if fewer bars or any NaN, as rolling().mean())"""
+        if len(window) < period:
+            return np.nan
+        values = list(window)[-period:]
+        if any(math.isnan(v) for v in values):
+            return np.nan
+        return float(np.mean(values))
+
+    def _update_regime(self) -> None:
+        """Advance the hysteresis regime state machine by one bar"""
+        if self.btc_bars < self.strategy.regime_ma_long:
+            return
+
+        price = self.btc_window[-1]
+        ma_long = self._window_mean(self.btc_window, self.strategy.regime_ma_long)
+        ma_short = self._window_mean(self.btc_window, self.strategy.regime_ma_short)
+        if math.isnan(price) or math.isnan(ma_long) or math.isnan(ma_short):
+            return
+
+        up = 1 + self.regime_hysteresis
+        down = 1 - self.regime_hysteresis
+        state = self.regime_state
+
+        if state == REGIME_BEAR:
+            # In BEAR: Need to exceed long MA upper band to exit
+            if price > ma_long * up:
+                state = REGIME_STRONG_BULL if price > ma_short * up else REGIME_WEAK_BULL
+        elif state == REGIME_WEAK_BULL:
+            # Fall below long MA lower band → BEAR, exceed short MA upper band → STRONG_BULL
+            if price < ma_long * down:
+                state = REGIME_BEAR
+            elif price > ma_short * up:
+                state = REGIME_STRONG_BULL
+        elif state == REGIME_STRONG_BULL:
+            # Fall below short MA lower band → WEAK_BULL (or BEAR below long MA lower band)
+            if price < ma_short * down:
+                state = REGIME_BEAR if price < ma_long * down else REGIME_WEAK_BULL
+        else:
+            # First classification (no hysteresis on initial state)
+            if price > ma_long:
+                state = REGIME_STRONG_BULL if price > ma_short else REGIME_WEAK_BULL
+            else:
+                state = REGIME_BEAR
+
+        self.regime_state = state
+
+    def _tqs(self, symbol: str) -> float:
+        """TQS from the rolling window (same formula as NickRadgeCryptoHybrid.calculate_tqs)"""
+        period = self.strategy.ma_period
+        if self.bar_counts[symbol] < period:
+            return 0.0
+
+        window = self.windows[symbol]
+        current = window[-1]
+        roc = (current - window[0]) / window[0]
+
+        ma = self._window_mean(window, period)
+        above_ma = 1.0 if current > ma else 0.0
+
+        return roc * (1.0 + above_ma)
+
+    def _allocations(self) -> Dict[str, float]:
+        """Target allocations for the current bar (rules of generate_allocations)"""
+        strategy = self.strategy
+
+        # BEAR regime: Go to cash (or bear asset)
+        if self.regime == REGIME_BEAR:
+            return {symbol: 0.0 for symbol in self.symbols}
+
+        # Select satellites (sorted like select_satellites, ties in symbol order)
+        tqs_scores = {symbol: self._tqs(symbol) for symbol in self.symbols if symbol not in strategy.core_assets}
+        sorted_assets = sorted(tqs_scores.items(), key=lambda x: x[1], reverse=True)
+        satellites = [asset for asset, score in sorted_assets[:strategy.satellite_size]]
+
+        allocations = {}
+        core_allocation_per_asset = strategy.core_allocation / len(strategy.core_assets)
+        for symbol in strategy.core_assets:
+            allocations[symbol] = core_allocation_per_asset
+
+        if satellites:
+            satellite_allocation_per_asset = strategy.satellite_allocation / len(satellites)
+            for symbol in satellites:
+                allocations[symbol] = satellite_allocation_per_asset
+
+        for symbol in self.symbols:
+            if symbol not in allocations:
+                allocations[symbol] = 0.0
+
+        return allocations
+
+    def _settings(self) -> Dict:
+        """Parameters the saved windows and regime depend on"""
+        return {
+            'btc_symbol': self.btc_symbol,
+            'ma_period': self.strategy.ma_period,
+            'regime_ma_long': self.strategy.regime_ma_long,
+            'regime_ma_short': self.strategy.regime_ma_short,
+            'regime_hysteresis': self.regime_hysteresis
+        }
+
+    def state_dict(self) -> Dict:
+        """Serializable allocator state"""
+        return {
+            'settings': self._settings(),
+            'symbols': self.symbols,
+            'windows': {symbol: list(window) for symbol, window in self.windows.items()},
+            'bar_counts': self.bar_counts,
+            'btc_window': list(self.btc_window),
+            'btc_bars': self.btc_bars,
+            'regime_state': self.regime_state,
+            'last_timestamp': self.last_timestamp.isoformat() if self.last_timestamp is not None else None,
+            'allocations': self.allocations
+        }
+
+    def save_state(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Save allocator state to JSON
+
+        Args:
+            path: Output file (default: state_path)
+        """
+        path = Path(path or self.state_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state_dict(), f)
+        tmp_path.replace(path)
+
+    def load_state(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Restore allocator state from JSON
+
+        Args:
+            path: State file (default: state_path)
+
+        Raises:
+            ValueError: If the state was saved with other window/regime settings
+                        (the windows and regime would not match this allocator)
+        """
+        path = Path(path or self.state_path)
+        with open(path) as f:
+            state = json.load(f)
+
+        saved = state.get('settings', {})
+        current = self._settings()
+        mismatches = [f"{key}: saved {saved.get(key)!r}, current {value!r}"
+                      for key, value in current.items() if saved.get(key) != value]
+        if mismatches:
+            raise ValueError(f"Allocator state {path} does not match the current settings "
+                             f"({'; '.join(mismatches)}). Use matching settings or delete the file "
+                             f"to start fresh.")
+
+        self.symbols = state['symbols']
+        self.windows = {symbol: deque(values, maxlen=self.strategy.ma_period)
+                        for symbol, values in state['windows'].items()}
+        self.bar_counts = state['bar_counts']
+        self.btc_window = deque(state['btc_window'], maxlen=self.strategy.regime_ma_long)
+        self.btc_bars = state['btc_bars']
+        self.regime_state = state['regime_state']
+        self.last_timestamp = pd.Timestamp(state['last_timestamp']) if state['last_timestamp'] else None
+        self.allocations = state['allocations']
+
+
 def main():
     """Example usage"""
     print("Nick Radge Crypto Hybrid - Live Trading Version")
@@ -138,7 +138,9 @@ def main():
             'n_estimators': 100,
             'max_depth': 10,
             'min_samples_split': 50,
-            'retrain_freq': 'QS'  # Retrain quarterly
+            'retrain_freq': 'QS',  # Retrain quarterly
+            # Reuse engineered features across runs (requires pyarrow)
+            'feature_store': 'cache/features' if importlib.util.find_spec('pyarrow') else None
         },
         **common_params
     )
@@ -30,6 +30,10 @@ module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(module)
 NickRadgeEnhanced = module.NickRadgeEnhanced
 
+# Shared on-disk feature store: RF and XGBoost engineer identical features,
+# so the second ML run reads them from disk (requires pyarrow)
+FEATURE_STORE = 'cache/features' if importlib.util.find_spec('pyarrow') else None
+
 def download_data():
     """Download stock universe with volume data"""
     print("📥 Downloading data...")
@@ -108,7 +112,8 @@ def run_strategy(qualifier_type: str, prices: pd.DataFrame, spy_prices: pd.Serie
             'max_depth': 15,
             'min_samples_split': 30,
             'lookback_years': 3,
-            'retrain_freq': 'QS'
+            'retrain_freq': 'QS',
+            'feature_store': FEATURE_STORE
         }
     elif qualifier_type == 'ml_xgb':
         # XGBoost with optimized hyperparameters
@@ -122,7 +127,8 @@ def run_strategy(qualifier_type: str, prices: pd.DataFrame, spy_prices: pd.Serie
             'reg_alpha': 0.1,
             'reg_lambda': 1.0,
             'lookback_years': 3,
-            'retrain_freq': 'QS'
+            'retrain_freq': 'QS',
+            'feature_store': FEATURE_STORE
         }
     else:  # TQS
         qualifier_params = {
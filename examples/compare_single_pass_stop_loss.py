@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Compare Stop-Loss Backtests: Two-Pass vs Single-Pass Simulator
+==============================================================
+
+NickRadgeCryptoHybrid.backtest used to run a full portfolio to get an
+equity curve, rewrite allocations with apply_portfolio_stop_loss and
+apply_position_stop_loss, then run the portfolio again. It now calls
+simulate_with_stops, which decides both stops bar by bar on the equity it
+is producing.
+
+Reports, per portfolio stop level:
+1. Simulation time (two-pass vs single-pass)
+2. Self-consistency: from_orders on the single-pass final allocations
+   reproduces the single-pass portfolio exactly
+3. Stop triggers, total return and max drawdown of both approaches
+
+Uses synthetic daily prices with a market-wide crash so stops fire.
+"""
+
+import io
+import sys
+import time
+import importlib.util
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import vectorbt as vbt
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Import module with numeric prefix
+spec = importlib.util.spec_from_file_location(
+    "nick_radge_crypto_hybrid",
+    Path(__file__).parent.parent / "strategies" / "06_nick_radge_crypto_hybrid.py"
+)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+NickRadgeCryptoHybrid = module.NickRadgeCryptoHybrid
+
+INITIAL_CAPITAL = 100000
+FEES = 0.001
+SLIPPAGE = 0.0005
+
+
+def from_orders(prices: pd.DataFrame, allocations: pd.DataFrame) -> vbt.Portfolio:
+    return vbt.Portfolio.from_orders(
+        close=prices,
+        size=allocations,
+        size_type='targetpercent',
+        fees=FEES,
+        slippage=SLIPPAGE,
+        init_cash=INITIAL_CAPITAL,
+        cash_sharing=True,
+        group_by=True,
+        call_seq='auto',
+        freq='D'
+    )
+
+
+def two_pass(strategy: NickRadgeCryptoHybrid, prices: pd.DataFrame, allocations: pd.DataFrame) -> vbt.Portfolio:
+    """Previous backtest flow: estimate equity, rewrite allocations, re-run"""
+    initial_portfolio = from_orders(prices, allocations)
+    allocations = strategy.apply_portfolio_stop_loss(allocations, initial_portfolio.value(), INITIAL_CAPITAL)
+    allocations = strategy.apply_position_stop_loss(allocations, prices)
+    return from_orders(prices, allocations)
+
+
+print("="*80)
+print("STOP-LOSS BACKTEST - TWO-PASS vs SINGLE-PASS SIMULATOR")
+print("="*80)
+
+rng = np.random.default_rng(3)
+dates = pd.date_range('2020-01-01', periods=1800, freq='D')
+tickers = ['BTC-USD', 'ETH-USD', 'SOL-USD'] + [f'ALT{i:02d}' for i in range(12)] + ['PAXG-USD']
+
+returns = rng.normal(0.0005, 0.04, (len(dates), len(tickers)))
+returns[900:960, :-1] -= 0.02                   # market-wide crash
+returns[:, -1] = rng.normal(0, 0.005, len(dates))
+prices = pd.DataFrame(100 * np.exp(np.cumsum(returns, axis=0)), index=dates, columns=tickers)
+prices.iloc[:100, 10:14] = np.nan               # late listings
+
+# Weekly rebalance into every listed asset except the bear asset
+allocations = pd.DataFrame(np.nan, index=dates, columns=tickers)
+for i in range(0, len(dates), 7):
+    listed = prices.iloc[i].notna().values.copy()
+    listed[-1] = False
+    weights = np.zeros(len(tickers))
+    weights[listed] = rng.dirichlet(np.ones(listed.sum()))
+    allocations.iloc[i] = weights
+
+# Warm up numba/vectorbt so timings compare simulations, not compilation
+with redirect_stdout(io.StringIO()):
+    NickRadgeCryptoHybrid(portfolio_stop_loss=0.3).simulate_with_stops(prices, allocations, INITIAL_CAPITAL, FEES, SLIPPAGE)
+    from_orders(prices, allocations)
+
+for stop_level in [0.2, 0.3, 0.4]:
+    strategy = NickRadgeCryptoHybrid(portfolio_stop_loss=stop_level, position_stop_loss=0.4)
+
+    two_pass_log = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(two_pass_log):
+        legacy = two_pass(strategy, prices, allocations)
+    two_pass_time = time.perf_counter() - start
+
+    single_pass_log = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(single_pass_log):
+        portfolio, final_allocations = strategy.simulate_with_stops(prices, allocations, INITIAL_CAPITAL,
+                                                                    FEES, SLIPPAGE)
+    single_pass_time = time.perf_counter() - start
+
+    replay = from_orders(prices, final_allocations)
+    consistent = np.array_equal(replay.value().values, portfolio.value().values)
+
+    print(f"\n🛡️  Portfolio stop {stop_level:.0%} + position stop 40%")
+    print(f"   Time:             two-pass {two_pass_time:.3f}s, single-pass {single_pass_time:.3f}s "
+          f"({two_pass_time / single_pass_time:.0f}×)")
+    print(f"   Self-consistent:  {'✅ yes' if consistent else '❌ NO'} (from_orders on final allocations)")
+    print(f"   Stop triggers:    two-pass {two_pass_log.getvalue().count('STOP-LOSS TRIGGERED')}, "
+          f"single-pass {single_pass_log.getvalue().count('STOP-LOSS TRIGGERED')}")
+    print(f"   Total return:     two-pass {legacy.total_return():.2%}, single-pass {portfolio.total_return():.2%}")
+    print(f"   Max drawdown:     two-pass {legacy.max_drawdown():.2%}, single-pass {portfolio.max_drawdown():.2%}")
+
+print("\n" + "="*80)
+print("✅ Comparison complete")
+print("="*80)
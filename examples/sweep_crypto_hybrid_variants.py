@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Crypto Hybrid Parameter Sweep - Shared Layers vs Per-Variant Backtests
+======================================================================
+
+Scripts like test_portfolio_stop_loss.py or test_position_only_stops.py run
+NickRadgeCryptoHybrid.backtest end to end for every variant, recomputing
+cleaning, regime, qualifier scores and satellite rankings each time.
+NickRadgeCryptoHybrid.sweep computes each layer once per unique key and
+only re-runs what a variant changes, with simulations on a thread pool.
+
+Reports:
+1. Time for per-variant backtest() calls vs one sweep()
+2. How many times each layer was computed
+3. Whether every variant's total return / max drawdown matches backtest()
+
+Uses synthetic daily prices so it runs without downloading data.
+"""
+
+import io
+import sys
+import time
+import importlib.util
+from contextlib import redirect_stdout
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Import module with numeric prefix
+spec = importlib.util.spec_from_file_location(
+    "nick_radge_crypto_hybrid",
+    Path(__file__).parent.parent / "strategies" / "06_nick_radge_crypto_hybrid.py"
+)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+NickRadgeCryptoHybrid = module.NickRadgeCryptoHybrid
+
+INITIAL_CAPITAL = 100000
+
+print("="*80)
+print("CRYPTO HYBRID SWEEP - SHARED LAYERS vs PER-VARIANT BACKTESTS")
+print("="*80)
+
+rng = np.random.default_rng(21)
+dates = pd.date_range('2020-01-01', '2024-12-31', freq='D')
+tickers = ['BTC-USD', 'ETH-USD', 'SOL-USD'] + [f'ALT{i:02d}-USD' for i in range(30)] + ['PAXG-USD']
+
+returns = rng.normal(0.0008, 0.04, (len(dates), len(tickers)))
+returns[:, 0] += 0.004 * np.sin(np.arange(len(dates)) / 90)   # BTC regime swings
+returns[900:960, :-1] -= 0.015                                 # market-wide crash
+returns[:, -1] = rng.normal(0, 0.005, len(dates))
+prices = pd.DataFrame(100 * np.exp(np.cumsum(returns, axis=0)), index=dates, columns=tickers)
+prices.iloc[:250, 20:26] = np.nan                              # late listings
+btc_prices = prices['BTC-USD']
+
+grid = {
+    'portfolio_stop_loss': [None, 0.25, 0.35],
+    'position_stop_loss': [None, 0.3, 0.4],
+    'satellite_size': [5, 7],
+}
+variants = [dict(zip(grid, values)) for values in product(*grid.values())]
+strategy = NickRadgeCryptoHybrid()
+
+# Per-variant backtests (previous workflow)
+expected = []
+start = time.perf_counter()
+for variant in variants:
+    with redirect_stdout(io.StringIO()):
+        portfolio = NickRadgeCryptoHybrid(**variant).backtest(prices.copy(), btc_prices, INITIAL_CAPITAL)
+    expected.append((float(portfolio.total_return()), float(portfolio.max_drawdown())))
+backtest_time = time.perf_counter() - start
+
+# One sweep
+start = time.perf_counter()
+results = strategy.sweep(prices, btc_prices, grid, initial_capital=INITIAL_CAPITAL)
+sweep_time = time.perf_counter() - start
+
+expected = np.array(expected)
+matches = (np.allclose(results['total_return'].values, expected[:, 0], rtol=1e-12, atol=0) and
+           np.allclose(results['max_drawdown'].values, expected[:, 1], rtol=1e-12, atol=0))
+
+print(f"\n{results[list(grid) + ['total_return', 'max_drawdown', 'sharpe_ratio']].to_string(index=False)}")
+print(f"\n   Per-variant backtests: {backtest_time:.2f}s ({len(variants)} variants)")
+print(f"   Sweep:                 {sweep_time:.2f}s")
+print(f"   Speedup:               {backtest_time / sweep_time:.1f}×")
+print(f"\n{'✅ Sweep matches backtest() for every variant' if matches else '❌ Sweep differs from backtest()'}")
+print("="*80)
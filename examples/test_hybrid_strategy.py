@@ -161,7 +161,8 @@ def main():
             'lookback_years': 3,
             'retrain_freq': 'QS'
         },
-        sector_prices=sector_prices
+        sector_prices=sector_prices,
+        parallel=True  # XGBoost in a worker process while TQS runs (script has a __main__ guard)
     )
 
     strategy_hybrid = NickRadgeEnhanced(
@@ -219,7 +220,8 @@ def main():
                 'lookback_years': 3,
                 'retrain_freq': 'QS'
             },
-            sector_prices=sector_prices
+            sector_prices=sector_prices,
+            parallel=True
         )
 
         strategy_alt = NickRadgeEnhanced(
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Verify Event-Row NickRadgeEnhanced Allocations
+==============================================
+
+NickRadgeEnhanced.generate_allocations computes target weights only on
+rebalance and regime-recovery rows and forward-fills the holding periods,
+ranking all event rows at once with rank_stocks_batch. The original
+day-by-day .loc implementation is kept as _generate_allocations_loop. This
+script checks both produce identical allocation matrices and identical
+printed output for several configurations, checks rank_stocks_batch
+against per-date rank_stocks on every trading day, and reports the speedups.
+
+Uses synthetic daily prices (SPY bear phases, late listings, a bear asset)
+so it runs without downloading data.
+"""
+
+import io
+import sys
+import time
+import importlib.util
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Import module with numeric prefix
+spec = importlib.util.spec_from_file_location(
+    "nick_radge_bss",
+    Path(__file__).parent.parent / "strategies" / "02_nick_radge_bss.py"
+)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+NickRadgeEnhanced = module.NickRadgeEnhanced
+
+
+def synthetic_prices(n_stocks: int, years: int, seed: int):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2005-01-03', periods=252 * years)
+    tickers = [f'STK{i:03d}' for i in range(n_stocks)] + ['GLD']
+
+    market = rng.normal(0.0003, 0.01, len(dates)) + 0.002 * np.sin(np.arange(len(dates)) / 120)
+    returns = market[:, None] + rng.normal(0, 0.015, (len(dates), len(tickers)))
+    returns[:, -1] = rng.normal(0.0002, 0.008, len(dates))
+    prices = pd.DataFrame(100 * np.exp(np.cumsum(returns, axis=0)), index=dates, columns=tickers)
+    prices.iloc[:400, n_stocks // 2:n_stocks // 2 + 5] = np.nan     # late listings
+
+    spy_prices = pd.Series(100 * np.exp(np.cumsum(market)), index=dates, name='SPY')
+    return prices, spy_prices
+
+
+def run(strategy, method, prices, spy_prices, enable_regime_recovery=True):
+    benchmark_scores = None
+    if strategy.use_relative_strength:
+        benchmark_scores = strategy.qualifier.calculate(spy_prices.to_frame(name='SPY'))['SPY'].shift(1)
+
+    log = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(log):
+        allocations = method(prices, spy_prices, benchmark_scores, enable_regime_recovery)
+    return allocations, log.getvalue(), time.perf_counter() - start
+
+
+print("="*80)
+print("NICK RADGE ENHANCED ALLOCATIONS - EVENT ROWS vs DAY-BY-DAY LOOP")
+print("="*80)
+
+prices, spy_prices = synthetic_prices(n_stocks=30, years=8, seed=3)
+configs = {
+    'roc + GLD': ({'bear_market_asset': 'GLD'}, True),
+    'roc, cash in bear': ({}, True),
+    'no recovery': ({'bear_market_asset': 'GLD'}, False),
+    'equal weight': ({'use_momentum_weighting': False, 'bear_market_asset': 'GLD'}, True),
+    'no regime filter': ({'use_regime_filter': False}, True),
+    'monthly, no RS': ({'rebalance_freq': 'MS', 'use_relative_strength': False,
+                        'bear_market_asset': 'GLD', 'bear_positions': 2}, True),
+    'tqs': ({'qualifier_type': 'tqs', 'bear_market_asset': 'GLD'}, True),
+}
+
+mismatches = 0
+for name, (params, recovery) in configs.items():
+    strategy = NickRadgeEnhanced(**params)
+    expected, expected_log, _ = run(strategy, strategy._generate_allocations_loop, prices, spy_prices, recovery)
+    actual, actual_log, _ = run(strategy, strategy.generate_allocations, prices, spy_prices, recovery)
+
+    same_frame = expected.equals(actual)
+    same_log = expected_log == actual_log
+    status = '✅' if same_frame and same_log else '❌'
+    print(f"   {status} {name:18}  frame {'identical' if same_frame else 'DIFFERS'}, "
+          f"log {'identical' if same_log else 'DIFFERS'}, {expected_log.count('Regime recovery on')} recoveries")
+    mismatches += not (same_frame and same_log)
+
+# Batch ranking vs per-date rank_stocks on every trading day
+prices, spy_prices = synthetic_prices(n_stocks=60, years=6, seed=4)
+for i in range(3, 27):
+    prices[f'STK{i:03d}'] = prices[f'STK{i % 3:03d}']    # interleaved exact score ties (> 16 candidates)
+for name, params in {'roc + RS + GLD': {'bear_market_asset': 'GLD'},
+                     'no RS': {'use_relative_strength': False}}.items():
+    strategy = NickRadgeEnhanced(**params)
+    with redirect_stdout(io.StringIO()):
+        indicators = strategy.calculate_indicators(prices)
+    benchmark_scores = strategy.qualifier.calculate(spy_prices.to_frame(name='SPY'))['SPY'].shift(1)
+    benchmark_scores = benchmark_scores.iloc[::2]      # some dates without a benchmark score
+
+    start = time.perf_counter()
+    expected = [strategy.rank_stocks(prices, indicators, date, benchmark_scores) for date in prices.index]
+    per_date_time = time.perf_counter() - start
+    start = time.perf_counter()
+    tickers, scores = strategy.rank_stocks_batch(indicators, prices.index, benchmark_scores)
+    batch_time = time.perf_counter() - start
+
+    same = all(
+        list(ranked.get('ticker', [])) == list(tickers.iloc[i].dropna()) and
+        np.array_equal(ranked.get('score', pd.Series(dtype=float)).values, scores.iloc[i].dropna().values)
+        for i, ranked in enumerate(expected)
+    )
+    mismatches += not same
+    print(f"   {'✅' if same else '❌'} rank_stocks_batch, {name:15} {'identical' if same else 'DIFFERS'} on "
+          f"{len(prices)} dates  (per-date {per_date_time:.2f}s, batch {batch_time:.3f}s)")
+
+# Timing: 100 stocks, 10 years
+prices, spy_prices = synthetic_prices(n_stocks=100, years=10, seed=8)
+strategy = NickRadgeEnhanced(bear_market_asset='GLD')
+expected, _, loop_time = run(strategy, strategy._generate_allocations_loop, prices, spy_prices)
+actual, _, event_time = run(strategy, strategy.generate_allocations, prices, spy_prices)
+mismatches += not expected.equals(actual)
+
+print(f"\n   100 stocks x 10 years ({'identical' if expected.equals(actual) else 'DIFFERS'})")
+print(f"   Day-by-day loop: {loop_time:.2f}s")
+print(f"   Event rows:      {event_time:.2f}s")
+print(f"   Speedup:         {loop_time / event_time:.0f}×")
+print(f"\n{'✅ All allocations, rankings and logs identical' if mismatches == 0 else f'❌ {mismatches} mismatches'}")
+print("="*80)
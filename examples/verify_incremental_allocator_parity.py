@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Verify Incremental Live Allocator
+=================================
+
+deployment/crypto_hybrid/06_nick_radge_crypto_hybrid_live.py adds
+IncrementalHybridAllocator, which keeps rolling per-symbol windows and the
+current regime between bars instead of recomputing every MA and TQS over
+the full history on each generate_allocations call.
+
+Checks:
+1. The regime after each bar equals the backtest engine's hysteresis
+   regime (strategies/06, which lags one bar) on the next bar
+2. replay() gives the same allocations as generate_allocations on every
+   prefix of the history, given that regime
+3. Saving state mid-history and resuming from the JSON file gives the
+   same allocations as an uninterrupted replay
+
+Uses synthetic daily prices (late listings, regime swings) so it runs
+without exchange access.
+"""
+
+import sys
+import tempfile
+import time
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+root = Path(__file__).parent.parent
+live = load_module("nick_radge_crypto_hybrid_live",
+                   root / "deployment" / "crypto_hybrid" / "06_nick_radge_crypto_hybrid_live.py")
+backtest = load_module("nick_radge_crypto_hybrid", root / "strategies" / "06_nick_radge_crypto_hybrid.py")
+
+print("="*80)
+print("INCREMENTAL LIVE ALLOCATOR - REPLAY vs FULL RECOMPUTATION")
+print("="*80)
+
+rng = np.random.default_rng(13)
+dates = pd.date_range('2022-01-01', periods=700, freq='D')
+symbols = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT'] + [f'ALT{i:02d}/USDT' for i in range(17)]
+returns = rng.normal(0.0005, 0.035, (len(dates), len(symbols)))
+returns[:, 0] += 0.005 * np.sin(np.arange(len(dates)) / 60)   # BTC regime swings
+prices = pd.DataFrame(100 * np.exp(np.cumsum(returns, axis=0)), index=dates, columns=symbols)
+prices.iloc[:150, 15:] = np.nan                                 # late listings
+
+strategy = live.NickRadgeCryptoHybrid()
+failures = 0
+
+# Backtest engine regime (uses the previous bar's close and MAs, so its
+# value on bar t+1 is the live regime after bar t's close)
+engine = backtest.NickRadgeCryptoHybrid(regime_ma_long=strategy.regime_ma_long,
+                                        regime_ma_short=strategy.regime_ma_short,
+                                        regime_hysteresis=0.02)
+engine_regime = engine.calculate_regime(prices['BTC/USDT']).shift(-1).iloc[:-1]
+engine_regime = engine_regime.replace('UNKNOWN', 'STRONG_BULL')    # live warm-up default
+
+# 1. Regime after each bar matches the backtest engine
+allocator = live.IncrementalHybridAllocator(strategy, regime_hysteresis=0.02)
+regimes = []
+for timestamp, row in prices.iterrows():
+    allocator.update(timestamp, row.to_dict())
+    regimes.append(allocator.regime)
+
+same = (pd.Series(regimes[:-1], index=engine_regime.index) == engine_regime).all()
+failures += not same
+print(f"   {'✅' if same else '❌'} regime {'identical to' if same else 'DIFFERS from'} backtest engine "
+      f"({(engine_regime != engine_regime.shift()).sum() - 1} regime changes)")
+
+# 2. Allocations match a full recomputation on every prefix (with the engine regime)
+start = time.perf_counter()
+expected = [strategy.generate_allocations(prices.iloc[:i + 1], regime=engine_regime.iloc[i])
+            for i in range(len(engine_regime))]
+full_time = time.perf_counter() - start
+
+allocator = live.IncrementalHybridAllocator(strategy, regime_hysteresis=0.02)
+start = time.perf_counter()
+replayed = allocator.replay(prices)
+replay_time = time.perf_counter() - start
+
+expected = pd.DataFrame(expected, index=engine_regime.index).fillna(0.0)[replayed.columns]
+same = expected.equals(replayed.iloc[:-1])
+failures += not same
+print(f"   {'✅' if same else '❌'} allocations {'identical' if same else 'DIFFER'} on all {len(expected)} bars")
+print(f"      Full recomputation per bar: {full_time:.2f}s, incremental: {replay_time:.2f}s "
+      f"({full_time / replay_time:.0f}×)")
+
+# 3. Resume from persisted state
+with tempfile.TemporaryDirectory() as tmp:
+    state_path = Path(tmp) / 'allocator_state.json'
+    uninterrupted = live.IncrementalHybridAllocator(strategy).replay(prices)
+
+    live.IncrementalHybridAllocator(strategy, state_path=state_path).replay(prices.iloc[:400])
+    resumed = live.IncrementalHybridAllocator(strategy, state_path=state_path).replay(prices)
+
+    same = uninterrupted.iloc[400:].equals(resumed[uninterrupted.columns])
+    failures += not same
+    print(f"   {'✅' if same else '❌'} resume from JSON state: allocations {'identical' if same else 'DIFFER'} "
+          f"({len(resumed)} new bars processed)")
+
+print(f"\n{'✅ All checks passed' if failures == 0 else f'❌ {failures} checks failed'}")
+print("="*80)
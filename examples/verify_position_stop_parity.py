@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Verify Array-State Position Stop-Loss
+=====================================
+
+NickRadgeCryptoHybrid.apply_position_stop_loss keeps entry prices, stopped
+flags and re-entry resets as arrays and advances them one date at a time
+over all tickers. The original dates x tickers loop is kept as
+_apply_position_stop_loss_loop. This script checks both produce identical
+allocation matrices and identical stop logs (same stops, same order) for
+several stop levels, with and without core-only mode, and reports the
+speedup.
+
+Uses synthetic daily prices (crashes, NaN gaps, zero prices, tickers
+missing from the price matrix) so it runs without downloading data.
+"""
+
+import io
+import sys
+import time
+import importlib.util
+from contextlib import redirect_stdout
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Import module with numeric prefix
+spec = importlib.util.spec_from_file_location(
+    "nick_radge_crypto_hybrid",
+    Path(__file__).parent.parent / "strategies" / "06_nick_radge_crypto_hybrid.py"
+)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+NickRadgeCryptoHybrid = module.NickRadgeCryptoHybrid
+
+print("="*80)
+print("POSITION STOP-LOSS - ARRAY STATE vs PER-CELL LOOP")
+print("="*80)
+
+rng = np.random.default_rng(11)
+dates = pd.date_range('2020-01-01', '2024-12-31', freq='D')
+tickers = ['BTC-USD', 'ETH-USD', 'SOL-USD'] + [f'ALT{i:02d}' for i in range(17)]
+
+prices = pd.DataFrame(100 * np.exp(np.cumsum(rng.normal(0, 0.04, (len(dates), len(tickers))), axis=0)),
+                      index=dates, columns=tickers)
+prices.iloc[:150, 10:] = np.nan                 # late listings
+prices.iloc[400:420, 4] = np.nan                # exchange downtime
+prices.iloc[::97, 6] = 0.0                      # corrupt prints
+prices = prices.drop(columns=['ALT16'])         # allocated but never priced
+
+# Rebalance every 7 days; hold days are NaN, dropped tickers are 0
+allocations = pd.DataFrame(np.nan, index=dates, columns=tickers)
+for date in dates[::7]:
+    weights = rng.choice([0.0, 0.05, 0.1, 0.2], size=len(tickers), p=[0.4, 0.2, 0.2, 0.2])
+    allocations.loc[date] = weights
+allocations.iloc[::3, :3] = 0.3                 # frequent core entries/re-entries
+
+mismatches = 0
+loop_time = 0.0
+array_time = 0.0
+
+for stop_level, core_only in product([0.1, 0.25, 0.4], [False, True]):
+    strategy = NickRadgeCryptoHybrid(position_stop_loss=stop_level, position_stop_loss_core_only=core_only)
+
+    loop_log = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(loop_log):
+        expected = strategy._apply_position_stop_loss_loop(allocations, prices)
+    loop_time += time.perf_counter() - start
+
+    array_log = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(array_log):
+        actual = strategy.apply_position_stop_loss(allocations, prices)
+    array_time += time.perf_counter() - start
+
+    n_stops = loop_log.getvalue().count('🚨')
+    same_frame = expected.equals(actual)
+    same_log = loop_log.getvalue() == array_log.getvalue()
+    status = '✅' if same_frame and same_log else '❌'
+    print(f"   {status} stop={stop_level:.0%} core_only={core_only!s:5}  {n_stops:4d} stops  "
+          f"frame {'identical' if same_frame else 'DIFFERS'}, log {'identical' if same_log else 'DIFFERS'}")
+    mismatches += not (same_frame and same_log)
+
+print(f"\n   Per-cell loop: {loop_time:.2f}s")
+print(f"   Array state:   {array_time:.2f}s")
+print(f"   Speedup:       {loop_time / array_time:.0f}×")
+print(f"\n{'✅ All allocations and stop logs identical' if mismatches == 0 else f'❌ {mismatches} mismatches'}")
+print("="*80)
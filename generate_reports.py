@@ -16,6 +16,8 @@ warnings.filterwarnings('ignore')
 
 from strategy_factory.generator import StrategyGenerator
 from strategy_factory.analyzer import StrategyAnalyzer
+from strategy_factory.results_store import SweepResultsStore
+from pathlib import Path
 import ast
 
 print("=" * 80)
@@ -44,10 +46,29 @@ print(f"   Period: {df.index[0]} to {df.index[-1]}")
 # ==========================================
 print("\n🏆 Step 2: Loading best strategy...")
 
-results = pd.read_csv('results/top_50_strategies.csv')
+generator = StrategyGenerator(initial_capital=10000, commission=0.001)
+
+# Prefer the sweep results store (top-K query, no full table load), fall back to the CSV.
+# Only results swept on this data with these costs are ranked.
+results = None
+if Path('results/sweeps.db').exists():
+    store = SweepResultsStore('results/sweeps.db')
+    context = generator.results_context(df)
+    results = store.top_k(50, metric='sharpe_ratio', context=context)
+    if len(results) > 0:
+        print(f"   Loaded top {len(results)} of {store.count(context=context):,} stored strategies "
+              f"for this data from results/sweeps.db")
+    else:
+        print("   ⚠️  No stored strategies for this data in results/sweeps.db, using the CSV")
+        results = None
+
+if results is None:
+    results = pd.read_csv('results/top_50_strategies.csv')
+    results['params'] = results['params'].apply(ast.literal_eval)
+
 best_strategy = results.iloc[0]
 
-params = ast.literal_eval(best_strategy['params'])
+params = best_strategy['params']
 print(f"\nBest Strategy: {params['type']}")
 print(f"  Parameters: {params}")
 print(f"  Sharpe Ratio: {best_strategy['sharpe_ratio']:.2f}")
@@ -59,8 +80,6 @@ print(f"  Win Rate: {best_strategy['win_rate']*100:.1f}%")
 # ==========================================
 print("\n🔄 Step 3: Running backtest...")
 
-generator = StrategyGenerator(initial_capital=10000, commission=0.001)
-
 # Re-run the best strategy to get portfolio object
 if params['type'] == 'Breakout':
     import vectorbt as vbt
@@ -155,7 +174,7 @@ print("\n🏅 Step 5: Comparing top 5 strategies...")
 strategies_returns = {}
 
 for idx, row in results.head(5).iterrows():
-    params = ast.literal_eval(row['params'])
+    params = row['params']
 
     if params['type'] == 'Breakout':
         lookback = params['lookback']
@@ -46,7 +46,9 @@ print(f"   Period: {df.index[0]} to {df.index[-1]}")
 # ==========================================
 print("\n🔄 Step 2: Generating strategies...")
 
-generator = StrategyGenerator(initial_capital=10000, commission=0.001)
+# Results are checkpointed to results/sweeps.db (a re-run skips finished combinations)
+generator = StrategyGenerator(initial_capital=10000, commission=0.001,
+                              results_store='results/sweeps.db')
 
 # Generate SMA strategies
 print("\n  Testing SMA crossovers...")
@@ -205,6 +207,7 @@ if opt_result is not None and 'wf_results' in locals():
     optimized.to_csv('results/optimized_strategy.csv', index=False)
 
 print("✅ Results saved:")
+print("   - results/sweeps.db (all generated strategies)")
 print("   - results/top_50_strategies.csv")
 print("   - results/filtered_strategies.csv")
 print("   - results/walk_forward_results.csv")
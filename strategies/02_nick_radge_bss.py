@@ -24,7 +24,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import pandas as pd
 import numpy as np
 import vectorbt as vbt
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from strategy_factory.performance_qualifiers import get_qualifier
 
@@ -237,6 +237,96 @@ class NickRadgeEnhanced:
             'score': ranked.values
         })
 
+    def rank_stocks_batch(self,
+                          indicators: Dict[str, pd.DataFrame],
+                          dates: pd.DatetimeIndex,
+                          benchmark_scores: Optional[pd.Series] = None,
+                          top_n: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Rank stocks for many dates at once (same filters as rank_stocks)
+
+        Above-MA, valid-score, bear-asset exclusion and relative-strength
+        filters are boolean matrices (dates x tickers) and one row-wise argsort
+        orders every date. Dates with exact score ties are re-sorted on their
+        own so ties keep rank_stocks' Series.sort_values(ascending=False) order.
+
+        Args:
+            indicators: Dictionary of indicator DataFrames
+            dates: Dates to rank stocks (must be in the indicator index)
+            benchmark_scores: SPY scores for relative strength filter
+            top_n: Number of ranks to return (default: all tickers)
+
+        Returns:
+            Tuple of (tickers, scores) DataFrames, rows = dates, columns = ranks
+            1..top_n; None / NaN where fewer stocks qualify
+        """
+        tickers = indicators['scores'].columns
+        scores = indicators['scores'].loc[dates].values.astype(float)
+
+        # Filter: Only stocks above MA and with valid scores
+        eligible = (indicators['above_ma'].loc[dates] == True).values & ~np.isnan(scores)
+
+        # Exclude bear market asset from stock ranking
+        if self.bear_market_asset:
+            eligible &= (tickers != self.bear_market_asset)[None, :]
+
+        # Relative strength filter: Only stocks outperforming SPY
+        if self.use_relative_strength and benchmark_scores is not None:
+            spy_scores = benchmark_scores.reindex(dates).values.astype(float)[:, None]
+            with np.errstate(invalid='ignore'):
+                eligible &= np.isnan(spy_scores) | (scores > spy_scores)
+
+        # Sort by score (descending), ineligible stocks last
+        order = np.argsort(np.where(eligible, -scores, np.inf), axis=1, kind='stable')
+
+        # Without ties any sort gives the same order; dates with tied scores
+        # reproduce the tie handling of Series.sort_values(ascending=False)
+        sorted_scores = np.take_along_axis(np.where(eligible, scores, np.nan), order, axis=1)
+        for row in np.flatnonzero((sorted_scores[:, 1:] == sorted_scores[:, :-1]).any(axis=1)):
+            candidates = np.flatnonzero(eligible[row])
+            values = scores[row, candidates]
+            order[row, :len(candidates)] = candidates[(len(values) - 1 - values[::-1].argsort(kind='quicksort'))[::-1]]
+
+        top_n = len(tickers) if top_n is None else min(top_n, len(tickers))
+        order = order[:, :top_n]
+        ranked = np.take_along_axis(eligible, order, axis=1)
+
+        ranks = pd.RangeIndex(1, top_n + 1, name='rank')
+        ranked_tickers = pd.DataFrame(np.where(ranked, np.asarray(tickers, dtype=object)[order], None),
+                                      index=dates, columns=ranks)
+        ranked_scores = pd.DataFrame(np.where(ranked, np.take_along_axis(scores, order, axis=1), np.nan),
+                                     index=dates, columns=ranks)
+        return ranked_tickers, ranked_scores
+
+    def _position_weights_batch(self, top_scores: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """
+        Position weights for many dates at once (momentum or equal weighting)
+
+        Args:
+            top_scores: Scores of the selected stocks in rank order (dates x ranks)
+            counts: Number of selected stocks per date (leading ranks)
+
+        Returns:
+            Weights (dates x ranks), 0 beyond each date's count
+        """
+        selected = np.arange(top_scores.shape[1])[None, :] < counts[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            equal = np.where(selected, 1.0 / counts[:, None], 0.0)
+
+        if not self.use_momentum_weighting:
+            return equal
+
+        # Weight by score (clip at 0 for safety); each date sums exactly its own count of scores
+        positive_scores = np.where(selected, np.maximum(top_scores, 0), 0.0)
+        total_score = np.zeros(len(counts))
+        for count in np.unique(counts[counts > 0]):
+            rows = counts == count
+            total_score[rows] = positive_scores[rows, :count].sum(axis=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            momentum = positive_scores / total_score[:, None]
+        return np.where((total_score > 0)[:, None], momentum, equal)
+
     def generate_allocations(self,
                            prices: pd.DataFrame,
                            spy_prices: Optional[pd.Series] = None,
@@ -259,6 +349,161 @@ class NickRadgeEnhanced:
 
         indicators = self.calculate_indicators(prices)
 
+        # Calculate market regime if enabled
+        regime = None
+        if self.use_regime_filter and spy_prices is not None:
+            print(f"   Calculating market regime...")
+            regime = self.calculate_regime(spy_prices)
+
+            # Show regime summary
+            regime_counts = regime.value_counts()
+            total_days = len(regime)
+            print(f"\n   Market Regime Summary:")
+            for reg, count in regime_counts.items():
+                pct = (count / total_days) * 100
+                print(f"   - {reg}: {count} days ({pct:.1f}%)")
+
+        # Determine rebalance dates
+        ideal_dates = pd.date_range(
+            start=prices.index[0],
+            end=prices.index[-1],
+            freq=self.rebalance_freq
+        )
+
+        # Find nearest trading day for each ideal date
+        all_rebalance_dates = []
+        for ideal_date in ideal_dates:
+            nearest_idx = prices.index.searchsorted(ideal_date)
+            if nearest_idx < len(prices.index):
+                nearest_date = prices.index[nearest_idx]
+                all_rebalance_dates.append(nearest_date)
+
+        all_rebalance_dates = pd.DatetimeIndex(all_rebalance_dates).unique()
+
+        # Skip early rebalances where we don't have enough data
+        min_date = prices.index[0] + pd.Timedelta(days=self.ma_period)
+        rebalance_dates = all_rebalance_dates[all_rebalance_dates >= min_date]
+
+        print(f"\n   Quarterly rebalances: {len(rebalance_dates)}")
+        if len(rebalance_dates) > 0:
+            print(f"   First rebalance: {rebalance_dates[0].date()}")
+            print(f"   Last rebalance: {rebalance_dates[-1].date()}")
+
+        # Regime per trading day (None where unavailable or filter disabled)
+        day_regime = np.full(len(prices.index), None, dtype=object)
+        if self.use_regime_filter and regime is not None:
+            in_regime = prices.index.isin(regime.index)
+            day_regime[in_regime] = regime.reindex(prices.index[in_regime]).values
+
+        # Days processed (from min_date on); the regime seen on the previous processed day
+        first_row = int(prices.index.searchsorted(min_date))
+        last_day_regime = np.concatenate([[None], day_regime[:-1]])
+        last_day_regime[:first_row + 1] = None
+
+        # Event rows: rebalances and possible regime recoveries (BEAR -> BULL).
+        # Positions only change on these rows; holding periods are forward-filled.
+        recovery_candidates = np.zeros(len(prices.index), dtype=bool)
+        if enable_regime_recovery:
+            recovery_candidates = ((last_day_regime == 'BEAR') &
+                                   ((day_regime == 'STRONG_BULL') | (day_regime == 'WEAK_BULL')))
+        rebalance_rows = prices.index.get_indexer(rebalance_dates)
+        event_rows = np.union1d(rebalance_rows, np.flatnonzero(recovery_candidates))
+        rebalance_set = set(rebalance_rows.tolist())
+
+        # Target weights on event rows (NaN = hold)
+        event_weights = np.full((len(prices.index), len(prices.columns)), np.nan)
+        bear_col = (prices.columns.get_loc(self.bear_market_asset)
+                    if self.bear_market_asset and self.bear_market_asset in prices.columns else None)
+
+        # Portfolio size on each event row depends only on its regime
+        # (no regime / filter disabled = portfolio_size, BEAR or UNKNOWN = bear_positions)
+        regime_sizes = {None: self.portfolio_size,
+                        'STRONG_BULL': self.strong_bull_positions,
+                        'WEAK_BULL': self.weak_bull_positions}
+        event_sizes = np.array([regime_sizes.get(reg, self.bear_positions) for reg in day_regime[event_rows]],
+                               dtype=np.int64)
+
+        # Rank stocks and weight the top N for every event row at once
+        ranked_tickers, ranked_scores = self.rank_stocks_batch(
+            indicators, prices.index[event_rows], benchmark_scores, top_n=int(event_sizes.max(initial=0))
+        )
+        ranked_cols = prices.columns.get_indexer(ranked_tickers.values.ravel()).reshape(ranked_tickers.shape)
+        top_counts = np.minimum((ranked_cols >= 0).sum(axis=1), event_sizes)
+        top_weights = self._position_weights_batch(ranked_scores.values, top_counts)
+        event_index = {row: k for k, row in enumerate(event_rows)}
+
+        # Track current allocations
+        current_weights = None
+        regime_recoveries = 0
+
+        for row in event_rows:
+            date = prices.index[row]
+
+            # Detect regime recovery (BEAR -> BULL)
+            # Check if we're in bear-only portfolio (holding only bear asset like GLD)
+            is_bear_only = False
+            if current_weights is not None and self.bear_market_asset:
+                is_bear_only = (
+                    set(current_weights.index) == {self.bear_market_asset} and
+                    current_weights.iloc[0] > 0
+                )
+
+            is_regime_recovery = False
+            if recovery_candidates[row] and (current_weights is None or is_bear_only):
+                is_regime_recovery = True
+                regime_recoveries += 1
+                print(f"   🔄 Regime recovery on {date.date()} - Re-entering positions early")
+
+            if not (row in rebalance_set or is_regime_recovery):
+                continue
+
+            # Portfolio size based on regime
+            k = event_index[row]
+            portfolio_size = event_sizes[k]
+
+            event_weights[row] = 0.0
+
+            # If bear market, go to cash OR bear market asset
+            if portfolio_size == 0:
+                if bear_col is not None:
+                    # Allocate to bear market asset
+                    event_weights[row, bear_col] = self.bear_allocation
+                    current_weights = pd.Series({self.bear_market_asset: self.bear_allocation})
+                else:
+                    # Go to cash
+                    current_weights = None
+            elif top_counts[k] > 0:
+                # Top N stocks by performance qualifier, momentum- or equal-weighted
+                count = top_counts[k]
+                current_weights = pd.Series(top_weights[k, :count], index=ranked_tickers.values[k, :count])
+                event_weights[row, ranked_cols[k, :count]] = top_weights[k, :count]
+            else:
+                current_weights = None
+
+        # Between rebalances - maintain current positions (no position before the first event)
+        allocations = pd.DataFrame(event_weights, index=prices.index, columns=prices.columns).ffill().fillna(0.0)
+
+        if regime_recoveries > 0:
+            print(f"   Total regime recoveries: {regime_recoveries}")
+
+        return allocations
+
+    def _generate_allocations_loop(self,
+                                   prices: pd.DataFrame,
+                                   spy_prices: Optional[pd.Series] = None,
+                                   benchmark_scores: Optional[pd.Series] = None,
+                                   enable_regime_recovery: bool = True) -> pd.DataFrame:
+        """
+        Reference day-by-day implementation of generate_allocations
+
+        Writes every column of every trading day with .loc. Kept to verify
+        the event-row version (examples/verify_bss_allocation_parity.py).
+        """
+        print(f"\n📊 Calculating indicators for {len(prices.columns)} stocks...")
+        print(f"   Using qualifier: {self.qualifier.name}")
+
+        indicators = self.calculate_indicators(prices)
+
         # Calculate market regime if enabled
         regime = None
         if self.use_regime_filter and spy_prices is not None:
@@ -32,14 +32,39 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import io
+import json
+import os
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from itertools import product
+
 import pandas as pd
 import numpy as np
 import vectorbt as vbt
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple, Union
 import warnings
 warnings.filterwarnings('ignore')
 
+from vectorbt.base.array_wrapper import ArrayWrapper
+
 from strategy_factory.performance_qualifiers import get_qualifier
+from strategy_factory.regime_engine import (
+    regime_kernel_nb, REGIME_LABELS, REGIME_BEAR, REGIME_STRONG_BULL
+)
+from strategy_factory.stop_loss_engine import (
+    simulate_with_stops_nb, STOP_TRIGGERED, STOP_REENTRY, STOP_HOLDING
+)
+from strategy_factory.metrics_kernel import portfolio_metrics
+
+# Constructor arguments per sweep() layer. A variant reuses every layer whose
+# key (its arguments plus the upstream layers' keys) it shares with another.
+CLEAN_PARAMS = ['core_assets', 'bear_asset']
+REGIME_PARAMS = ['regime_ma_long', 'regime_ma_short', 'regime_hysteresis']
+INDICATOR_PARAMS = ['qualifier_type', 'qualifier_params', 'ma_period']
+ALLOCATION_PARAMS = ['core_allocation', 'satellite_allocation', 'satellite_size', 'rebalance_freq',
+                     'use_momentum_weighting', 'weak_bull_satellite_reduction']
 
 
 class NickRadgeCryptoHybrid:
@@ -127,6 +152,8 @@ class NickRadgeCryptoHybrid:
         self.position_stop_loss = position_stop_loss
         self.position_stop_loss_core_only = position_stop_loss_core_only
 
+        self.qualifier_params = qualifier_params
+
         # Initialize qualifier for satellite selection
         params = qualifier_params or {}
         self.qualifier = get_qualifier(qualifier_type, **params)
@@ -153,31 +180,19 @@ class NickRadgeCryptoHybrid:
         Returns:
             Cleaned allocation matrix (NaN for invalid prices)
         """
-        aligned = allocations.copy()
-        cleared_count = 0
-
-        for date in aligned.index:
-            for ticker in aligned.columns:
-                alloc = aligned.at[date, ticker]
-
-                # Only check on rebalance days (non-NaN allocations)
-                if pd.notna(alloc) and alloc != 0:
-                    # Check if price is valid
-                    if ticker in prices.columns:
-                        try:
-                            price = prices.at[date, ticker]
-                            if pd.isna(price) or float(price) <= 0:
-                                # Clear allocation (can't trade at NaN/zero price)
-                                aligned.at[date, ticker] = np.nan
-                                cleared_count += 1
-                        except (ValueError, TypeError, KeyError):
-                            # Price access failed
-                            aligned.at[date, ticker] = np.nan
-                            cleared_count += 1
-                    else:
-                        # Ticker not in prices at all
-                        aligned.at[date, ticker] = np.nan
-                        cleared_count += 1
+        # Prices on the allocation grid: missing dates/tickers become NaN,
+        # non-numeric values are coerced to NaN
+        aligned_prices = prices.reindex(index=allocations.index, columns=allocations.columns)
+        aligned_prices = aligned_prices.apply(pd.to_numeric, errors='coerce')
+
+        # Only check on rebalance days (non-NaN, non-zero allocations)
+        has_allocation = allocations.notna() & (allocations != 0)
+        invalid_price = ~(aligned_prices > 0)
+        clear_mask = has_allocation & invalid_price
+
+        # Clear allocation (can't trade at NaN/zero price)
+        aligned = allocations.mask(clear_mask)
+        cleared_count = int(clear_mask.values.sum())
 
         if cleared_count > 0:
             print(f"   ⚠️  Bug 15 Fix: Cleared {cleared_count} allocations with invalid prices")
@@ -206,71 +221,56 @@ class NickRadgeCryptoHybrid:
         Returns:
             Series with regime classification
         """
-        # Lag MAs by 1 day to prevent look-ahead bias
-        ma_long = btc_prices.rolling(window=self.regime_ma_long).mean().shift(1)
-        ma_short = btc_prices.rolling(window=self.regime_ma_short).mean().shift(1)
-        prices_lagged = btc_prices.shift(1)
+        codes = self.calculate_regime_codes(btc_prices)
+        return pd.Series(REGIME_LABELS[codes.values], index=btc_prices.index)
 
-        # Apply hysteresis buffers
-        hyst = self.regime_hysteresis
-        ma_long_upper = ma_long * (1 + hyst)  # Need to exceed this to exit BEAR
-        ma_long_lower = ma_long * (1 - hyst)  # Fall below this to enter BEAR
-        ma_short_upper = ma_short * (1 + hyst)  # Need to exceed this to enter STRONG_BULL
-        ma_short_lower = ma_short * (1 - hyst)  # Fall below this to exit STRONG_BULL
+    def calculate_regime_codes(self, btc_prices: pd.Series) -> pd.Series:
+        """
+        Regime as integer codes (REGIME_BEAR, ...) - same state machine as calculate_regime
 
-        # Initialize with UNKNOWN
-        regime = pd.Series('UNKNOWN', index=btc_prices.index)
+        Args:
+            btc_prices: BTC-USD close prices
 
-        # Track previous regime for hysteresis logic
-        current_regime = 'UNKNOWN'
+        Returns:
+            Series of int8 regime codes (REGIME_LABELS[code] = regime name)
+        """
+        codes = self.calculate_regime_batch(
+            btc_prices, [(self.regime_ma_long, self.regime_ma_short, self.regime_hysteresis)]
+        )
+        return codes.iloc[:, 0].rename(None)
 
-        for i, date in enumerate(btc_prices.index):
-            price = prices_lagged.loc[date]
+    @staticmethod
+    def calculate_regime_batch(btc_prices: pd.Series,
+                               combinations: List[Tuple[int, int, float]]) -> pd.DataFrame:
+        """
+        Regime codes for many (ma_long, ma_short, hysteresis) combinations in one pass
 
-            if pd.isna(price) or pd.isna(ma_long.loc[date]) or pd.isna(ma_short.loc[date]):
-                regime.loc[date] = current_regime
-                continue
+        Each distinct MA window is computed once (lagged 1 bar to prevent
+        look-ahead bias) and the hysteresis state machine runs on arrays.
 
-            # State machine with hysteresis
-            if current_regime == 'BEAR':
-                # In BEAR: Need to exceed ma_long_upper to exit
-                if price > ma_long_upper.loc[date]:
-                    if price > ma_short_upper.loc[date]:
-                        current_regime = 'STRONG_BULL'
-                    else:
-                        current_regime = 'WEAK_BULL'
-                # Else stay BEAR
+        Args:
+            btc_prices: BTC-USD close prices
+            combinations: List of (regime_ma_long, regime_ma_short, regime_hysteresis)
 
-            elif current_regime == 'WEAK_BULL':
-                # In WEAK_BULL: Fall below ma_long_lower → BEAR, exceed ma_short_upper → STRONG_BULL
-                if price < ma_long_lower.loc[date]:
-                    current_regime = 'BEAR'
-                elif price > ma_short_upper.loc[date]:
-                    current_regime = 'STRONG_BULL'
-                # Else stay WEAK_BULL
+        Returns:
+            DataFrame of int8 regime codes (one column per combination,
+            columns = MultiIndex of ma_long, ma_short, hysteresis)
+        """
+        windows = {int(w) for ma_long, ma_short, _ in combinations for w in (ma_long, ma_short)}
+        lagged_ma = {w: btc_prices.rolling(window=w).mean().shift(1).values.astype(float) for w in windows}
+        prices_lagged = btc_prices.shift(1).values.astype(float)
 
-            elif current_regime == 'STRONG_BULL':
-                # In STRONG_BULL: Fall below ma_short_lower → WEAK_BULL
-                if price < ma_short_lower.loc[date]:
-                    if price < ma_long_lower.loc[date]:
-                        current_regime = 'BEAR'
-                    else:
-                        current_regime = 'WEAK_BULL'
-                # Else stay STRONG_BULL
-
-            else:  # UNKNOWN (initial state)
-                # First classification (no hysteresis on initial state)
-                if price > ma_long.loc[date]:
-                    if price > ma_short.loc[date]:
-                        current_regime = 'STRONG_BULL'
-                    else:
-                        current_regime = 'WEAK_BULL'
-                else:
-                    current_regime = 'BEAR'
+        ma_long = np.column_stack([lagged_ma[int(c[0])] for c in combinations])
+        ma_short = np.column_stack([lagged_ma[int(c[1])] for c in combinations])
+        hysteresis = np.array([float(c[2]) for c in combinations])
 
-            regime.loc[date] = current_regime
+        codes = regime_kernel_nb(prices_lagged, ma_long, ma_short, hysteresis)
 
-        return regime
+        columns = pd.MultiIndex.from_tuples(
+            [(int(c[0]), int(c[1]), float(c[2])) for c in combinations],
+            names=['ma_long', 'ma_short', 'hysteresis']
+        )
+        return pd.DataFrame(codes, index=btc_prices.index, columns=columns)
 
     def apply_portfolio_stop_loss(self,
                                    allocations: pd.DataFrame,
@@ -455,6 +455,87 @@ class NickRadgeCryptoHybrid:
         else:
             print(f"      Applied to: All positions")
 
+        modified_allocations = allocations.copy()
+        tickers = allocations.columns
+        dates = allocations.index
+
+        alloc = allocations.values.astype(float)
+        price = prices.reindex(index=dates, columns=tickers).values.astype(float)
+
+        # Tickers the stop applies to (must have prices; core only if configured)
+        eligible = tickers.isin(prices.columns)
+        if self.position_stop_loss_core_only:
+            eligible &= tickers.isin(self.core_assets)
+
+        with np.errstate(invalid='ignore'):
+            has_alloc = ~np.isnan(alloc) & (alloc != 0)
+            active = has_alloc & ~np.isnan(price) & (price > 0) & eligible
+
+        # Position was out on the previous date (re-entry resets the entry price)
+        was_out = np.zeros_like(has_alloc)
+        was_out[1:] = ~has_alloc[:-1]
+
+        # Per-ticker state, advanced one date at a time over all tickers
+        entry_price = np.full(len(tickers), np.nan)  # Entry price for each position
+        tracked = np.zeros(len(tickers), dtype=bool)
+        stopped = np.zeros(len(tickers), dtype=bool)  # Which positions hit stop-loss
+        total_stops = 0
+
+        for i in np.flatnonzero(active.any(axis=1)):
+            row_active = active[i]
+            row_price = price[i]
+
+            # Track entry price (when position first appears)
+            first_seen = row_active & ~tracked
+            entry_price[first_seen] = row_price[first_seen]
+            stopped[first_seen] = False
+            tracked |= first_seen
+
+            # Check if position hit stop-loss
+            with np.errstate(divide='ignore', invalid='ignore'):
+                position_dd = (row_price - entry_price) / entry_price
+            hit = row_active & ~stopped & (position_dd < -self.position_stop_loss)
+
+            for j in np.flatnonzero(hit):
+                # STOP-LOSS TRIGGERED for this position
+                total_stops += 1
+                print(f"   🚨 Position stop-loss: {tickers[j]} on {dates[i].date()}")
+                print(f"      Entry: ${entry_price[j]:.2f} → Current: ${row_price[j]:.2f} ({position_dd[j]*100:.1f}%)")
+
+                # Exit this position
+                modified_allocations.iat[i, j] = 0.0
+            stopped |= hit
+
+            # Reset entry if position was exited and is re-entering
+            reentry = row_active & was_out[i]
+            entry_price[reentry] = row_price[reentry]
+            stopped[reentry] = False
+
+        if total_stops > 0:
+            print(f"   📊 Position Stop-Loss Summary: {total_stops} positions stopped out")
+        else:
+            print(f"   ✅ No positions hit stop-loss")
+
+        return modified_allocations
+
+    def _apply_position_stop_loss_loop(self,
+                                        allocations: pd.DataFrame,
+                                        prices: pd.DataFrame) -> pd.DataFrame:
+        """
+        Reference per-cell implementation of apply_position_stop_loss
+
+        Walks dates x tickers with .at lookups. Kept to verify the array
+        version (examples/verify_position_stop_parity.py).
+        """
+        if self.position_stop_loss is None or self.position_stop_loss <= 0:
+            return allocations  # Disabled
+
+        print(f"\n   🎯 Position Stop-Loss: {self.position_stop_loss*100:.1f}%")
+        if self.position_stop_loss_core_only:
+            print(f"      Applied to: Core assets only")
+        else:
+            print(f"      Applied to: All positions")
+
         modified_allocations = allocations.copy()
         position_entry_prices = {}  # Track entry price for each position
         stopped_positions = {}  # Track which positions hit stop-loss
@@ -518,6 +599,142 @@ class NickRadgeCryptoHybrid:
 
         return modified_allocations
 
+    def simulate_with_stops(self,
+                            prices: pd.DataFrame,
+                            allocations: pd.DataFrame,
+                            initial_capital: float,
+                            fees: float = 0.001,
+                            slippage: float = 0.0005,
+                            verbose: bool = True) -> Tuple[vbt.Portfolio, pd.DataFrame]:
+        """
+        Single-pass backtest with portfolio and position stop-losses
+
+        Replaces the two-pass approach (full backtest → apply_portfolio_stop_loss
+        on its equity curve → full backtest again). Stops are decided bar by bar
+        on the equity the simulation itself is producing, so the drawdown that
+        triggers a stop (and the trough that allows re-entry) includes the
+        effect of earlier stops.
+
+        Same rules as apply_portfolio_stop_loss and apply_position_stop_loss,
+        evaluated on the mark-to-market value at each bar's close before
+        that bar's rebalance.
+
+        Args:
+            prices: Price matrix (cleaned)
+            allocations: Target allocation matrix (columns = prices.columns)
+            initial_capital: Starting capital
+            fees: Trading fees
+            slippage: Slippage
+            verbose: Print stop-loss triggers and summaries
+
+        Returns:
+            Tuple of (vectorbt Portfolio, allocations with stops applied)
+        """
+        portfolio_stop = self.portfolio_stop_loss if self.portfolio_stop_loss and self.portfolio_stop_loss > 0 else np.nan
+        position_stop = self.position_stop_loss if self.position_stop_loss and self.position_stop_loss > 0 else np.nan
+
+        position_eligible = np.ones(len(prices.columns), dtype=bool)
+        if self.position_stop_loss_core_only:
+            position_eligible = prices.columns.isin(self.core_assets)
+
+        bear_col = prices.columns.get_loc(self.bear_asset) if self.bear_asset in prices.columns else -1
+
+        (order_records, log_records, target, equity, running_peak, trough,
+         stop_state, position_hit, position_hit_entry) = simulate_with_stops_nb(
+            np.ascontiguousarray(prices.values, dtype=np.float64),
+            np.ascontiguousarray(allocations.values, dtype=np.float64),
+            prices.index.values.astype('M8[ns]').view('i8'),
+            float(initial_capital),
+            float(fees),
+            float(slippage),
+            float(vbt.settings.portfolio['min_size']),
+            bear_col,
+            float(portfolio_stop),
+            float(self.stop_loss_min_cooldown_days),
+            float(self.stop_loss_reentry_threshold),
+            float(position_stop),
+            position_eligible
+        )
+
+        if verbose and not np.isnan(portfolio_stop):
+            self._print_portfolio_stop_events(prices.index, equity, running_peak, trough, stop_state)
+        if verbose and not np.isnan(position_stop):
+            self._print_position_stop_events(prices, position_hit, position_hit_entry)
+
+        wrapper = ArrayWrapper.from_obj(prices, freq='D', group_by=True)
+        portfolio = vbt.Portfolio(
+            wrapper,
+            prices,
+            order_records,
+            log_records,
+            np.array([float(initial_capital)]),
+            True
+        )
+        return portfolio, pd.DataFrame(target, index=allocations.index, columns=allocations.columns)
+
+    def _print_portfolio_stop_events(self,
+                                     dates: pd.DatetimeIndex,
+                                     equity: np.ndarray,
+                                     running_peak: np.ndarray,
+                                     trough: np.ndarray,
+                                     stop_state: np.ndarray) -> None:
+        """Print portfolio stop-loss triggers/re-entries from the single-pass simulator"""
+        print(f"\n   🛡️  Portfolio Stop-Loss: {self.portfolio_stop_loss*100:.1f}%")
+        print(f"      Re-entry: {self.stop_loss_min_cooldown_days} days + {self.stop_loss_reentry_threshold*100:.1f}% recovery")
+
+        trigger_date = None
+        for i in np.flatnonzero((stop_state == STOP_TRIGGERED) | (stop_state == STOP_REENTRY)):
+            date = dates[i]
+            current_value = equity[i]
+            current_dd = (current_value - running_peak[i]) / running_peak[i]
+
+            if stop_state[i] == STOP_TRIGGERED:
+                trigger_date = date
+                print(f"   🚨 STOP-LOSS TRIGGERED on {date.date()}: Drawdown {current_dd*100:.2f}%")
+                print(f"      Peak: ${running_peak[i]:,.0f} → Current: ${current_value:,.0f}")
+                print(f"      → Exiting all positions to {self.bear_asset}")
+                print(f"      → Waiting for: {self.stop_loss_min_cooldown_days}d + {self.stop_loss_reentry_threshold*100:.1f}% recovery")
+            else:
+                recovery_from_trough = (current_value - trough[i]) / trough[i]
+                print(f"   ✅ RE-ENTRY TRIGGERED on {date.date()} (after {(date - trigger_date).days} days):")
+                print(f"      Trough: ${trough[i]:,.0f} → Current: ${current_value:,.0f} (+{recovery_from_trough*100:.2f}%)")
+                print(f"      Drawdown from peak: {current_dd*100:.2f}%")
+                print(f"      → Resuming normal strategy signals")
+
+        trigger_count = int((stop_state == STOP_TRIGGERED).sum())
+        total_cooldown_days = int(((stop_state == STOP_HOLDING) | (stop_state == STOP_REENTRY)).sum())
+        if trigger_count > 0:
+            print(f"   📊 Stop-Loss Summary:")
+            print(f"      Triggered: {trigger_count} times")
+            print(f"      Avg cooldown: {total_cooldown_days / trigger_count:.1f} days (vs {self.stop_loss_min_cooldown_days}d minimum)")
+            print(f"      Total days in PAXG: {total_cooldown_days} ({total_cooldown_days/len(stop_state)*100:.1f}%)")
+        else:
+            print(f"   ✅ Stop-Loss never triggered (max DD < {self.portfolio_stop_loss*100:.1f}%)")
+
+    def _print_position_stop_events(self,
+                                    prices: pd.DataFrame,
+                                    position_hit: np.ndarray,
+                                    position_hit_entry: np.ndarray) -> None:
+        """Print position stop-loss exits from the single-pass simulator"""
+        print(f"\n   🎯 Position Stop-Loss: {self.position_stop_loss*100:.1f}%")
+        if self.position_stop_loss_core_only:
+            print(f"      Applied to: Core assets only")
+        else:
+            print(f"      Applied to: All positions")
+
+        hits = np.argwhere(position_hit)
+        for i, j in hits:
+            entry_price = position_hit_entry[i, j]
+            current_price = prices.iat[i, j]
+            position_dd = (current_price - entry_price) / entry_price
+            print(f"   🚨 Position stop-loss: {prices.columns[j]} on {prices.index[i].date()}")
+            print(f"      Entry: ${entry_price:.2f} → Current: ${current_price:.2f} ({position_dd*100:.1f}%)")
+
+        if len(hits) > 0:
+            print(f"   📊 Position Stop-Loss Summary: {len(hits)} positions stopped out")
+        else:
+            print(f"   ✅ No positions hit stop-loss")
+
     def calculate_indicators(self,
                            prices: pd.DataFrame,
                            btc_prices: Optional[pd.Series] = None) -> Dict[str, pd.DataFrame]:
@@ -618,9 +835,47 @@ class NickRadgeCryptoHybrid:
             'score': ranked.values
         })
 
+    def _satellite_selection_matrix(self,
+                                    indicators: Dict[str, pd.DataFrame],
+                                    dates: pd.DatetimeIndex,
+                                    universe_cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-N satellite selection for many dates at once (same picks as select_satellite)
+
+        Args:
+            indicators: Dictionary of indicators (satellite universe columns)
+            dates: Selection dates
+            universe_cols: Position in the price matrix of each satellite universe column
+
+        Returns:
+            Tuple of (column per rank, score per rank), each dates x satellite_size;
+            column -1 / score NaN where fewer alts qualify
+        """
+        width = max(self.satellite_size, 1)
+        selected_cols = np.full((len(dates), width), -1, dtype=np.int64)
+        selected_scores = np.full((len(dates), width), np.nan)
+
+        scores = indicators['scores'].loc[dates].values.astype(float)
+        eligible = (indicators['above_ma'].loc[dates] == True).values & ~np.isnan(scores)
+
+        for row in range(len(dates)):
+            candidates = np.flatnonzero(eligible[row])
+            values = scores[row, candidates]
+
+            # Descending order with the tie handling of Series.sort_values(ascending=False)
+            order = (len(values) - 1 - values[::-1].argsort(kind='quicksort'))[::-1]
+            top = order[:max(self.satellite_size, 0)]
+
+            selected_cols[row, :len(top)] = universe_cols[candidates[top]]
+            selected_scores[row, :len(top)] = values[top]
+
+        return selected_cols, selected_scores
+
     def generate_allocations(self,
                            prices: pd.DataFrame,
-                           btc_prices: Optional[pd.Series] = None) -> pd.DataFrame:
+                           btc_prices: Optional[pd.Series] = None,
+                           regime_codes: Optional[pd.Series] = None,
+                           indicators: Optional[Dict[str, pd.DataFrame]] = None) -> pd.DataFrame:
         """
         Generate hybrid portfolio allocations over time
 
@@ -636,6 +891,8 @@ class NickRadgeCryptoHybrid:
         Args:
             prices: DataFrame with crypto prices (columns = tickers)
             btc_prices: BTC prices for regime filter (required)
+            regime_codes: Precomputed calculate_regime_codes(btc_prices) (optional, used by sweep)
+            indicators: Precomputed calculate_indicators for the satellite universe (optional)
 
         Returns:
             DataFrame with target allocations (rows = dates, cols = tickers)
@@ -643,6 +900,218 @@ class NickRadgeCryptoHybrid:
         if btc_prices is None:
             raise ValueError("btc_prices required for regime filter")
 
+        # Calculate regime (integer codes; a change is measured on the regime's own index)
+        if regime_codes is None:
+            regime_codes = self.calculate_regime_codes(btc_prices)
+        regime = pd.Series(REGIME_LABELS[regime_codes.values], index=regime_codes.index)
+        codes = regime_codes.loc[prices.index].values
+        regime_changed = (regime_codes != regime_codes.shift(1)).loc[prices.index].values.copy()
+        regime_changed[:1] = False
+
+        # Calculate indicators for satellite selection
+        # Filter out core assets and bear asset from indicator calculation
+        satellite_universe = [c for c in prices.columns
+                             if c not in self.core_assets and c != self.bear_asset]
+        if indicators is None:
+            satellite_prices = prices[satellite_universe]
+            indicators = self.calculate_indicators(satellite_prices, btc_prices)
+
+        # Get rebalance dates (quarterly) and the nearest trading row on/after each
+        rebalance_dates = pd.date_range(
+            start=prices.index[0],
+            end=prices.index[-1],
+            freq=self.rebalance_freq
+        )
+        rebalance_rows = prices.index.searchsorted(rebalance_dates, side='left')
+        rebalance_rows = rebalance_rows[rebalance_rows < len(prices.index)]
+        actual_rebalance_dates = prices.index[rebalance_rows]
+
+        print(f"\n📊 Generating Hybrid Allocations...")
+        print(f"   Core: {len(self.core_assets)} assets ({self.core_allocation:.0%})")
+        print(f"   Satellite: {self.satellite_size} assets ({self.satellite_allocation:.0%})")
+        print(f"   Rebalances: {len(actual_rebalance_dates)}")
+
+        with np.errstate(invalid='ignore'):
+            valid_price = prices.apply(pd.to_numeric, errors='coerce').values.astype(float) > 0
+
+        available_core = [asset for asset in self.core_assets if asset in prices.columns]
+        core_cols = prices.columns.get_indexer(available_core)
+        bear_col = prices.columns.get_loc(self.bear_asset) if self.bear_asset in prices.columns else -1
+
+        # === FIX: Skip allocations if any required asset has NaN price ===
+        # Core assets are required in all non-BEAR regimes, the bear asset in
+        # BEAR, WEAK_BULL and UNKNOWN. Leading NaNs mean the asset didn't exist yet.
+        core_ok = valid_price[:, core_cols].all(axis=1)
+        bear_ok = valid_price[:, bear_col] if bear_col >= 0 else np.ones(len(prices.index), dtype=bool)
+        tradable = (((codes == REGIME_BEAR) | core_ok) &
+                    ((codes == REGIME_STRONG_BULL) | bear_ok))
+        tradable_rows = np.flatnonzero(tradable)
+
+        def first_tradable(rows: np.ndarray) -> np.ndarray:
+            """Row each pending event executes on (first tradable row at/after it)"""
+            positions = np.searchsorted(tradable_rows, rows, side='left')
+            return tradable_rows[positions[positions < len(tradable_rows)]]
+
+        # === FIX Bug 14: Pending rebalances execute on the first valid day ===
+        # Satellite re-selection: initial allocation + scheduled rebalances
+        # Allocation rows: re-selections + regime changes
+        selection_rows = np.unique(first_tradable(np.concatenate([[0], rebalance_rows])))
+        apply_rows = np.union1d(selection_rows, first_tradable(np.flatnonzero(regime_changed)))
+
+        # Satellite-selection matrix at the re-selection rows (prices column per rank, -1 = empty)
+        selected_cols, selected_scores = self._satellite_selection_matrix(
+            indicators, prices.index[selection_rows], prices.columns.get_indexer(satellite_universe)
+        )
+
+        # Broadcast weight templates per regime over the allocation rows
+        apply_codes = codes[apply_rows]
+        is_bear = apply_codes == REGIME_BEAR
+        reduced_satellite = self.satellite_allocation * self.weak_bull_satellite_reduction
+        paxg_allocation = self.satellite_allocation * (1 - self.weak_bull_satellite_reduction)
+
+        satellite_budget = np.where(apply_codes == REGIME_STRONG_BULL, self.satellite_allocation, reduced_satellite)
+        bear_weight = np.where(is_bear, 1.0, paxg_allocation)
+        core_weight = self.core_allocation / len(available_core) if available_core else 0
+
+        # Satellites held on each allocation row (latest selection at/before it)
+        source = np.searchsorted(selection_rows, apply_rows, side='right') - 1
+        sat_cols = selected_cols[source]
+        sat_scores = selected_scores[source]
+
+        # FIX: Only allocate to satellites with valid prices (not NaN), never in BEAR
+        holds = sat_cols >= 0
+        sat_valid = holds & valid_price[apply_rows[:, None], np.where(holds, sat_cols, 0)] & ~is_bear[:, None]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if self.use_momentum_weighting:
+                # Momentum-weighted (sequential sum in rank order, as the per-date loop)
+                total_score = np.cumsum(np.where(sat_valid, sat_scores, 0.0), axis=1)[:, -1]
+                sat_weights = (sat_scores / total_score[:, None]) * satellite_budget[:, None]
+                sat_valid &= (total_score > 0)[:, None]
+            else:
+                # Equal-weighted
+                sat_weights = np.broadcast_to(
+                    (satellite_budget / sat_valid.sum(axis=1))[:, None], sat_valid.shape
+                )
+
+        # Assemble the allocation matrix (0.0 = no allocation on this row)
+        weights = np.zeros((len(prices.index), len(prices.columns)))
+        weights[np.ix_(apply_rows[~is_bear], core_cols)] = core_weight
+
+        sat_rows, sat_ranks = np.nonzero(sat_valid)
+        weights[apply_rows[sat_rows], sat_cols[sat_rows, sat_ranks]] = sat_weights[sat_rows, sat_ranks]
+
+        bear_rows = apply_rows[apply_codes != REGIME_STRONG_BULL]
+        bear_weights = bear_weight[apply_codes != REGIME_STRONG_BULL]
+        if bear_col >= 0:
+            weights[bear_rows, bear_col] = bear_weights
+
+        allocations = pd.DataFrame(0.0, index=prices.index, columns=prices.columns)
+        allocations.iloc[:, :] = weights
+
+        if bear_col < 0 and len(bear_rows) > 0:
+            # Bear asset missing from prices: add its column (NaN where never set)
+            bear_column = np.full(len(prices.index), np.nan)
+            bear_column[bear_rows] = bear_weights
+            allocations[self.bear_asset] = bear_column
+
+        # === IMPROVEMENT 3: Allocation Edge Case Warnings ===
+        # === FIX: NO blanket normalization - maintain intended 70/30 split ===
+        # When satellites are missing, residual goes to CASH (not re-levered to core)
+        # This preserves the strategy's designed risk profile
+        row_sums = allocations.sum(axis=1)
+
+        # Check for zero allocation days (edge case warning)
+        zero_alloc_days = row_sums[row_sums == 0]
+        if len(zero_alloc_days) > 0:
+            pct_zero = len(zero_alloc_days) / len(row_sums) * 100
+            print(f"\n   ⚠️  WARNING: {len(zero_alloc_days)} days ({pct_zero:.1f}%) with ZERO allocations (100% cash)")
+            print(f"   This occurs when:")
+            print(f"   - No valid satellites found (all below MA)")
+            print(f"   - Bear asset missing AND in BEAR regime")
+            print(f"   - All allocations filtered out")
+            if pct_zero > 10:
+                print(f"   ⚠️  CRITICAL: >10% zero allocation days! Strategy may underperform!")
+
+        # Check for partial allocation days (< 100% = some cash held)
+        partial_alloc_days = row_sums[(row_sums > 0) & (row_sums < 1.0)]
+        if len(partial_alloc_days) > 0:
+            avg_alloc = partial_alloc_days.mean()
+            avg_cash = 1.0 - avg_alloc
+            pct_partial = len(partial_alloc_days) / len(row_sums) * 100
+            print(f"\n   ℹ️  INFO: {len(partial_alloc_days)} days ({pct_partial:.1f}%) with partial allocations")
+            print(f"      Average allocation: {avg_alloc*100:.1f}%, Average cash: {avg_cash*100:.1f}%")
+            print(f"      This is CORRECT - missing satellites stay in cash (maintains 70/30 design)")
+
+        # Check for over-allocation (should never happen, but good to catch)
+        over_alloc_days = row_sums[row_sums > 1.01]  # Allow small rounding errors
+        if len(over_alloc_days) > 0:
+            print(f"\n   ❌ ERROR: {len(over_alloc_days)} days with allocations > 100%!")
+            print(f"      Max allocation: {row_sums.max()*100:.2f}%")
+            print(f"      This is a bug - allocations should never exceed 100%")
+
+        # === NO NORMALIZATION ===
+        # Keep allocations as-is - VectorBT's targetpercent sizing handles cash automatically
+        # When row sum < 1.0, the remaining % stays in cash (correct behavior)
+
+        # === FIX Bug 13 & 14: Only rebalance on actual rebalance/regime-change days ===
+        # Fill non-rebalance days with NaN so VectorBT holds existing positions
+        # This prevents daily rebalancing that inflates returns
+        # Bug 14 fix ensures pending rebalances execute on first valid day (not lost)
+        print(f"\n📊 Applying Rebalance-Only Logic...")
+
+        # Find dates where allocations were actually set (non-zero rows)
+        # These are the days when we executed rebalances (including pending ones)
+        row_sums = allocations.sum(axis=1)
+        allocated = (row_sums > 0).values
+
+        # NaN for non-rebalance days; allocations kept on days where we actually allocated
+        # (This includes pending rebalances that executed on first valid day)
+        allocations_rebalance_only = allocations.where(np.broadcast_to(allocated[:, None], allocations.shape))
+
+        # === FIX Bug 15: Align allocations with valid prices ===
+        # Clear any allocations where price is NaN or ≤0
+        # This prevents VectorBT error: "order.price must be finite and greater than 0"
+        allocations_rebalance_only = self._align_allocations_with_prices(allocations_rebalance_only, prices)
+
+        # Count actual rebalance days
+        rebalance_day_count = int(allocated.sum())
+        pct_rebalance = rebalance_day_count / len(prices.index) * 100
+
+        # Calculate regime changes for logging
+        regime_changes_count = (regime != regime.shift(1)).sum()
+        hold_days = len(prices.index) - rebalance_day_count
+
+        print(f"   Rebalance triggers: {rebalance_day_count} days ({pct_rebalance:.1f}%)")
+        print(f"   - Scheduled quarterly: {len(actual_rebalance_dates)}")
+        print(f"   - Regime changes: ~{regime_changes_count} (some may be pending/deferred)")
+        print(f"   - Hold days (NaN): {hold_days} ({hold_days/len(prices.index)*100:.1f}%)")
+        print(f"   ✅ Core sleeve NEVER rebalances (only on regime change)")
+        print(f"   ✅ Satellite rebalances ONLY quarterly + regime change")
+        print(f"   ✅ Pending rebalances execute on first valid day (not lost)")
+
+        # Regime summary
+        regime_counts = regime.value_counts()
+        print(f"\n   Market Regime Summary:")
+        for reg, count in regime_counts.items():
+            pct = count / len(regime) * 100
+            print(f"   - {reg}: {count} days ({pct:.1f}%)")
+
+        return allocations_rebalance_only
+
+    def _generate_allocations_loop(self,
+                                   prices: pd.DataFrame,
+                                   btc_prices: Optional[pd.Series] = None) -> pd.DataFrame:
+        """
+        Reference per-date implementation of generate_allocations
+
+        Walks every date with a pending-rebalance state machine and fills
+        weights cell by cell. Kept to verify the vectorized version
+        (examples/verify_crypto_hybrid_allocation_parity.py).
+        """
+        if btc_prices is None:
+            raise ValueError("btc_prices required for regime filter")
+
         # Calculate regime
         regime = self.calculate_regime(btc_prices)
 
@@ -962,23 +1431,20 @@ class NickRadgeCryptoHybrid:
         Checks for:
         - Trades at NaN prices
         - Trades at ≤0 prices
-        - Price/size mismatches
+
+        Entry and exit bars are read from the trade record arrays and looked
+        up in the price matrix with fancy indexing (no per-trade loop).
 
         Returns:
             Dictionary with validation results
         """
         try:
-            trades = portfolio.trades.records_readable
-        except:
+            records = portfolio.trades.values
+        except Exception:
             # No trades executed
-            return {
-                'total_trades': 0,
-                'invalid_trades': [],
-                'invalid_count': 0,
-                'valid': True
-            }
+            records = None
 
-        if len(trades) == 0:
+        if records is None or len(records) == 0:
             return {
                 'total_trades': 0,
                 'invalid_trades': [],
@@ -986,59 +1452,30 @@ class NickRadgeCryptoHybrid:
                 'valid': True
             }
 
-        invalid_trades = []
-        total_trades = len(trades)
-
-        # Get column names dynamically (vectorbt may change them)
-        col_names = trades.columns.tolist()
-
-        # Find entry/exit columns (flexible naming)
-        entry_idx_col = next((c for c in col_names if 'entry' in c.lower() and 'idx' in c.lower()), None)
-        exit_idx_col = next((c for c in col_names if 'exit' in c.lower() and 'idx' in c.lower()), None)
-        col_col = next((c for c in col_names if c.lower() in ['column', 'col']), None)
-
-        if not all([entry_idx_col, exit_idx_col, col_col]):
-            # Can't validate - column names don't match expected format
-            return {
-                'total_trades': total_trades,
-                'invalid_trades': [],
-                'invalid_count': 0,
-                'valid': True,  # Assume valid if can't check
-                'warning': 'Could not validate - column names mismatch'
-            }
-
-        for idx, trade in trades.iterrows():
-            entry_idx = int(trade[entry_idx_col])
-            exit_idx = int(trade[exit_idx_col])
-            ticker = trade[col_col]
-
-            # Get actual dates from price index
-            if entry_idx < len(prices.index) and ticker in prices.columns:
-                entry_date = prices.index[entry_idx]
-                entry_price_actual = prices.at[entry_date, ticker]
-                if pd.isna(entry_price_actual) or entry_price_actual <= 0:
-                    invalid_trades.append({
-                        'trade_id': idx,
-                        'ticker': ticker,
-                        'date': entry_date,
-                        'type': 'ENTRY',
-                        'price': entry_price_actual,
-                        'issue': 'NaN or ≤0 price'
-                    })
-
-            # Check exit price
-            if exit_idx < len(prices.index) and ticker in prices.columns:
-                exit_date = prices.index[exit_idx]
-                exit_price_actual = prices.at[exit_date, ticker]
-                if pd.isna(exit_price_actual) or exit_price_actual <= 0:
-                    invalid_trades.append({
-                        'trade_id': idx,
-                        'ticker': ticker,
-                        'date': exit_date,
-                        'type': 'EXIT',
-                        'price': exit_price_actual,
-                        'issue': 'NaN or ≤0 price'
-                    })
+        total_trades = len(records)
+        tickers = portfolio.wrapper.columns[records['col']]
+        price_cols = prices.columns.get_indexer(tickers)
+        price_values = prices.values.astype(float)
+
+        # One (trade, ENTRY) and one (trade, EXIT) check per trade, in trade order
+        trade_ids = np.repeat(np.arange(total_trades), 2)
+        bars = np.column_stack([records['entry_idx'], records['exit_idx']]).ravel()
+        cols = np.repeat(price_cols, 2)
+
+        checkable = (bars < len(prices.index)) & (cols >= 0)
+        bar_prices = np.full(len(bars), np.nan)
+        bar_prices[checkable] = price_values[bars[checkable], cols[checkable]]
+
+        # NaN or ≤0 price
+        invalid = np.flatnonzero(checkable & ~(bar_prices > 0))
+        invalid_trades = [{
+            'trade_id': int(trade_ids[k]),
+            'ticker': tickers[trade_ids[k]],
+            'date': prices.index[bars[k]],
+            'type': 'ENTRY' if k % 2 == 0 else 'EXIT',
+            'price': float(bar_prices[k]),
+            'issue': 'NaN or ≤0 price'
+        } for k in invalid]
 
         return {
             'total_trades': total_trades,
@@ -1047,38 +1484,19 @@ class NickRadgeCryptoHybrid:
             'valid': len(invalid_trades) == 0
         }
 
-    def backtest(self,
-                prices: pd.DataFrame,
-                btc_prices: Optional[pd.Series] = None,
-                initial_capital: float = 100000,
-                fees: float = 0.001,
-                slippage: float = 0.0005,
-                log_trades: bool = False) -> vbt.Portfolio:
+    def prepare_prices(self, prices: pd.DataFrame) -> pd.DataFrame:
         """
-        Backtest hybrid strategy using vectorbt
+        Validate required assets and clean prices (forward-fill only, no look-ahead)
+
+        Downloads the bear asset if it is missing, fails fast when core or bear
+        assets are unusable, and drops empty or too sparse non-essential columns.
 
         Args:
-            prices: DataFrame with crypto prices
-            btc_prices: BTC prices for regime filter (required)
-            initial_capital: Starting capital
-            fees: Trading fees (0.001 = 0.1%, increased to 0.002 = 0.2% for realism)
-            slippage: Slippage (0.0005 = 0.05%, increased to 0.002 = 0.2% for realism)
-            log_trades: If True, print detailed trade log
+            prices: DataFrame with crypto prices (bear asset column may be added in place)
 
         Returns:
-            vectorbt Portfolio object
+            Cleaned price DataFrame
         """
-        print("="*80)
-        print(f"🚀 Backtesting {self.name}")
-        print("="*80)
-        print(f"\n📊 Strategy Configuration:")
-        print(f"   Core Assets: {', '.join(self.core_assets)} ({self.core_allocation:.0%})")
-        print(f"   Satellite Size: {self.satellite_size} alts ({self.satellite_allocation:.0%})")
-        print(f"   Qualifier: {self.qualifier_type.upper()}")
-        print(f"   Rebalance: {self.rebalance_freq}")
-        print(f"   Bear Asset: {self.bear_asset}")
-        print(f"   Initial Capital: ${initial_capital:,.0f}")
-
         # === IMPROVEMENT 1: Bear Asset Validation & Auto-Download ===
         if self.bear_asset not in prices.columns:
             print(f"\n⚠️  Bear asset {self.bear_asset} not in data, attempting auto-download...")
@@ -1127,10 +1545,10 @@ class NickRadgeCryptoHybrid:
         print(f"   Initial NaN values: {initial_nan_count}")
 
         # Step 1: Forward fill ONLY (no backfill!)
-        prices = prices.fillna(method='ffill')
+        prices = prices.ffill()
 
         # Step 2: Replace inf with NaN, then forward fill again
-        prices = prices.replace([np.inf, -np.inf], np.nan).fillna(method='ffill')
+        prices = prices.replace([np.inf, -np.inf], np.nan).ffill()
 
         # Step 3: Drop columns that are COMPLETELY empty after forward fill
         # (these have no data at all, cannot be used)
@@ -1188,76 +1606,80 @@ class NickRadgeCryptoHybrid:
         print(f"   ✅ No look-ahead bias (forward-fill only)")
         print(f"   ✅ No invalid prices (no zero-fill)")
 
-        # Generate allocations
-        allocations = self.generate_allocations(prices, btc_prices)
-
-        # Ensure allocations and prices have same columns
-        # Remove any allocations for tickers not in prices
-        allocations = allocations[prices.columns]
-
-        # === PORTFOLIO STOP-LOSS (Two-Pass Approach) ===
-        # Need to create initial portfolio to get values, then apply stop-loss
-        if self.portfolio_stop_loss is not None and self.portfolio_stop_loss > 0:
-            print(f"\n🛡️  Applying Portfolio Stop-Loss (Two-Pass Approach)...")
-
-            # PASS 1: Create initial portfolio to get equity curve
-            print(f"   Pass 1: Creating initial portfolio to calculate drawdowns...")
-            initial_portfolio = vbt.Portfolio.from_orders(
-                close=prices,
-                size=allocations,
-                size_type='targetpercent',
-                fees=fees,
-                slippage=slippage,
-                init_cash=initial_capital,
-                cash_sharing=True,
-                group_by=True,
-                call_seq='auto',
-                freq='D'
-            )
-
-            # Extract portfolio values
-            portfolio_values = initial_portfolio.value()
-            if isinstance(portfolio_values, pd.DataFrame):
-                portfolio_values = portfolio_values.iloc[:, 0]
-
-            print(f"   Pass 2: Applying portfolio stop-loss rules...")
-            # PASS 2: Apply portfolio stop-loss
-            allocations = self.apply_portfolio_stop_loss(
-                allocations,
-                portfolio_values,
-                initial_capital
-            )
+        return prices
 
-        # === POSITION STOP-LOSS (Applied AFTER portfolio stop-loss) ===
-        if self.position_stop_loss is not None and self.position_stop_loss > 0:
-            print(f"\n🎯 Applying Position Stop-Loss...")
-            allocations = self.apply_position_stop_loss(allocations, prices)
-
-        # Verify no NaN or Inf in either DataFrame
+    def _simulation_prices(self, prices: pd.DataFrame) -> pd.DataFrame:
+        """Cleaned prices with remaining gaps and zero prices forward-filled for simulation"""
         if prices.isna().any().any():
             print("\n⚠️  WARNING: NaN values still present in prices after cleaning")
             nan_summary = prices.isna().sum()
             print(f"   NaN counts: {nan_summary[nan_summary > 0]}")
             # Forward fill only, accept remaining NaNs (leading NaNs from partial histories)
-            prices = prices.fillna(method='ffill')
+            prices = prices.ffill()
             remaining = prices.isna().sum().sum()
             if remaining > 0:
                 print(f"   ℹ️  {remaining} NaN values remain (assets with partial history - won't trade until data exists)")
 
-        if allocations.isna().any().any():
-            print("\n⚠️  WARNING: NaN values in allocations (expected on hold days)")
-            print("   These NaNs represent days with no rebalance; positions will be held (no fill applied).")
-
         # Debug: Check for invalid values
         if (prices <= 0).any().any():
             zero_cols = prices.columns[(prices <= 0).any()].tolist()
             print(f"\n⚠️  WARNING: Zero or negative prices in: {zero_cols}")
             # Replace zeros with forward fill only (no backfill to avoid look-ahead bias)
-            prices = prices.replace(0, np.nan).fillna(method='ffill')
+            prices = prices.replace(0, np.nan).ffill()
             remaining_zeros = (prices <= 0).sum().sum()
             if remaining_zeros > 0:
                 print(f"   ℹ️  {remaining_zeros} zero/negative values remain (will not be traded)")
 
+        return prices
+
+    def backtest(self,
+                prices: pd.DataFrame,
+                btc_prices: Optional[pd.Series] = None,
+                initial_capital: float = 100000,
+                fees: float = 0.001,
+                slippage: float = 0.0005,
+                log_trades: bool = False) -> vbt.Portfolio:
+        """
+        Backtest hybrid strategy using vectorbt
+
+        Args:
+            prices: DataFrame with crypto prices
+            btc_prices: BTC prices for regime filter (required)
+            initial_capital: Starting capital
+            fees: Trading fees (0.001 = 0.1%, increased to 0.002 = 0.2% for realism)
+            slippage: Slippage (0.0005 = 0.05%, increased to 0.002 = 0.2% for realism)
+            log_trades: If True, print detailed trade log
+
+        Returns:
+            vectorbt Portfolio object
+        """
+        print("="*80)
+        print(f"🚀 Backtesting {self.name}")
+        print("="*80)
+        print(f"\n📊 Strategy Configuration:")
+        print(f"   Core Assets: {', '.join(self.core_assets)} ({self.core_allocation:.0%})")
+        print(f"   Satellite Size: {self.satellite_size} alts ({self.satellite_allocation:.0%})")
+        print(f"   Qualifier: {self.qualifier_type.upper()}")
+        print(f"   Rebalance: {self.rebalance_freq}")
+        print(f"   Bear Asset: {self.bear_asset}")
+        print(f"   Initial Capital: ${initial_capital:,.0f}")
+
+        prices = self.prepare_prices(prices)
+
+        # Generate allocations
+        allocations = self.generate_allocations(prices, btc_prices)
+
+        # Ensure allocations and prices have same columns
+        # Remove any allocations for tickers not in prices
+        allocations = allocations[prices.columns]
+
+        # Verify no NaN or Inf in either DataFrame
+        prices = self._simulation_prices(prices)
+
+        if allocations.isna().any().any():
+            print("\n⚠️  WARNING: NaN values in allocations (expected on hold days)")
+            print("   These NaNs represent days with no rebalance; positions will be held (no fill applied).")
+
         print(f"\n📊 Data validation:")
         print(f"   Prices shape: {prices.shape}")
         print(f"   Allocations shape: {allocations.shape}")
@@ -1265,19 +1687,36 @@ class NickRadgeCryptoHybrid:
         print(f"   Any NaN in prices: {prices.isna().any().any()}")
         print(f"   Any NaN in allocations: {allocations.isna().any().any()}")
 
-        # Create portfolio using vectorbt with target percent sizing
-        portfolio = vbt.Portfolio.from_orders(
-            close=prices,
-            size=allocations,
-            size_type='targetpercent',
-            fees=fees,
-            slippage=slippage,
-            init_cash=initial_capital,
-            cash_sharing=True,  # Share cash across all assets
-            group_by=True,  # Treat as single portfolio
-            call_seq='auto',  # Optimize order execution
-            freq='D'
-        )
+        use_portfolio_stop = self.portfolio_stop_loss is not None and self.portfolio_stop_loss > 0
+        use_position_stop = self.position_stop_loss is not None and self.position_stop_loss > 0
+
+        if use_portfolio_stop or use_position_stop:
+            # === STOP-LOSSES (Single Pass on Live Equity) ===
+            # Portfolio stop (drawdown from peak, trough-based re-entry) and
+            # position stops are applied bar by bar against the equity this
+            # simulation produces - no separate pass to estimate drawdowns
+            print(f"\n🛡️  Applying Stop-Losses (single pass on live equity)...")
+            portfolio, allocations = self.simulate_with_stops(
+                prices,
+                allocations,
+                initial_capital,
+                fees=fees,
+                slippage=slippage
+            )
+        else:
+            # Create portfolio using vectorbt with target percent sizing
+            portfolio = vbt.Portfolio.from_orders(
+                close=prices,
+                size=allocations,
+                size_type='targetpercent',
+                fees=fees,
+                slippage=slippage,
+                init_cash=initial_capital,
+                cash_sharing=True,  # Share cash across all assets
+                group_by=True,  # Treat as single portfolio
+                call_seq='auto',  # Optimize order execution
+                freq='D'
+            )
 
         print(f"\n✅ Backtest Complete!")
 
@@ -1320,14 +1759,146 @@ class NickRadgeCryptoHybrid:
         # === Optional: Log all trades ===
         if log_trades:
             print(f"\n📋 Detailed Trade Log:")
-            trades = portfolio.trades.records_readable
-            for idx, trade in trades.iterrows():
-                print(f"   {idx+1}. {trade['Column']}: {trade['Side']} "
-                      f"{trade['Size']:.4f} @ ${trade['Entry Price']:.2f} → ${trade['Exit Price']:.2f} "
-                      f"PnL: ${trade['PnL']:.2f} ({trade['Return']:.2%})")
+            records = portfolio.trades.values
+            tickers = portfolio.wrapper.columns[records['col']]
+            sides = np.where(records['direction'] == 0, 'Long', 'Short')
+            lines = [
+                f"   {n}. {ticker}: {side} {size:.4f} @ ${entry:.2f} → ${exit_:.2f} PnL: ${pnl:.2f} ({ret:.2%})"
+                for n, ticker, side, size, entry, exit_, pnl, ret in zip(
+                    range(1, len(records) + 1), tickers, sides, records['size'],
+                    records['entry_price'], records['exit_price'], records['pnl'], records['return']
+                )
+            ]
+            if lines:
+                print("\n".join(lines))
 
         return portfolio
 
+    def sweep(self,
+              prices: pd.DataFrame,
+              btc_prices: pd.Series,
+              variants: Union[List[Dict], Dict[str, list]],
+              initial_capital: float = 100000,
+              fees: float = 0.001,
+              slippage: float = 0.0005,
+              n_workers: Optional[int] = None,
+              return_portfolios: bool = False,
+              verbose: bool = True):
+        """
+        Backtest many parameter variants, computing shared stages once
+
+        Each variant overrides constructor arguments of this strategy. The
+        pipeline is split into layers, each computed once per unique key:
+        1. Cleaning (core_assets, bear_asset)
+        2. Regime codes (regime MAs + hysteresis), all combinations in one batch
+        3. Indicators / qualifier scores (cleaning + qualifier + ma_period)
+        4. Allocations incl. satellite rankings (layers 1-3 + weights, size, rebalance)
+        5. Simulation with stops (every variant)
+
+        So a stop-level sweep computes cleaning, regime, scores and allocations
+        once. Simulations run on a thread pool (the stop kernel releases the
+        GIL); processes aren't used because this module is loaded by file path
+        and can't be unpickled in workers. Results match backtest() per variant.
+
+        Args:
+            prices: DataFrame with crypto prices
+            btc_prices: BTC prices for regime filter
+            variants: List of constructor overrides, or dict of lists (full grid)
+            initial_capital: Starting capital
+            fees: Trading fees
+            slippage: Slippage
+            n_workers: Simulation threads (default: os.cpu_count())
+            return_portfolios: Also return the vectorbt Portfolio of each variant
+            verbose: Print progress
+
+        Returns:
+            DataFrame with one row per variant (overrides + metrics), and the
+            list of portfolios if return_portfolios
+        """
+        if isinstance(variants, dict):
+            names = list(variants)
+            variants = [dict(zip(names, values)) for values in product(*variants.values())]
+
+        base_params = {name: getattr(self, name) for name in inspect.signature(type(self).__init__).parameters
+                       if name != 'self'}
+        strategies = [NickRadgeCryptoHybrid(**{**base_params, **variant}) for variant in variants]
+
+        def layer_key(strategy, names: List[str], *upstream: str) -> str:
+            return json.dumps([list(upstream)] + [getattr(strategy, name) for name in names],
+                              sort_keys=True, default=str)
+
+        if verbose:
+            print(f"\n🔁 Sweeping {len(strategies)} variants of {self.name}")
+
+        # Layer 2: every regime combination in one pass over BTC
+        regime_combinations = list(dict.fromkeys(
+            (s.regime_ma_long, s.regime_ma_short, s.regime_hysteresis) for s in strategies
+        ))
+        regime_batch = self.calculate_regime_batch(btc_prices, regime_combinations)
+
+        cleaned, simulation_prices, indicator_cache, allocation_cache = {}, {}, {}, {}
+        jobs = []
+        for strategy in strategies:
+            clean_key = layer_key(strategy, CLEAN_PARAMS)
+            regime_key = (strategy.regime_ma_long, strategy.regime_ma_short, strategy.regime_hysteresis)
+            indicator_key = layer_key(strategy, INDICATOR_PARAMS, clean_key)
+            allocation_key = layer_key(strategy, ALLOCATION_PARAMS, indicator_key, str(regime_key))
+
+            # Upstream stages print their usual reports; keep the sweep log compact
+            with redirect_stdout(io.StringIO()):
+                if clean_key not in cleaned:
+                    cleaned[clean_key] = strategy.prepare_prices(prices.copy())
+                    simulation_prices[clean_key] = strategy._simulation_prices(cleaned[clean_key])
+                clean_prices = cleaned[clean_key]
+
+                if indicator_key not in indicator_cache:
+                    satellite_universe = [c for c in clean_prices.columns
+                                          if c not in strategy.core_assets and c != strategy.bear_asset]
+                    indicator_cache[indicator_key] = strategy.calculate_indicators(
+                        clean_prices[satellite_universe], btc_prices
+                    )
+
+                if allocation_key not in allocation_cache:
+                    regime_codes = regime_batch.iloc[:, regime_combinations.index(regime_key)].rename(None)
+                    allocation_cache[allocation_key] = strategy.generate_allocations(
+                        clean_prices, btc_prices,
+                        regime_codes=regime_codes,
+                        indicators=indicator_cache[indicator_key]
+                    )[clean_prices.columns]
+
+            jobs.append((strategy, simulation_prices[clean_key], allocation_cache[allocation_key]))
+
+        if verbose:
+            print(f"   Cleaned price sets: {len(cleaned)}")
+            print(f"   Regime combinations: {len(regime_combinations)}")
+            print(f"   Indicator sets: {len(indicator_cache)}")
+            print(f"   Allocation matrices: {len(allocation_cache)}")
+            print(f"   Simulations: {len(jobs)}")
+
+        def simulate(job):
+            strategy, job_prices, allocations = job
+            portfolio, _ = strategy.simulate_with_stops(job_prices, allocations, initial_capital,
+                                                        fees=fees, slippage=slippage, verbose=False)
+            return portfolio, portfolio_metrics(portfolio)
+
+        # Layer 5: without stops the simulator reproduces from_orders exactly
+        with ThreadPoolExecutor(max_workers=n_workers or os.cpu_count()) as executor:
+            outcomes = list(executor.map(simulate, jobs))
+
+        rows = []
+        for variant, (_, metrics) in zip(variants, outcomes):
+            row = dict(variant)
+            row.update({name: float(values[0]) for name, values in metrics.items()})
+            rows.append(row)
+        results = pd.DataFrame(rows)
+
+        if verbose:
+            print(f"   ✅ Sweep complete")
+
+        if return_portfolios:
+            return results, [portfolio for portfolio, _ in outcomes]
+        return results
+
     def _safe_scalar(self, value):
         """Safely extract scalar from Series/Array/scalar"""
         if isinstance(value, pd.Series):
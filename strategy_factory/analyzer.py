@@ -14,6 +14,8 @@ from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+from strategy_factory.monte_carlo import MonteCarloEngine
+
 # Extend pandas with quantstats
 qs.extend_pandas()
 
@@ -265,16 +267,10 @@ class StrategyAnalyzer:
         """
         print(f"🎲 Running Monte Carlo simulation ({n_simulations} runs)...")
 
-        # Run simulations
-        simulated_returns = []
-
-        for _ in range(n_simulations):
-            # Bootstrap sampling
-            sampled = np.random.choice(returns.values, size=len(returns), replace=True)
-            sim_cumulative = (1 + pd.Series(sampled)).cumprod()
-            simulated_returns.append(sim_cumulative.iloc[-1] - 1)
-
-        simulated_returns = np.array(simulated_returns)
+        # Run simulations (vectorized bootstrap, chunked for memory)
+        simulations = MonteCarloEngine(n_simulations=n_simulations).simulate(returns.values)
+        simulated_returns = simulations['total_return']
+        max_drawdowns = simulations['max_drawdown']
 
         # Calculate statistics
         results = {
@@ -287,13 +283,16 @@ class StrategyAnalyzer:
             'percentile_95': np.percentile(simulated_returns, 95) * 100,
             'probability_positive': (simulated_returns > 0).sum() / n_simulations * 100,
             'worst_case': simulated_returns.min() * 100,
-            'best_case': simulated_returns.max() * 100
+            'best_case': simulated_returns.max() * 100,
+            'median_max_drawdown': np.median(max_drawdowns) * 100,
+            'max_drawdown_5': np.percentile(max_drawdowns, 5) * 100
         }
 
         print(f"\n✅ Monte Carlo Results:")
         print(f"   Mean return: {results['mean_return']:.2f}%")
         print(f"   95% CI: [{results['percentile_5']:.2f}%, {results['percentile_95']:.2f}%]")
         print(f"   Probability of profit: {results['probability_positive']:.1f}%")
+        print(f"   Median path max drawdown: {results['median_max_drawdown']:.2f}%")
 
         return results
 
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+On-Disk Feature Store for ML Qualifiers
+
+Engineered ML features (24-37 per stock) are the most expensive step of every
+MLQualifier.calculate() call, and the same features are rebuilt by every
+qualifier, hybrid and example script that runs on the same universe. This
+store persists them once as columnar Parquet files partitioned by year, so:
+
+- Repeated runs read features straight from disk (no rebuild)
+- When new bars arrive, only the newest rows are computed (with a warm-up
+  window for the rolling indicators) and appended
+- Slices (date range, tickers) read only the partitions/columns they need
+
+Store layout:
+    {store_dir}/{store_key}/manifest.json
+    {store_dir}/{store_key}/year=2021.parquet
+    {store_dir}/{store_key}/year=2022.parquet
+    ...
+
+Store key = hash of feature-set version + input schema (tickers, SPY/volume/
+sector inputs). The manifest records a fingerprint of the input data up to
+the last stored date; if that history changes (revised prices, different
+start date) the store is rebuilt instead of appended to.
+
+Requires pyarrow (pip install pyarrow).
+
+Author: Strategy Factory
+"""
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+
+from strategy_factory.model_cache import fingerprint_data
+
+
+class FeatureStore:
+    """
+    Appendable, year-partitioned Parquet store for engineered features
+
+    Example:
+        store = FeatureStore('cache/features')
+        rf = MLQualifier(feature_store=store)
+        xgb = XGBoostQualifier(feature_store=store)
+        rf.calculate(prices, spy_prices, volumes)   # engineers + stores features
+        xgb.calculate(prices, spy_prices, volumes)  # reads features from disk
+    """
+
+    def __init__(self, store_dir: Union[str, Path] = 'cache/features',
+                 warmup_bars: int = 400, verbose: bool = True):
+        """
+        Initialize feature store
+
+        Args:
+            store_dir: Root directory for stored feature sets (created if missing)
+            warmup_bars: History bars recomputed before the first new row on
+                         append (must cover the longest rolling window, 200 + lags)
+            verbose: Print a line for every build/append/load
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("FeatureStore requires pyarrow. Install with: pip install pyarrow")
+
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.warmup_bars = warmup_bars
+        self.verbose = verbose
+
+    @staticmethod
+    def make_key(feature_version: str, prices: pd.DataFrame,
+                 spy_prices: Optional[pd.Series] = None,
+                 volumes: Optional[pd.DataFrame] = None,
+                 sector_prices: Optional[pd.DataFrame] = None) -> str:
+        """
+        Build the store key from feature-set version and input schema
+
+        Args:
+            feature_version: Feature-set version of the qualifier
+            prices: Stock prices (columns = tickers)
+            spy_prices: SPY prices (optional)
+            volumes: Volume data (optional)
+            sector_prices: Sector ETF prices (optional)
+
+        Returns:
+            Store key (directory name)
+        """
+        payload = {
+            'version': feature_version,
+            'tickers': [str(c) for c in prices.columns],
+            'spy': spy_prices is not None,
+            'volumes': None if volumes is None else [str(c) for c in volumes.columns],
+            'sectors': None if sector_prices is None else [str(c) for c in sector_prices.columns]
+        }
+        encoded = json.dumps(payload, sort_keys=True).encode()
+        return f"{feature_version}-{hashlib.sha256(encoded).hexdigest()[:16]}"
+
+    def _manifest_path(self, key: str) -> Path:
+        return self.store_dir / key / 'manifest.json'
+
+    def _partition_path(self, key: str, year: int) -> Path:
+        return self.store_dir / key / f"year={year}.parquet"
+
+    def _read_manifest(self, key: str) -> Optional[Dict]:
+        path = self._manifest_path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_manifest(self, key: str, manifest: Dict) -> None:
+        path = self._manifest_path(key)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        tmp_path.replace(path)
+
+    @staticmethod
+    def _input_fingerprint(end: pd.Timestamp, prices, spy_prices, volumes, sector_prices) -> str:
+        """Fingerprint of all inputs up to (and including) end"""
+        return fingerprint_data(*[None if obj is None else obj.loc[:end]
+                                  for obj in (prices, spy_prices, volumes, sector_prices)])
+
+    def _write_partitions(self, key: str, features: pd.DataFrame) -> None:
+        """Write (or overwrite) one Parquet file per calendar year present in features"""
+        for year, part in features.groupby(features.index.year):
+            path = self._partition_path(key, int(year))
+            tmp_path = path.with_suffix('.tmp')
+            part.to_parquet(tmp_path, engine='pyarrow')
+            tmp_path.replace(path)
+
+    def read(self, key: str, start=None, end=None,
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read a slice of a stored feature set
+
+        Only the year partitions overlapping [start, end] and the requested
+        columns are loaded.
+
+        Args:
+            key: Store key from make_key()
+            start: First date (optional)
+            end: Last date (optional)
+            columns: Feature columns to load (optional, default all)
+
+        Returns:
+            Feature DataFrame (rows = dates, cols = ticker_feature)
+        """
+        manifest = self._read_manifest(key)
+        if manifest is None:
+            return pd.DataFrame()
+
+        years = manifest['years']
+        if start is not None:
+            years = [y for y in years if y >= pd.Timestamp(start).year]
+        if end is not None:
+            years = [y for y in years if y <= pd.Timestamp(end).year]
+
+        parts = [pd.read_parquet(self._partition_path(key, y), engine='pyarrow', columns=columns)
+                 for y in years]
+        if not parts:
+            return pd.DataFrame(columns=columns or manifest['columns'])
+
+        features = pd.concat(parts).sort_index()
+        return features.loc[start:end]
+
+    def get_features(self, qualifier, prices: pd.DataFrame,
+                     spy_prices: Optional[pd.Series] = None,
+                     volumes: Optional[pd.DataFrame] = None,
+                     sector_prices: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Return engineered features for the inputs, building or appending as needed
+
+        Cases:
+        1. Stored history matches inputs and covers all dates -> read from disk
+        2. Stored history matches, inputs have new bars -> compute new rows only
+           (from a warm-up window) and append
+        3. No store / history changed / feature columns changed -> full rebuild
+
+        Args:
+            qualifier: MLQualifier (provides engineer_features and FEATURE_SET_VERSION)
+            prices: Stock prices
+            spy_prices: SPY prices (optional)
+            volumes: Volume data (optional)
+            sector_prices: Sector ETF prices (optional)
+
+        Returns:
+            Feature DataFrame aligned to prices.index
+        """
+        key = self.make_key(qualifier.FEATURE_SET_VERSION, prices, spy_prices, volumes, sector_prices)
+        manifest = self._read_manifest(key)
+        inputs = (prices, spy_prices, volumes, sector_prices)
+
+        if manifest is not None:
+            last_date = pd.Timestamp(manifest['last_date'])
+            first_date = pd.Timestamp(manifest['first_date'])
+            history_matches = (
+                prices.index[0] == first_date and
+                last_date in prices.index and
+                self._input_fingerprint(last_date, *inputs) == manifest['input_fingerprint']
+            )
+
+            if history_matches:
+                new_dates = prices.index[prices.index > last_date]
+
+                if len(new_dates) == 0:
+                    if self.verbose:
+                        print(f"   [FEATURES] Loaded {manifest['n_rows']} rows from store ({key})")
+                    return self.read(key).reindex(prices.index)
+
+                appended = self._append(key, manifest, qualifier, *inputs)
+                if appended is not None:
+                    return appended.reindex(prices.index)
+
+        return self._build(key, qualifier, *inputs).reindex(prices.index)
+
+    def _build(self, key: str, qualifier, prices, spy_prices, volumes, sector_prices) -> pd.DataFrame:
+        """Engineer features for the full history and (re)write the store"""
+        if self.verbose:
+            print(f"   [FEATURES] Building feature store ({key}, {len(prices)} rows)")
+
+        features = qualifier.engineer_features(prices, spy_prices, volumes, sector_prices)
+
+        key_dir = self.store_dir / key
+        if key_dir.exists():
+            shutil.rmtree(key_dir)
+        key_dir.mkdir(parents=True)
+
+        if features.empty:
+            return features
+
+        self._write_partitions(key, features)
+        self._write_manifest(key, self._make_manifest(qualifier, features, prices, spy_prices,
+                                                      volumes, sector_prices))
+        return features
+
+    def _append(self, key: str, manifest: Dict, qualifier,
+                prices, spy_prices, volumes, sector_prices) -> Optional[pd.DataFrame]:
+        """
+        Compute only the rows after the last stored date and append them
+
+        Returns:
+            Full feature DataFrame, or None if the new rows are not compatible
+            with the stored columns (caller falls back to a full rebuild)
+        """
+        last_date = pd.Timestamp(manifest['last_date'])
+        last_pos = prices.index.get_loc(last_date)
+        warm_start = prices.index[max(0, last_pos + 1 - self.warmup_bars)]
+
+        def tail(obj):
+            return None if obj is None else obj.loc[warm_start:]
+
+        tail_features = qualifier.engineer_features(tail(prices), tail(spy_prices),
+                                                    tail(volumes), tail(sector_prices))
+        new_rows = tail_features.loc[tail_features.index > last_date]
+
+        if list(new_rows.columns) != manifest['columns']:
+            if self.verbose:
+                print("   [FEATURES] Feature columns changed, rebuilding store")
+            return None
+
+        if self.verbose:
+            print(f"   [FEATURES] Appending {len(new_rows)} new rows to store ({key})")
+
+        features = pd.concat([self.read(key), new_rows])
+
+        # Rewrite only the last stored year (it may gain rows) plus any new years
+        first_new_year = int(new_rows.index[0].year)
+        self._write_partitions(key, features[features.index.year >= first_new_year])
+
+        self._write_manifest(key, self._make_manifest(qualifier, features, prices, spy_prices,
+                                                      volumes, sector_prices))
+        return features
+
+    def _make_manifest(self, qualifier, features: pd.DataFrame,
+                       prices, spy_prices, volumes, sector_prices) -> Dict:
+        last_date = features.index[-1]
+        return {
+            'feature_version': qualifier.FEATURE_SET_VERSION,
+            'first_date': str(features.index[0]),
+            'last_date': str(last_date),
+            'n_rows': len(features),
+            'columns': [str(c) for c in features.columns],
+            'years': sorted(int(y) for y in features.index.year.unique()),
+            'input_fingerprint': self._input_fingerprint(last_date, prices, spy_prices,
+                                                         volumes, sector_prices)
+        }
+
+    def clear(self) -> int:
+        """
+        Delete all stored feature sets
+
+        Returns:
+            Number of feature sets removed
+        """
+        removed = 0
+        for path in self.store_dir.iterdir():
+            if path.is_dir():
+                shutil.rmtree(path)
+                removed += 1
+        return removed
+
+
+def get_feature_store(feature_store: Union[None, str, Path, FeatureStore]) -> Optional[FeatureStore]:
+    """
+    Normalize a feature_store argument (None, directory path or FeatureStore)
+
+    Args:
+        feature_store: None (disabled), store directory, or FeatureStore instance
+
+    Returns:
+        FeatureStore instance or None
+    """
+    if feature_store is None or isinstance(feature_store, FeatureStore):
+        return feature_store
+    return FeatureStore(feature_store)
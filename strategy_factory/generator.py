@@ -3,17 +3,27 @@ Strategy Generator - Generate thousands of trading strategies using vectorbt
 
 This module generates trading strategies by testing combinations of indicators
 and parameters across historical data. Uses vectorized operations for speed.
+
+Grid mode (default): all parameter combinations of a generator are stacked
+into 2-D entries/exits matrices (one column per combination) and simulated
+in a single vectorbt call per chunk, with metrics extracted column-wise.
 """
 
+import time
 import pandas as pd
 import numpy as np
 import vectorbt as vbt
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional, Union
 from itertools import product
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 import warnings
 warnings.filterwarnings('ignore')
 
+from strategy_factory.indicator_table import IndicatorTable
+from strategy_factory.metrics_kernel import portfolio_metrics
+from strategy_factory.model_cache import fingerprint_data
+from strategy_factory.results_store import SweepResultsStore, get_results_store
+
 
 @dataclass
 class StrategyResult:
@@ -30,6 +40,13 @@ class StrategyResult:
     trades_per_year: float
 
 
+# Column order of results DataFrames (also used when no combination is valid)
+RESULT_COLUMNS = [f.name for f in fields(StrategyResult)]
+
+# Price columns the signal generators read (fingerprinted for the results store context)
+OHLC_COLUMNS = ['open', 'high', 'low', 'close']
+
+
 class StrategyGenerator:
     """
     Generate and test thousands of strategy combinations using vectorbt
@@ -40,16 +57,28 @@ class StrategyGenerator:
         top_10 = results.head(10)
     """
 
-    def __init__(self, initial_capital: float = 10000, commission: float = 0.001):
+    def __init__(self, initial_capital: float = 10000, commission: float = 0.001,
+                 grid_mode: bool = True, grid_chunk_size: int = 500,
+                 results_store: Optional[Union[str, SweepResultsStore]] = None):
         """
         Initialize strategy generator
 
         Args:
             initial_capital: Starting capital for backtests
             commission: Commission per trade (0.001 = 0.1%)
+            grid_mode: Simulate all combinations of a generator in one vectorbt
+                       call (one column per combination) instead of one call each
+            grid_chunk_size: Max combinations per vectorbt call in grid mode
+                             (bounds memory: bars x chunk booleans per matrix)
+            results_store: Optional SweepResultsStore (or SQLite path). Results are
+                           checkpointed as they are computed and combinations
+                           already stored for the same data/costs are skipped
         """
         self.initial_capital = initial_capital
         self.commission = commission
+        self.grid_mode = grid_mode
+        self.grid_chunk_size = max(1, grid_chunk_size)
+        self.results_store = get_results_store(results_store)
 
     def generate_sma_strategies(self,
                                 df: pd.DataFrame,
@@ -72,47 +101,21 @@ class StrategyGenerator:
             print(f"🔄 Generating SMA strategies...")
             print(f"   Testing {len(fast_range)} x {len(slow_range)} = {len(fast_range) * len(slow_range)} combinations")
 
-        results = []
-        strategy_id = 0
-
-        # Get close prices
         close = df['close'].values
+        indicators = IndicatorTable(close)
 
-        for fast_period, slow_period in product(fast_range, slow_range):
-            # Skip if fast >= slow
-            if fast_period >= slow_period:
-                continue
-
-            # Calculate SMAs
-            fast_sma = pd.Series(close).rolling(fast_period).mean()
-            slow_sma = pd.Series(close).rolling(slow_period).mean()
-
-            # Generate signals
-            entries = (fast_sma > slow_sma) & (fast_sma.shift(1) <= slow_sma.shift(1))
-            exits = (fast_sma < slow_sma) & (fast_sma.shift(1) >= slow_sma.shift(1))
-
-            # Run backtest
-            portfolio = vbt.Portfolio.from_signals(
-                close=close,
-                entries=entries,
-                exits=exits,
-                init_cash=self.initial_capital,
-                fees=self.commission
-            )
+        # Skip if fast >= slow
+        combos = [{'type': 'SMA', 'fast': fast_period, 'slow': slow_period}
+                  for fast_period, slow_period in product(fast_range, slow_range)
+                  if fast_period < slow_period]
 
-            # Calculate metrics
-            metrics = self._calculate_metrics(portfolio)
+        def signals(params: Dict) -> Tuple[np.ndarray, np.ndarray]:
+            return self._crossover_signals(indicators.sma(params['fast']), indicators.sma(params['slow']))
 
-            results.append(StrategyResult(
-                strategy_id=strategy_id,
-                params={'type': 'SMA', 'fast': fast_period, 'slow': slow_period},
-                **metrics
-            ))
-
-            strategy_id += 1
+        results = self._run_signal_combos(df, combos, signals, verbose)
 
         # Convert to DataFrame and sort
-        df_results = pd.DataFrame([vars(r) for r in results])
+        df_results = pd.DataFrame([vars(r) for r in results], columns=RESULT_COLUMNS)
         df_results = df_results.sort_values('sharpe_ratio', ascending=False)
 
         if verbose:
@@ -146,44 +149,21 @@ class StrategyGenerator:
             print(f"🔄 Generating RSI strategies...")
             print(f"   Testing {total} combinations")
 
-        results = []
-        strategy_id = 0
-
         close = df['close'].values
+        indicators = IndicatorTable(close)
 
-        for period, oversold, overbought in product(period_range, oversold_range, overbought_range):
-            # Skip if oversold >= overbought
-            if oversold >= overbought:
-                continue
-
-            # Calculate RSI
-            rsi = self._calculate_rsi(close, period)
-
-            # Generate signals
-            entries = rsi < oversold
-            exits = rsi > overbought
-
-            # Run backtest
-            portfolio = vbt.Portfolio.from_signals(
-                close=close,
-                entries=entries,
-                exits=exits,
-                init_cash=self.initial_capital,
-                fees=self.commission
-            )
-
-            # Calculate metrics
-            metrics = self._calculate_metrics(portfolio)
+        # Skip if oversold >= overbought
+        combos = [{'type': 'RSI', 'period': period, 'oversold': oversold, 'overbought': overbought}
+                  for period, oversold, overbought in product(period_range, oversold_range, overbought_range)
+                  if oversold < overbought]
 
-            results.append(StrategyResult(
-                strategy_id=strategy_id,
-                params={'type': 'RSI', 'period': period, 'oversold': oversold, 'overbought': overbought},
-                **metrics
-            ))
+        def signals(params: Dict) -> Tuple[np.ndarray, np.ndarray]:
+            rsi = indicators.rsi(params['period'])
+            return rsi < params['oversold'], rsi > params['overbought']
 
-            strategy_id += 1
+        results = self._run_signal_combos(df, combos, signals, verbose)
 
-        df_results = pd.DataFrame([vars(r) for r in results])
+        df_results = pd.DataFrame([vars(r) for r in results], columns=RESULT_COLUMNS)
         df_results = df_results.sort_values('sharpe_ratio', ascending=False)
 
         if verbose:
@@ -214,47 +194,31 @@ class StrategyGenerator:
             print(f"🔄 Generating Breakout strategies...")
             print(f"   Testing {total} combinations")
 
-        results = []
-        strategy_id = 0
-
         high = df['high'].values
         low = df['low'].values
         close = df['close'].values
+        band_cache = {}
 
-        for lookback, breakout_pct in product(lookback_range, breakout_pct_range):
-            # Calculate rolling high/low
-            rolling_high = pd.Series(high).rolling(lookback).max()
-            rolling_low = pd.Series(low).rolling(lookback).min()
-
-            # Calculate breakout bands
-            upper_band = rolling_high * (1 + breakout_pct / 100)
-            lower_band = rolling_low * (1 - breakout_pct / 100)
-
-            # Generate signals (compare to previous period's band to avoid lookahead)
-            entries = pd.Series(close) > upper_band.shift(1)
-            exits = pd.Series(close) < lower_band.shift(1)
-
-            # Run backtest
-            portfolio = vbt.Portfolio.from_signals(
-                close=close,
-                entries=entries,
-                exits=exits,
-                init_cash=self.initial_capital,
-                fees=self.commission
-            )
+        combos = [{'type': 'Breakout', 'lookback': lookback, 'breakout_pct': breakout_pct}
+                  for lookback, breakout_pct in product(lookback_range, breakout_pct_range)]
 
-            # Calculate metrics
-            metrics = self._calculate_metrics(portfolio)
+        def signals(params: Dict) -> Tuple[np.ndarray, np.ndarray]:
+            lookback = params['lookback']
+            if lookback not in band_cache:
+                # Rolling high/low of the previous period (avoids lookahead)
+                rolling_high = pd.Series(high).rolling(lookback).max().shift(1).values
+                rolling_low = pd.Series(low).rolling(lookback).min().shift(1).values
+                band_cache[lookback] = (rolling_high, rolling_low)
+            rolling_high, rolling_low = band_cache[lookback]
 
-            results.append(StrategyResult(
-                strategy_id=strategy_id,
-                params={'type': 'Breakout', 'lookback': lookback, 'breakout_pct': breakout_pct},
-                **metrics
-            ))
+            # Breakout bands
+            upper_band = rolling_high * (1 + params['breakout_pct'] / 100)
+            lower_band = rolling_low * (1 - params['breakout_pct'] / 100)
+            return close > upper_band, close < lower_band
 
-            strategy_id += 1
+        results = self._run_signal_combos(df, combos, signals, verbose)
 
-        df_results = pd.DataFrame([vars(r) for r in results])
+        df_results = pd.DataFrame([vars(r) for r in results], columns=RESULT_COLUMNS)
         df_results = df_results.sort_values('sharpe_ratio', ascending=False)
 
         if verbose:
@@ -287,43 +251,19 @@ class StrategyGenerator:
             print(f"🔄 Generating MACD strategies...")
             print(f"   Testing {total} combinations")
 
-        results = []
-        strategy_id = 0
-
         close = df['close'].values
+        indicators = IndicatorTable(close)
 
-        for fast, slow, signal in product(fast_range, slow_range, signal_range):
-            if fast >= slow:
-                continue
+        combos = [{'type': 'MACD', 'fast': fast, 'slow': slow, 'signal': signal}
+                  for fast, slow, signal in product(fast_range, slow_range, signal_range)
+                  if fast < slow]
 
-            # Calculate MACD
-            macd_line, signal_line = self._calculate_macd(close, fast, slow, signal)
+        def signals(params: Dict) -> Tuple[np.ndarray, np.ndarray]:
+            return self._crossover_signals(*indicators.macd(params['fast'], params['slow'], params['signal']))
 
-            # Generate signals
-            entries = (macd_line > signal_line) & (pd.Series(macd_line).shift(1) <= pd.Series(signal_line).shift(1))
-            exits = (macd_line < signal_line) & (pd.Series(macd_line).shift(1) >= pd.Series(signal_line).shift(1))
+        results = self._run_signal_combos(df, combos, signals, verbose)
 
-            # Run backtest
-            portfolio = vbt.Portfolio.from_signals(
-                close=close,
-                entries=entries,
-                exits=exits,
-                init_cash=self.initial_capital,
-                fees=self.commission
-            )
-
-            # Calculate metrics
-            metrics = self._calculate_metrics(portfolio)
-
-            results.append(StrategyResult(
-                strategy_id=strategy_id,
-                params={'type': 'MACD', 'fast': fast, 'slow': slow, 'signal': signal},
-                **metrics
-            ))
-
-            strategy_id += 1
-
-        df_results = pd.DataFrame([vars(r) for r in results])
+        df_results = pd.DataFrame([vars(r) for r in results], columns=RESULT_COLUMNS)
         df_results = df_results.sort_values('sharpe_ratio', ascending=False)
 
         if verbose:
@@ -332,6 +272,198 @@ class StrategyGenerator:
 
         return df_results
 
+    @staticmethod
+    def _crossover_signals(fast: np.ndarray, slow: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Cross-above entries / cross-below exits (NaN comparisons are False)"""
+        fast_prev = np.concatenate([[np.nan], fast[:-1]])
+        slow_prev = np.concatenate([[np.nan], slow[:-1]])
+        entries = (fast > slow) & (fast_prev <= slow_prev)
+        exits = (fast < slow) & (fast_prev >= slow_prev)
+        return entries, exits
+
+    def _run_signal_combos(self,
+                           df: pd.DataFrame,
+                           combos: List[Dict],
+                           signal_fn: Callable[[Dict], Tuple[np.ndarray, np.ndarray]],
+                           verbose: bool = True) -> List[StrategyResult]:
+        """
+        Backtest signal-based parameter combinations
+
+        Grid mode stacks each chunk of combinations into 2-D entries/exits
+        matrices (one column per combination) and runs a single
+        vbt.Portfolio.from_signals call; columns are simulated independently,
+        so results match one call per combination.
+
+        With a results store, combinations already stored for this data are
+        read back instead of simulated, and new results are flushed after
+        every chunk (and on interruption).
+
+        Args:
+            df: DataFrame with OHLCV data (simulated on 'close')
+            combos: Parameter dicts (stored as StrategyResult.params)
+            signal_fn: Returns (entries, exits) boolean arrays for a parameter dict
+            verbose: Print throughput
+
+        Returns:
+            List of StrategyResult (strategy_id = position in combos)
+        """
+        start_time = time.perf_counter()
+        close = df['close'].values
+        store = self.results_store
+        context = self.results_context(df) if store is not None else None
+        results, todo, hashes = self._resume_from_store(combos, context, verbose)
+
+        try:
+            if not self.grid_mode:
+                for strategy_id in todo:
+                    params = combos[strategy_id]
+                    entries, exits = signal_fn(params)
+
+                    # Run backtest
+                    portfolio = vbt.Portfolio.from_signals(
+                        close=close,
+                        entries=entries,
+                        exits=exits,
+                        init_cash=self.initial_capital,
+                        fees=self.commission
+                    )
+
+                    results.append(StrategyResult(
+                        strategy_id=strategy_id,
+                        params=params,
+                        **self._calculate_metrics(portfolio)
+                    ))
+                    if store is not None:
+                        store.add(hashes[strategy_id], context, strategy_id, params, vars(results[-1]))
+            else:
+                for chunk_start in range(0, len(todo), self.grid_chunk_size):
+                    chunk_ids = todo[chunk_start:chunk_start + self.grid_chunk_size]
+
+                    # Build 2-D signal matrices (bars x combinations)
+                    entries = np.empty((len(close), len(chunk_ids)), dtype=bool)
+                    exits = np.empty((len(close), len(chunk_ids)), dtype=bool)
+                    for col, strategy_id in enumerate(chunk_ids):
+                        entries[:, col], exits[:, col] = signal_fn(combos[strategy_id])
+
+                    # One simulation for the whole chunk (close as a column, broadcast across combos)
+                    portfolio = vbt.Portfolio.from_signals(
+                        close=np.asarray(close, dtype=float)[:, None],
+                        entries=entries,
+                        exits=exits,
+                        init_cash=self.initial_capital,
+                        fees=self.commission
+                    )
+
+                    for strategy_id, metrics in zip(chunk_ids, self._calculate_metrics_batch(portfolio, len(chunk_ids))):
+                        results.append(StrategyResult(
+                            strategy_id=strategy_id,
+                            params=combos[strategy_id],
+                            **metrics
+                        ))
+                        if store is not None:
+                            store.add(hashes[strategy_id], context, strategy_id, combos[strategy_id], metrics)
+
+                    # Checkpoint after every chunk
+                    if store is not None:
+                        store.flush()
+        finally:
+            if store is not None:
+                store.flush()
+
+        results.sort(key=lambda r: r.strategy_id)
+
+        elapsed = time.perf_counter() - start_time
+        if verbose and todo:
+            mode = 'grid' if self.grid_mode else 'loop'
+            print(f"   ⚡ {len(todo)} combinations in {elapsed:.2f}s "
+                  f"({len(todo) / max(elapsed, 1e-9):.0f} combos/sec, {mode} mode)")
+
+        return results
+
+    def results_context(self, df: pd.DataFrame) -> str:
+        """
+        Results store context the signal generators (SMA/RSI/Breakout/MACD) use for df
+
+        Fingerprints every OHLC column present (breakouts read high/low, not
+        just close) plus capital and commission.
+
+        Args:
+            df: DataFrame with OHLCV data
+
+        Returns:
+            Context string (e.g. for SweepResultsStore.top_k(context=...))
+        """
+        return self._store_context(df[[col for col in OHLC_COLUMNS if col in df.columns]])
+
+    def _store_context(self, data) -> str:
+        """Results store context: same params on other data/costs are different results"""
+        return fingerprint_data(data if isinstance(data, pd.DataFrame) else np.asarray(data, dtype=float),
+                                self.initial_capital, self.commission)
+
+    def _resume_from_store(self, combos: List[Dict], context: Optional[str],
+                           verbose: bool) -> Tuple[List[StrategyResult], List[int], List[str]]:
+        """
+        Split combinations into stored results and ones still to run
+
+        Returns:
+            Tuple of (stored StrategyResults, strategy_ids to run, param hashes)
+        """
+        if self.results_store is None:
+            return [], list(range(len(combos))), []
+
+        hashes = [self.results_store.param_hash(params, context) for params in combos]
+        stored = self.results_store.get(hashes)
+
+        results = [StrategyResult(strategy_id=strategy_id, params=params, **stored[param_hash])
+                   for strategy_id, (params, param_hash) in enumerate(zip(combos, hashes))
+                   if param_hash in stored]
+        todo = [strategy_id for strategy_id, param_hash in enumerate(hashes) if param_hash not in stored]
+
+        if verbose and results:
+            print(f"   💾 Resuming: {len(results)}/{len(combos)} combinations already in results store")
+
+        return results, todo, hashes
+
+    def _calculate_metrics_batch(self, portfolio: vbt.Portfolio, n_columns: int) -> List[Dict]:
+        """
+        Column-wise version of _calculate_metrics for a multi-column portfolio
+
+        Computes every metric for all columns in one pass over the equity
+        matrix and trade records (see metrics_kernel). Falls back to
+        per-column extraction if the batch call fails.
+
+        Returns:
+            List of metric dicts, one per column
+        """
+        try:
+            metrics = portfolio_metrics(portfolio, default_freq='1D')
+
+            total_return = metrics['total_return'] * 100
+            sharpe = metrics['sharpe_ratio']
+            max_dd = metrics['max_drawdown'] * 100
+
+            num_trades = metrics['num_trades'].astype(int)
+            has_trades = num_trades > 0
+
+            win_rate = np.where(has_trades, metrics['win_rate'], 0)
+            profit_factor = np.where(has_trades, metrics['profit_factor'], 0)
+            avg_trade = np.where(has_trades, metrics['avg_trade'], 0)
+            trades_per_year = metrics['trades_per_year']
+
+            return [{
+                'total_return': float(total_return[i]),
+                'sharpe_ratio': float(sharpe[i]),
+                'max_drawdown': float(max_dd[i]),
+                'win_rate': float(win_rate[i]),
+                'num_trades': int(num_trades[i]),
+                'profit_factor': float(profit_factor[i]),
+                'avg_trade': float(avg_trade[i]),
+                'trades_per_year': float(trades_per_year[i])
+            } for i in range(n_columns)]
+        except Exception as e:
+            print(f"      Warning: Batch metrics calculation error: {e}, extracting per column")
+            return [self._calculate_metrics(portfolio[i]) for i in range(n_columns)]
+
     def _calculate_metrics(self, portfolio: vbt.Portfolio) -> Dict:
         """Calculate performance metrics from portfolio"""
         try:
@@ -476,6 +608,187 @@ class StrategyGenerator:
         print(f"📊 Filtered: {len(filtered)} / {len(results)} strategies passed criteria")
         return filtered
 
+    def _crypto_momentum_allocations(self,
+                                     prices: pd.DataFrame,
+                                     universe_type: str,
+                                     roc_period: int,
+                                     rebalance_dates: pd.DatetimeIndex,
+                                     n_positions: int) -> pd.DataFrame:
+        """
+        Vectorized allocation matrix for generate_crypto_momentum_strategies
+
+        Produces exactly the same allocations as _crypto_momentum_allocations_loop:
+        - ROC (or relative strength vs the first column) computed once for the panel
+        - Top-N taken at all eligible rebalance rows at once. A stable sort (NaN last)
+          keeps Series.nlargest tie order - first column wins - which argpartition
+          would not guarantee
+        - Holding between rebalances is a single forward-fill from anchor rows
+
+        Args:
+            prices: Crypto prices (columns = tickers)
+            universe_type: 'fixed', 'roc_momentum' or 'relative_strength'
+            roc_period: ROC lookback (bars)
+            rebalance_dates: Rebalance dates (empty = recompute every row, no holding)
+            n_positions: Number of positions (equal weight)
+
+        Returns:
+            Allocation DataFrame (same shape as prices)
+        """
+        if roc_period < 1:
+            # iloc[-roc_period] wraps around for non-positive lookbacks; keep loop semantics
+            return self._crypto_momentum_allocations_loop(prices, universe_type, roc_period,
+                                                          rebalance_dates, n_positions)
+
+        n_rows, n_cols = prices.shape
+        allocations = np.zeros((n_rows, n_cols))
+
+        if universe_type == 'fixed':
+            # Use first N columns (assumes prices sorted by importance)
+            n_universe = min(10, n_cols)
+        elif universe_type in ('roc_momentum', 'relative_strength'):
+            n_universe = n_cols
+        else:
+            n_universe = 0
+
+        if n_universe > 0 and n_rows > 0:
+            values = prices.values.astype(float)
+            rows = np.arange(n_rows)
+
+            # Rows where the loop computes a new selection
+            no_rebalance = len(rebalance_dates) == 0
+            is_rebalance = prices.index.isin(rebalance_dates)
+            eligible = (
+                (prices.index >= prices.index[0] + pd.Timedelta(days=roc_period)) &
+                (no_rebalance | is_rebalance) &
+                (rows + 1 >= roc_period)
+            )
+
+            # ROC over the whole panel: price[i] / price[i - roc_period + 1] - 1
+            lag = roc_period - 1
+            base = np.full_like(values, np.nan)
+            base[lag:] = values[:n_rows - lag]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                roc = values / base - 1
+                roc_filled = np.where(np.isnan(roc), 0.0, roc)
+
+                if universe_type == 'relative_strength':
+                    # Relative strength vs BTC (first column), BTC ROC not NaN-filled
+                    scores = roc_filled - roc[:, [0]]
+                else:
+                    scores = roc_filled[:, :n_universe]
+
+            scores = scores[eligible]
+            if len(scores) > 0 and n_positions > 0:
+                # Stable ranking: scores descending, ties by column order, NaN last
+                # (nlargest fills with NaN entries when fewer than N are valid)
+                is_nan = np.isnan(scores)
+                order = np.lexsort((-np.where(is_nan, 0.0, scores), is_nan), axis=1)
+                rank = np.empty_like(order)
+                np.put_along_axis(rank, order, np.arange(scores.shape[1])[None, :], axis=1)
+
+                selected = rank < n_positions
+                allocations[np.flatnonzero(eligible), :n_universe] = selected / n_positions
+
+            # Hold positions between rebalance dates (anchors = first row + rebalance rows)
+            if not no_rebalance:
+                anchors = is_rebalance.copy()
+                anchors[0] = True
+                anchor_rows = np.maximum.accumulate(np.where(anchors, rows, 0))
+                allocations = allocations[anchor_rows]
+
+        return pd.DataFrame(allocations, index=prices.index, columns=prices.columns)
+
+    def _crypto_momentum_allocations_loop(self,
+                                          prices: pd.DataFrame,
+                                          universe_type: str,
+                                          roc_period: int,
+                                          rebalance_dates: pd.DatetimeIndex,
+                                          n_positions: int) -> pd.DataFrame:
+        """Per-date reference implementation of _crypto_momentum_allocations"""
+        allocations = pd.DataFrame(0.0, index=prices.index, columns=prices.columns)
+
+        # Fixed universe (baseline)
+        if universe_type == 'fixed':
+            # Use top cryptos by market cap (BTC, ETH always included)
+            # For this test, use first N columns (assumes prices sorted by importance)
+            universe = prices.columns[:min(10, len(prices.columns))]
+            universe_prices = prices[universe]
+
+            for date in prices.index:
+                if date < prices.index[0] + pd.Timedelta(days=roc_period):
+                    continue
+
+                # Rebalance logic
+                if len(rebalance_dates) == 0 or date in rebalance_dates:
+                    # Calculate ROC
+                    price_slice = universe_prices.loc[:date]
+                    if len(price_slice) < roc_period:
+                        continue
+
+                    roc = (price_slice.iloc[-1] / price_slice.iloc[-roc_period] - 1).fillna(0)
+                    top_n = roc.nlargest(n_positions).index.tolist()
+
+                    # Equal weight allocation
+                    for ticker in top_n:
+                        allocations.loc[date, ticker] = 1.0 / n_positions
+
+        # Dynamic universe with ROC momentum
+        elif universe_type == 'roc_momentum':
+            for date in prices.index:
+                if date < prices.index[0] + pd.Timedelta(days=roc_period):
+                    continue
+
+                if len(rebalance_dates) == 0 or date in rebalance_dates:
+                    # Select from full universe
+                    price_slice = prices.loc[:date]
+                    if len(price_slice) < roc_period:
+                        continue
+
+                    roc = (price_slice.iloc[-1] / price_slice.iloc[-roc_period] - 1).fillna(0)
+                    top_n = roc.nlargest(n_positions).index.tolist()
+
+                    for ticker in top_n:
+                        allocations.loc[date, ticker] = 1.0 / n_positions
+
+        # Relative Strength
+        elif universe_type == 'relative_strength':
+            # Use BTC as benchmark (first column assumed to be BTC)
+            btc_prices = prices.iloc[:, 0]
+
+            for date in prices.index:
+                if date < prices.index[0] + pd.Timedelta(days=roc_period):
+                    continue
+
+                if len(rebalance_dates) == 0 or date in rebalance_dates:
+                    price_slice = prices.loc[:date]
+                    btc_slice = btc_prices.loc[:date]
+
+                    if len(price_slice) < roc_period:
+                        continue
+
+                    # Calculate relative strength vs BTC
+                    crypto_roc = (price_slice.iloc[-1] / price_slice.iloc[-roc_period] - 1).fillna(0)
+                    btc_roc = (btc_slice.iloc[-1] / btc_slice.iloc[-roc_period] - 1)
+                    relative_strength = crypto_roc - btc_roc
+
+                    top_n = relative_strength.nlargest(n_positions).index.tolist()
+
+                    for ticker in top_n:
+                        allocations.loc[date, ticker] = 1.0 / n_positions
+
+        # Hold positions between rebalance dates
+        last_allocation = None
+        for date in prices.index:
+            if len(rebalance_dates) == 0:
+                break  # No rebalancing, keep daily updates
+
+            if date in rebalance_dates or last_allocation is None:
+                last_allocation = allocations.loc[date].copy()
+            else:
+                allocations.loc[date] = last_allocation
+
+        return allocations
+
     def generate_crypto_momentum_strategies(self,
                                            prices: pd.DataFrame,
                                            universe_type: str = 'fixed',
@@ -539,128 +852,83 @@ class StrategyGenerator:
             else:
                 return pd.date_range(start=prices.index[0], end=prices.index[-1], freq='QS-JAN')
 
-        for roc_period, rebal_freq, n_positions in product(roc_periods, rebalance_freq, num_positions):
-            try:
-                # Generate allocations
-                allocations = pd.DataFrame(0.0, index=prices.index, columns=prices.columns)
-                rebalance_dates = get_rebalance_dates(rebal_freq)
-
-                # Fixed universe (baseline)
-                if universe_type == 'fixed':
-                    # Use top cryptos by market cap (BTC, ETH always included)
-                    # For this test, use first N columns (assumes prices sorted by importance)
-                    universe = prices.columns[:min(10, len(prices.columns))]
-                    universe_prices = prices[universe]
-
-                    for date in prices.index:
-                        if date < prices.index[0] + pd.Timedelta(days=roc_period):
-                            continue
-
-                        # Rebalance logic
-                        if len(rebalance_dates) == 0 or date in rebalance_dates:
-                            # Calculate ROC
-                            price_slice = universe_prices.loc[:date]
-                            if len(price_slice) < roc_period:
-                                continue
-
-                            roc = (price_slice.iloc[-1] / price_slice.iloc[-roc_period] - 1).fillna(0)
-                            top_n = roc.nlargest(n_positions).index.tolist()
-
-                            # Equal weight allocation
-                            for ticker in top_n:
-                                allocations.loc[date, ticker] = 1.0 / n_positions
-
-                # Dynamic universe with ROC momentum
-                elif universe_type == 'roc_momentum':
-                    for date in prices.index:
-                        if date < prices.index[0] + pd.Timedelta(days=roc_period):
-                            continue
-
-                        if len(rebalance_dates) == 0 or date in rebalance_dates:
-                            # Select from full universe
-                            price_slice = prices.loc[:date]
-                            if len(price_slice) < roc_period:
-                                continue
-
-                            roc = (price_slice.iloc[-1] / price_slice.iloc[-roc_period] - 1).fillna(0)
-                            top_n = roc.nlargest(n_positions).index.tolist()
-
-                            for ticker in top_n:
-                                allocations.loc[date, ticker] = 1.0 / n_positions
-
-                # Relative Strength
-                elif universe_type == 'relative_strength':
-                    # Use BTC as benchmark (first column assumed to be BTC)
-                    btc_prices = prices.iloc[:, 0]
-
-                    for date in prices.index:
-                        if date < prices.index[0] + pd.Timedelta(days=roc_period):
-                            continue
-
-                        if len(rebalance_dates) == 0 or date in rebalance_dates:
-                            price_slice = prices.loc[:date]
-                            btc_slice = btc_prices.loc[:date]
-
-                            if len(price_slice) < roc_period:
-                                continue
-
-                            # Calculate relative strength vs BTC
-                            crypto_roc = (price_slice.iloc[-1] / price_slice.iloc[-roc_period] - 1).fillna(0)
-                            btc_roc = (btc_slice.iloc[-1] / btc_slice.iloc[-roc_period] - 1)
-                            relative_strength = crypto_roc - btc_roc
-
-                            top_n = relative_strength.nlargest(n_positions).index.tolist()
-
-                            for ticker in top_n:
-                                allocations.loc[date, ticker] = 1.0 / n_positions
-
-                # Hold positions between rebalance dates
-                last_allocation = None
-                for date in prices.index:
-                    if len(rebalance_dates) == 0:
-                        break  # No rebalancing, keep daily updates
-
-                    if date in rebalance_dates or last_allocation is None:
-                        last_allocation = allocations.loc[date].copy()
+        combos = [{
+            'type': f'Crypto_{universe_type}',
+            'roc_period': roc_period,
+            'rebalance_freq': rebal_freq,
+            'num_positions': n_positions,
+            'universe_type': universe_type
+        } for roc_period, rebal_freq, n_positions in product(roc_periods, rebalance_freq, num_positions)]
+
+        store = self.results_store
+        stored = {}
+        if store is not None:
+            context = self._store_context(prices)
+            hashes = [store.param_hash(params, context) for params in combos]
+            stored = store.get(hashes)
+            if verbose and stored:
+                print(f"   💾 Resuming: {len(stored)}/{len(combos)} combinations already in results store")
+
+        try:
+            for combo_index, params in enumerate(combos):
+                roc_period = params['roc_period']
+                rebal_freq = params['rebalance_freq']
+                n_positions = params['num_positions']
+
+                if store is not None and hashes[combo_index] in stored:
+                    results.append(StrategyResult(strategy_id=strategy_id, params=params,
+                                                  **stored[hashes[combo_index]]))
+                    strategy_id += 1
+                    continue
+
+                try:
+                    rebalance_dates = get_rebalance_dates(rebal_freq)
+
+                    # Generate allocations (grid_mode=False keeps the per-date loop)
+                    if self.grid_mode:
+                        allocations = self._crypto_momentum_allocations(
+                            prices, universe_type, roc_period, rebalance_dates, n_positions
+                        )
                     else:
-                        allocations.loc[date] = last_allocation
-
-                # Backtest with vectorbt
-                # FIXED: Use 'targetpercent' for rebalancing portfolios
-                # This tells vectorbt the TARGET allocation, so it automatically rebalances
-                # Bug was: size_type='amount' doesn't trigger rebalancing
-                portfolio = vbt.Portfolio.from_orders(
-                    close=prices,
-                    size=allocations,  # Use allocations directly (0.0-1.0)
-                    size_type='targetpercent',
-                    init_cash=self.initial_capital,
-                    fees=self.commission,
-                    freq='1D'
-                )
-
-                # Calculate metrics
-                metrics = self._calculate_metrics(portfolio)
-
-                results.append(StrategyResult(
-                    strategy_id=strategy_id,
-                    params={
-                        'type': f'Crypto_{universe_type}',
-                        'roc_period': roc_period,
-                        'rebalance_freq': rebal_freq,
-                        'num_positions': n_positions,
-                        'universe_type': universe_type
-                    },
-                    **metrics
-                ))
-
-                strategy_id += 1
-
-            except Exception as e:
-                if verbose:
-                    print(f"   ⚠️ Failed combo: roc={roc_period}, freq={rebal_freq}, n={n_positions}: {e}")
-                continue
-
-        df_results = pd.DataFrame([vars(r) for r in results])
+                        allocations = self._crypto_momentum_allocations_loop(
+                            prices, universe_type, roc_period, rebalance_dates, n_positions
+                        )
+
+                    # Backtest with vectorbt
+                    # FIXED: Use 'targetpercent' for rebalancing portfolios
+                    # This tells vectorbt the TARGET allocation, so it automatically rebalances
+                    # Bug was: size_type='amount' doesn't trigger rebalancing
+                    portfolio = vbt.Portfolio.from_orders(
+                        close=prices,
+                        size=allocations,  # Use allocations directly (0.0-1.0)
+                        size_type='targetpercent',
+                        init_cash=self.initial_capital,
+                        fees=self.commission,
+                        freq='1D'
+                    )
+
+                    # Calculate metrics
+                    metrics = self._calculate_metrics(portfolio)
+
+                    results.append(StrategyResult(
+                        strategy_id=strategy_id,
+                        params=params,
+                        **metrics
+                    ))
+                    if store is not None:
+                        store.add(hashes[combo_index], context, strategy_id, params, metrics)
+
+                    strategy_id += 1
+
+                except Exception as e:
+                    if verbose:
+                        print(f"   ⚠️ Failed combo: roc={roc_period}, freq={rebal_freq}, n={n_positions}: {e}")
+                    continue
+        finally:
+            if store is not None:
+                store.flush()
+
+        df_results = pd.DataFrame([vars(r) for r in results], columns=RESULT_COLUMNS)
         df_results = df_results.sort_values('sharpe_ratio', ascending=False)
 
         if verbose:
@@ -11,15 +11,42 @@ Expected improvement: +5-15% over single methods
 Formula:
     hybrid_score = 0.7 × normalized_tqs + 0.3 × normalized_xgb
 
+Performance:
+- With parallel=True, TQS (main process) and XGBoost walk-forward (worker
+  process) run concurrently; scripts opting in need an if __name__ == '__main__' guard
+- Each component's score matrix is cached per input data, so re-weighting
+  (e.g. changing tqs_weight) or repeated rank_stocks() calls only re-blend
+
 Author: Strategy Factory
 """
 
+import json
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 
 from strategy_factory.performance_qualifiers import PerformanceQualifier, TrendQualityScore
 from strategy_factory.ml_xgboost import XGBoostQualifier
+from strategy_factory.model_cache import fingerprint_data
+
+
+def _score_xgb_component(xgb_qualifier: XGBoostQualifier, prices: pd.DataFrame,
+                         spy_prices: Optional[pd.Series], volumes: Optional[pd.DataFrame],
+                         sector_prices: Optional[pd.DataFrame],
+                         kwargs: Dict) -> Tuple[pd.DataFrame, Optional[pd.Series], list]:
+    """
+    Worker-process entry point: run XGBoost walk-forward scoring
+
+    Module-level so it can be pickled by ProcessPoolExecutor. Returns the
+    training state the parent needs, since the worker's qualifier copy is discarded.
+    kwargs are the extra calculate() arguments (same as the sequential path).
+
+    Returns:
+        Tuple of (scores, feature_importance, trained_dates)
+    """
+    scores = xgb_qualifier.calculate(prices, spy_prices, volumes, sector_prices, **kwargs)
+    return scores, xgb_qualifier.feature_importance, xgb_qualifier.trained_dates
 
 
 class HybridQualifier(PerformanceQualifier):
@@ -42,7 +69,8 @@ class HybridQualifier(PerformanceQualifier):
                  xgb_weight: float = 0.3,
                  tqs_params: Optional[Dict] = None,
                  xgb_params: Optional[Dict] = None,
-                 sector_prices: Optional[pd.DataFrame] = None):
+                 sector_prices: Optional[pd.DataFrame] = None,
+                 parallel: bool = False):
         """
         Initialize Hybrid Qualifier
 
@@ -52,6 +80,8 @@ class HybridQualifier(PerformanceQualifier):
             tqs_params: Parameters for TQS qualifier (optional)
             xgb_params: Parameters for XGBoost qualifier (optional)
             sector_prices: Sector ETF prices for XGBoost features (optional)
+            parallel: Run XGBoost in a worker process while TQS runs (default: False).
+                      Model-cache hit stats from the worker are not reported back
         """
         super().__init__(
             name="Hybrid TQS + XGBoost",
@@ -61,6 +91,10 @@ class HybridQualifier(PerformanceQualifier):
         self.tqs_weight = tqs_weight
         self.xgb_weight = xgb_weight
         self.sector_prices = sector_prices
+        self.parallel = parallel
+
+        # Per-component score matrices, keyed by input data + component params
+        self._component_cache: Dict[str, pd.DataFrame] = {}
 
         # Initialize TQS qualifier
         tqs_defaults = {'ma_period': 100, 'atr_period': 14, 'adx_period': 25}
@@ -88,10 +122,12 @@ class HybridQualifier(PerformanceQualifier):
         Calculate hybrid scores combining TQS and XGBoost
 
         Steps:
-        1. Calculate TQS scores (ATR-based)
-        2. Calculate XGBoost scores (ML predictions)
-        3. Normalize both to 0-1 range per date
-        4. Combine: 70% TQS + 30% XGBoost
+        1. Calculate TQS scores (ATR-based) and XGBoost scores (ML predictions)
+           concurrently, or reuse cached component matrices for the same data
+        2. Normalize both to 0-1 range per date
+        3. Combine: 70% TQS + 30% XGBoost
+
+        Changing tqs_weight/xgb_weight between calls only re-blends.
 
         Args:
             prices: Stock prices (DataFrame)
@@ -102,55 +138,149 @@ class HybridQualifier(PerformanceQualifier):
         Returns:
             DataFrame with hybrid scores
         """
-        print("   [HYBRID] Calculating TQS scores...")
-        tqs_scores = self.tqs_qualifier.calculate(prices, **kwargs)
+        tqs_key, xgb_key = self._component_keys(prices, spy_prices, volumes, kwargs)
+        tqs_scores = self._component_cache.get(tqs_key)
+        xgb_scores = self._component_cache.get(xgb_key)
 
-        print("   [HYBRID] Calculating XGBoost scores...")
-        xgb_scores = self.xgb_qualifier.calculate(
-            prices, spy_prices, volumes, self.sector_prices, **kwargs
-        )
+        if tqs_scores is not None and xgb_scores is not None:
+            print("   [HYBRID] Using cached TQS + XGBoost scores")
+        else:
+            tqs_scores, xgb_scores = self._score_components(prices, spy_prices, volumes,
+                                                            tqs_scores, xgb_scores, **kwargs)
+            self._component_cache[tqs_key] = tqs_scores
+            self._component_cache[xgb_key] = xgb_scores
+
+        print(f"   [HYBRID] Combining scores ({self.tqs_weight:.0%} TQS + {self.xgb_weight:.0%} XGBoost)...")
+        hybrid_scores = self.blend(tqs_scores, xgb_scores, prices.index, prices.columns)
+
+        print(f"   [HYBRID] Hybrid scores calculated ({self.tqs_weight:.0%} TQS + {self.xgb_weight:.0%} XGBoost)")
+
+        return hybrid_scores
+
+    def _component_keys(self, prices: pd.DataFrame, spy_prices: Optional[pd.Series],
+                        volumes: Optional[pd.DataFrame], kwargs: Dict) -> Tuple[str, str]:
+        """
+        Build cache keys for the TQS and XGBoost score matrices
+
+        Weights are deliberately excluded: they only affect the blend. The
+        extra calculate() kwargs are passed to both components, so both keys
+        include them.
+        """
+        tqs_params = {'ma_period': self.tqs_qualifier.ma_period,
+                      'atr_period': self.tqs_qualifier.atr_period,
+                      'adx_period': self.tqs_qualifier.adx_period}
+        xgb = self.xgb_qualifier
+        xgb_params = {**xgb.model_params, **xgb.label_params,
+                      'lookback_years': xgb.lookback_years, 'retrain_freq': xgb.retrain_freq,
+                      'incremental': xgb.incremental, 'incremental_rounds': xgb.incremental_rounds,
+                      'full_refit_every': xgb.full_refit_every}
+
+        kwargs_key = fingerprint_data(*[item for key in sorted(kwargs) for item in (key, kwargs[key])])
+
+        tqs_key = f"tqs:{fingerprint_data(prices)}:{json.dumps(tqs_params, sort_keys=True)}:{kwargs_key}"
+        xgb_key = (f"xgb:{fingerprint_data(prices, spy_prices, volumes, self.sector_prices)}:"
+                   f"{json.dumps(xgb_params, sort_keys=True, default=str)}:{kwargs_key}")
+        return tqs_key, xgb_key
+
+    def _score_components(self, prices: pd.DataFrame, spy_prices: Optional[pd.Series],
+                          volumes: Optional[pd.DataFrame],
+                          tqs_scores: Optional[pd.DataFrame],
+                          xgb_scores: Optional[pd.DataFrame],
+                          **kwargs) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Compute whichever component score matrices are missing
+
+        With parallel=True, XGBoost (CPU-heavy walk-forward training) runs in
+        a worker process while TQS is computed in this process, falling back
+        to sequential scoring if the worker cannot be started.
+        """
+        future = None
+        executor = None
+
+        if xgb_scores is None and self.parallel:
+            try:
+                executor = ProcessPoolExecutor(max_workers=1)
+                future = executor.submit(_score_xgb_component, self.xgb_qualifier,
+                                         prices, spy_prices, volumes, self.sector_prices, kwargs)
+                print("   [HYBRID] Calculating XGBoost scores (worker process)...")
+            except (OSError, RuntimeError) as e:
+                print(f"   [HYBRID] WARNING: Could not start worker ({e}), scoring sequentially")
+                if executor is not None:
+                    executor.shutdown(wait=False)
+                executor = None
+
+        try:
+            if tqs_scores is None:
+                print("   [HYBRID] Calculating TQS scores...")
+                tqs_scores = self.tqs_qualifier.calculate(prices, **kwargs)
+
+            if future is not None:
+                try:
+                    xgb_scores, feature_importance, trained_dates = future.result()
+                    self.xgb_qualifier.feature_importance = feature_importance
+                    self.xgb_qualifier.trained_dates = trained_dates
+                except Exception as e:
+                    print(f"   [HYBRID] WARNING: XGBoost worker failed ({e}), scoring sequentially")
+                    xgb_scores = None
+
+            if xgb_scores is None:
+                print("   [HYBRID] Calculating XGBoost scores...")
+                xgb_scores = self.xgb_qualifier.calculate(
+                    prices, spy_prices, volumes, self.sector_prices, **kwargs
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
         # Copy feature importance from XGBoost
         if hasattr(self.xgb_qualifier, 'feature_importance'):
             self.feature_importance = self.xgb_qualifier.feature_importance
 
-        print("   [HYBRID] Combining scores (70% TQS + 30% XGBoost)...")
-
-        # Normalize scores to 0-1 range per date (percentile ranking)
-        hybrid_scores = pd.DataFrame(index=prices.index, columns=prices.columns)
+        return tqs_scores, xgb_scores
 
-        for date in prices.index:
-            if date not in tqs_scores.index or date not in xgb_scores.index:
-                continue
+    def blend(self, tqs_scores: pd.DataFrame, xgb_scores: pd.DataFrame,
+              index: Optional[pd.Index] = None, columns: Optional[pd.Index] = None) -> pd.DataFrame:
+        """
+        Blend component scores using per-date percentile ranks
 
-            tqs_row = tqs_scores.loc[date]
-            xgb_row = xgb_scores.loc[date]
+        For each date, stocks with both scores available are ranked (0-1)
+        within each component and combined with the current weights. Dates
+        with fewer than 2 such stocks are left NaN.
 
-            # Get valid scores (not NaN)
-            valid_stocks = tqs_row.notna() & xgb_row.notna()
+        Args:
+            tqs_scores: TQS score matrix
+            xgb_scores: XGBoost score matrix
+            index: Output dates (default: TQS index)
+            columns: Output tickers (default: TQS columns)
 
-            if valid_stocks.sum() < 2:
-                # Not enough stocks to rank
-                continue
+        Returns:
+            DataFrame with hybrid scores
+        """
+        index = tqs_scores.index if index is None else index
+        columns = tqs_scores.columns if columns is None else columns
 
-            # Normalize to percentile (0-1)
-            tqs_normalized = tqs_row[valid_stocks].rank(pct=True)
-            xgb_normalized = xgb_row[valid_stocks].rank(pct=True)
+        tqs = tqs_scores.reindex(index=index, columns=columns).astype(float)
+        xgb = xgb_scores.reindex(index=index, columns=columns).astype(float)
 
-            # Weighted combination
-            hybrid_row = (self.tqs_weight * tqs_normalized +
-                         self.xgb_weight * xgb_normalized)
+        # Valid stocks (both scores present) on dates with enough stocks to rank
+        valid = tqs.notna() & xgb.notna()
+        valid &= (valid.sum(axis=1) >= 2).values[:, None]
 
-            hybrid_scores.loc[date, valid_stocks] = hybrid_row
+        # Normalize to percentile (0-1) among valid stocks, then weighted combination
+        tqs_normalized = tqs.where(valid).rank(axis=1, pct=True)
+        xgb_normalized = xgb.where(valid).rank(axis=1, pct=True)
 
-        print(f"   [HYBRID] Hybrid scores calculated ({self.tqs_weight:.0%} TQS + {self.xgb_weight:.0%} XGBoost)")
+        return self.tqs_weight * tqs_normalized + self.xgb_weight * xgb_normalized
 
-        return hybrid_scores
+    def clear_cache(self) -> None:
+        """Drop cached component score matrices"""
+        self._component_cache.clear()
 
 
 def get_hybrid_qualifier(tqs_weight: float = 0.7,
                          xgb_weight: float = 0.3,
                          sector_prices: Optional[pd.DataFrame] = None,
+                         parallel: bool = False,
                          **kwargs) -> HybridQualifier:
     """
     Factory function for Hybrid Qualifier
@@ -159,6 +289,7 @@ def get_hybrid_qualifier(tqs_weight: float = 0.7,
         tqs_weight: Weight for TQS (default: 0.7)
         xgb_weight: Weight for XGBoost (default: 0.3)
         sector_prices: Sector ETF prices (optional)
+        parallel: Score XGBoost in a worker process concurrently with TQS (default: False)
         **kwargs: Additional parameters split for TQS and XGBoost
 
     Returns:
@@ -173,7 +304,8 @@ def get_hybrid_qualifier(tqs_weight: float = 0.7,
             tqs_params[key] = value
         elif key in ['n_estimators', 'max_depth', 'learning_rate', 'subsample',
                      'colsample_bytree', 'gamma', 'reg_alpha', 'reg_lambda',
-                     'lookback_years', 'retrain_freq']:
+                     'lookback_years', 'retrain_freq', 'model_cache', 'feature_store',
+                     'incremental', 'incremental_rounds', 'full_refit_every']:
             xgb_params[key] = value
 
     return HybridQualifier(
@@ -181,7 +313,8 @@ def get_hybrid_qualifier(tqs_weight: float = 0.7,
         xgb_weight=xgb_weight,
         tqs_params=tqs_params,
         xgb_params=xgb_params,
-        sector_prices=sector_prices
+        sector_prices=sector_prices,
+        parallel=parallel
     )
 
 
@@ -0,0 +1,135 @@
+"""
+Indicator Table - Precomputed indicators shared across a parameter grid
+
+Parameter sweeps and genetic optimization evaluate hundreds of combinations
+on the same close series, and every combination used to recompute its
+indicators from scratch (pd.Series(close).rolling(period).mean() per SMA).
+
+IndicatorTable computes each indicator once and serves lookups:
+- SMA, EMA, RSI, MACD: banks keyed by period, computed on first use with
+  the same pandas calls, so values (and crossover ties on flat price
+  segments) are bit-identical to the per-combination code
+
+Example:
+    table = IndicatorTable(df['close'].values)
+    fast = table.sma(10)
+    slow = table.sma(50)
+    rsi = table.rsi(14)
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Tuple
+
+
+class IndicatorTable:
+    """
+    Cached indicator lookups for a single close series
+
+    All indicators are returned as numpy arrays aligned to close (NaN during
+    warm-up), matching the pandas implementations used by StrategyGenerator
+    and StrategyOptimizer.
+    """
+
+    def __init__(self, close):
+        """
+        Initialize indicator table
+
+        Args:
+            close: Close prices (numpy array or pandas Series)
+        """
+        self.close = np.asarray(close, dtype=float)
+
+        self._sma: Dict[int, np.ndarray] = {}
+        self._ema: Dict[int, np.ndarray] = {}
+        self._rsi: Dict[int, np.ndarray] = {}
+        self._macd: Dict[Tuple[int, int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def sma(self, period: int) -> np.ndarray:
+        """
+        Simple moving average (pandas rolling(period).mean())
+
+        Windows containing NaN are NaN. A global cumulative-sum difference
+        would be O(n) for every window too, but it is not bit-identical to
+        pandas: flat segments where fast and slow SMAs tie exactly would gain
+        or lose crossovers.
+
+        Args:
+            period: Window length (bars)
+
+        Returns:
+            SMA array aligned to close
+        """
+        period = int(period)
+        if period not in self._sma:
+            self._sma[period] = pd.Series(self.close).rolling(period).mean().values
+        return self._sma[period]
+
+    def ema(self, span: int) -> np.ndarray:
+        """
+        Exponential moving average (pandas ewm(span, adjust=False))
+
+        Args:
+            span: EMA span (bars)
+
+        Returns:
+            EMA array aligned to close
+        """
+        span = int(span)
+        if span not in self._ema:
+            self._ema[span] = pd.Series(self.close).ewm(span=span, adjust=False).mean().values
+        return self._ema[span]
+
+    def rsi(self, period: int) -> np.ndarray:
+        """
+        RSI with simple moving averages of gains/losses
+
+        Same formula as StrategyGenerator._calculate_rsi / StrategyOptimizer._calculate_rsi.
+
+        Args:
+            period: RSI period (bars)
+
+        Returns:
+            RSI array aligned to close
+        """
+        period = int(period)
+        if period not in self._rsi:
+            delta = pd.Series(self.close).diff()
+
+            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+
+            rs = gain / loss
+            self._rsi[period] = (100 - (100 / (1 + rs))).values
+        return self._rsi[period]
+
+    def macd(self, fast: int, slow: int, signal: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        MACD line and signal line from the EMA bank
+
+        Args:
+            fast: Fast EMA span
+            slow: Slow EMA span
+            signal: Signal line span
+
+        Returns:
+            Tuple of (macd_line, signal_line)
+        """
+        key = (int(fast), int(slow), int(signal))
+        if key not in self._macd:
+            macd_line = self.ema(key[0]) - self.ema(key[1])
+            signal_line = pd.Series(macd_line).ewm(span=key[2], adjust=False).mean().values
+            self._macd[key] = (macd_line, signal_line)
+        return self._macd[key]
+
+    def cache_info(self) -> Dict[str, int]:
+        """Number of cached entries per indicator bank"""
+        return {
+            'sma': len(self._sma),
+            'ema': len(self._ema),
+            'rsi': len(self._rsi),
+            'macd': len(self._macd)
+        }
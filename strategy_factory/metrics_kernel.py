@@ -0,0 +1,212 @@
+"""
+Metrics Kernel - Batch performance metrics from equity and trade arrays
+
+Scoring thousands of combinations through separate vectorbt accessor calls
+(total_return(), sharpe_ratio(), max_drawdown(), trades.win_rate(), ...)
+re-derives returns and re-groups trade records for every metric. This
+kernel takes the equity matrix and the trade records arrays once and
+computes all metrics for all columns in a few NumPy passes.
+
+Definitions match vectorbt:
+- total_return: final value / init cash - 1
+- sharpe_ratio: mean / std (ddof=1) of bar returns x sqrt(ann_factor),
+  first bar's return measured against init cash (inf if std is 0, NaN
+  with fewer than 2 bars)
+- max_drawdown: worst drop from the running peak, init cash included as
+  the starting peak (<= 0)
+- win_rate, profit_factor, avg_trade: from trade PnL per column
+  (open trades included, as in portfolio.trades)
+
+Example:
+    portfolio = vbt.Portfolio.from_signals(close, entries_2d, exits_2d)
+    metrics = portfolio_metrics(portfolio)
+    metrics['sharpe_ratio']  # one value per column
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Union
+
+
+# vectorbt's default year length for annualization
+YEAR_FREQ = pd.Timedelta(days=365)
+
+
+def annualization_factor(freq: Union[str, pd.Timedelta, None] = None, default_freq: str = '1D') -> float:
+    """
+    Bars per year for a bar frequency (365 for '1D', 105120 for '5min')
+
+    Args:
+        freq: Bar frequency (None = default_freq)
+        default_freq: Frequency used when freq is None
+
+    Returns:
+        Annualization factor
+    """
+    return YEAR_FREQ / pd.Timedelta(freq if freq is not None else default_freq)
+
+
+def sharpe_ratio(value: np.ndarray, init_cash, ann_factor: float) -> np.ndarray:
+    """
+    Annualized Sharpe ratio per column from an equity matrix
+
+    Args:
+        value: Equity curve (bars x columns, or 1-D)
+        init_cash: Initial cash (scalar or per column)
+        ann_factor: Bars per year
+
+    Returns:
+        Sharpe ratio per column (inf where std is 0, as in vectorbt)
+    """
+    value = _as_2d(value)
+    return _sharpe(_bar_returns(value, _init_row(init_cash, value.shape[1])), ann_factor)
+
+
+def max_drawdown(value: np.ndarray, init_cash) -> np.ndarray:
+    """
+    Maximum drawdown per column from an equity matrix
+
+    Args:
+        value: Equity curve (bars x columns, or 1-D)
+        init_cash: Initial cash (scalar or per column), the starting peak
+
+    Returns:
+        Max drawdown per column as a fraction (<= 0)
+    """
+    value = _as_2d(value)
+    return _max_drawdown(value, _init_row(init_cash, value.shape[1]))
+
+
+def compute_metrics(value: np.ndarray,
+                    init_cash,
+                    trade_col: np.ndarray,
+                    trade_pnl: np.ndarray,
+                    ann_factor: float,
+                    trade_group: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Compute all strategy metrics for every column
+
+    Args:
+        value: Equity curve (bars x columns/groups, or 1-D)
+        init_cash: Initial cash (scalar or per column/group)
+        trade_col: Column index of each trade record
+        trade_pnl: PnL of each trade record
+        ann_factor: Bars per year (for Sharpe)
+        trade_group: Optional column -> group map for grouped portfolios
+                     (trade metrics aggregated per group)
+
+    Returns:
+        Dict of arrays (one value per column/group): total_return, sharpe_ratio,
+        max_drawdown (fractions, not %), num_trades, win_rate, profit_factor,
+        avg_trade, trades_per_year
+    """
+    value = _as_2d(value)
+    n_bars, n_columns = value.shape
+    init_row = _init_row(init_cash, n_columns)
+
+    # Equity metrics
+    with np.errstate(divide='ignore', invalid='ignore'):
+        total_return = value[-1] / init_row - 1 if n_bars > 0 else np.zeros(n_columns)
+
+        sharpe = _sharpe(_bar_returns(value, init_row), ann_factor)
+        drawdown = _max_drawdown(value, init_row)
+
+    # Trade metrics (bincount over column ids = one pass per statistic)
+    trade_col = np.asarray(trade_col, dtype=np.int64)
+    trade_pnl = np.asarray(trade_pnl, dtype=float)
+    if trade_group is not None:
+        trade_col = np.asarray(trade_group, dtype=np.int64)[trade_col]
+
+    num_trades = np.bincount(trade_col, minlength=n_columns)[:n_columns]
+    wins = trade_pnl > 0
+    losses = trade_pnl < 0
+    n_wins = np.bincount(trade_col[wins], minlength=n_columns)[:n_columns]
+    gross_win = np.bincount(trade_col[wins], weights=trade_pnl[wins], minlength=n_columns)[:n_columns]
+    gross_loss = np.bincount(trade_col[losses], weights=trade_pnl[losses], minlength=n_columns)[:n_columns]
+    pnl_sum = np.bincount(trade_col, weights=trade_pnl, minlength=n_columns)[:n_columns]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        win_rate = n_wins / num_trades
+        profit_factor = gross_win / np.abs(gross_loss)
+        avg_trade = pnl_sum / num_trades
+
+    trades_per_year = num_trades / (n_bars / 252) if n_bars > 0 else np.zeros(n_columns)
+
+    return {
+        'total_return': total_return,
+        'sharpe_ratio': sharpe,
+        'max_drawdown': drawdown,
+        'num_trades': num_trades,
+        'win_rate': win_rate,
+        'profit_factor': profit_factor,
+        'avg_trade': avg_trade,
+        'trades_per_year': trades_per_year
+    }
+
+
+def portfolio_metrics(portfolio, freq: Union[str, pd.Timedelta, None] = None,
+                      default_freq: str = '1D') -> Dict[str, np.ndarray]:
+    """
+    Compute all metrics for a (multi-column or grouped) vectorbt Portfolio
+
+    Pulls value(), init_cash and the trade records out of the portfolio once
+    and runs compute_metrics on them.
+
+    Args:
+        portfolio: vbt.Portfolio
+        freq: Bar frequency for Sharpe (default: portfolio index freq, else default_freq)
+        default_freq: Fallback frequency when the portfolio has none (default: '1D')
+
+    Returns:
+        Dict of metric arrays (one value per column, or per group if grouped)
+    """
+    wrapper = portfolio.wrapper
+    if freq is None:
+        freq = wrapper.freq
+
+    records = portfolio.trades.values
+    trade_group = None
+    if wrapper.grouper.is_grouped():
+        trade_group = wrapper.grouper.get_groups()
+
+    return compute_metrics(
+        value=np.asarray(portfolio.value(), dtype=float),
+        init_cash=np.asarray(portfolio.init_cash, dtype=float),
+        trade_col=records['col'],
+        trade_pnl=records['pnl'],
+        ann_factor=annualization_factor(freq, default_freq),
+        trade_group=trade_group
+    )
+
+
+def _as_2d(value: np.ndarray) -> np.ndarray:
+    value = np.asarray(value, dtype=float)
+    return value[:, None] if value.ndim == 1 else value
+
+
+def _init_row(init_cash, n_columns: int) -> np.ndarray:
+    return np.broadcast_to(np.asarray(init_cash, dtype=float).reshape(-1), (n_columns,)).astype(float)
+
+
+def _bar_returns(value: np.ndarray, init_row: np.ndarray) -> np.ndarray:
+    """Bar-to-bar returns, first bar measured against init cash"""
+    prev = np.vstack([init_row[None, :], value[:-1]])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return value / prev - 1
+
+
+def _max_drawdown(value: np.ndarray, init_row: np.ndarray) -> np.ndarray:
+    """Worst drop from the running peak (init cash is the first peak)"""
+    peaks = np.fmax.accumulate(np.vstack([init_row[None, :], value]), axis=0)[1:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.minimum(np.nanmin(value / peaks - 1, axis=0, initial=0.0), 0.0)
+
+
+def _sharpe(returns: np.ndarray, ann_factor: float) -> np.ndarray:
+    """Column-wise Sharpe with vectorbt's edge cases (std 0 -> inf, < 2 bars -> NaN)"""
+    if returns.shape[0] < 2:
+        return np.full(returns.shape[1], np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.nanmean(returns, axis=0)
+        std = np.nanstd(returns, axis=0, ddof=1)
+        return np.where(std == 0, np.inf, mean / std * np.sqrt(ann_factor))
@@ -8,6 +8,7 @@ stock outperformance for the Nick Radge momentum strategy.
 Author: Strategy Factory
 """
 
+import copy
 import pandas as pd
 import numpy as np
 from typing import Dict, Optional, Tuple
@@ -17,6 +18,9 @@ from sklearn.model_selection import TimeSeriesSplit
 import warnings
 warnings.filterwarnings('ignore')
 
+from strategy_factory.model_cache import ModelCache, fingerprint_data, get_model_cache
+from strategy_factory.feature_store import FeatureStore, get_feature_store
+
 
 class MLQualifier:
     """
@@ -38,13 +42,18 @@ class MLQualifier:
     - Predicts next quarter's relative performance
     """
 
+    # Bump whenever engineer_features() changes so stored feature sets are rebuilt
+    FEATURE_SET_VERSION = 'v2'
+
     def __init__(self,
                  lookback_years: int = 3,
                  n_estimators: int = 200,  # INCREASED: More trees for better learning
                  max_depth: int = 15,       # INCREASED: Deeper trees for complex patterns
                  min_samples_split: int = 30,  # DECREASED: Less conservative
                  random_state: int = 42,
-                 retrain_freq: str = 'QS'):
+                 retrain_freq: str = 'QS',
+                 model_cache=None,
+                 feature_store=None):
         """
         Initialize ML Qualifier
 
@@ -55,6 +64,10 @@ class MLQualifier:
             min_samples_split: Minimum samples for split (default: 50)
             random_state: Random seed for reproducibility (default: 42)
             retrain_freq: Retraining frequency ('QS' = quarterly)
+            model_cache: ModelCache or cache directory to reuse trained models
+                         across runs (default: None = always retrain)
+            feature_store: FeatureStore or store directory to read engineered
+                           features from disk (default: None = always rebuild)
         """
         self.name = "ML Random Forest Qualifier"
         self.lookback_years = lookback_years
@@ -72,10 +85,16 @@ class MLQualifier:
             'class_weight': 'balanced'  # Handle class imbalance
         }
 
+        # Label construction (part of the model cache key)
+        self.label_params = {'forward_periods': 63, 'top_quantile': 0.80}
+
         self.model = None
         self.scaler = StandardScaler()
         self.feature_importance = None
         self.trained_dates = []
+        self.model_cache: Optional[ModelCache] = get_model_cache(model_cache)
+        self._last_model_key = None
+        self.feature_store: Optional[FeatureStore] = get_feature_store(feature_store)
 
     def engineer_features(self, prices: pd.DataFrame, spy_prices: Optional[pd.Series] = None,
                          volumes: Optional[pd.DataFrame] = None,
@@ -255,13 +274,15 @@ class MLQualifier:
         else:
             return pd.DataFrame()
 
-    def create_training_labels(self, prices: pd.DataFrame, forward_periods: int = 63) -> pd.DataFrame:
+    def create_training_labels(self, prices: pd.DataFrame, forward_periods: int = 63,
+                               top_quantile: float = 0.80) -> pd.DataFrame:
         """
         Create training labels: 1 if stock is in top 20% of forward returns, 0 otherwise
 
         Args:
             prices: Stock prices
             forward_periods: Forward-looking period (default: 63 = ~3 months)
+            top_quantile: Forward-return quantile labelled as outperformer (default: 0.80)
 
         Returns:
             DataFrame with binary labels (1 = outperformer, 0 = underperformer)
@@ -281,7 +302,7 @@ class MLQualifier:
                 continue
 
             # Get 80th percentile threshold
-            threshold = date_returns.quantile(0.80)
+            threshold = date_returns.quantile(top_quantile)
 
             # Label top 20% as 1, rest as 0 (explicit int conversion)
             labels.loc[date] = (date_returns >= threshold).astype(int)
@@ -388,14 +409,17 @@ class MLQualifier:
         else:
             print(f"   [ML] No volume/sector data ({feature_count} features per stock)")
 
-        features = self.engineer_features(prices, spy_prices, volumes, sector_prices)
+        if self.feature_store is not None:
+            features = self.feature_store.get_features(self, prices, spy_prices, volumes, sector_prices)
+        else:
+            features = self.engineer_features(prices, spy_prices, volumes, sector_prices)
 
         if features.empty:
             print("   [ML] WARNING: No features engineered")
             return pd.DataFrame(0, index=prices.index, columns=prices.columns)
 
         print(f"   [ML] Creating training labels...")
-        labels = self.create_training_labels(prices, forward_periods=63)
+        labels = self.create_training_labels(prices, **self.label_params)
 
         # Walk-forward prediction
         print(f"   [ML] Starting walk-forward prediction...")
@@ -416,6 +440,7 @@ class MLQualifier:
                 actual_rebalance_dates.append(prices.index[nearest_idx])
 
         print(f"   [ML] Retraining at {len(actual_rebalance_dates)} dates...")
+        self._reset_walk_forward_state()
 
         # Determine expected number of features (from first ticker)
         first_ticker = prices.columns[0]
@@ -431,8 +456,8 @@ class MLQualifier:
             if train_start < prices.index[0]:
                 continue
 
-            # Train model
-            model = self.train_model(features, labels, train_start, train_end)
+            # Train model (or load it from the model cache)
+            model = self._fit_or_load_model(features, labels, train_start, train_end)
 
             if model is None:
                 continue
@@ -483,12 +508,82 @@ class MLQualifier:
 
         print(f"   [ML] Walk-forward prediction complete!")
         print(f"   [ML] Trained {len(self.trained_dates)} times")
+        if self.model_cache is not None:
+            cache_stats = self.model_cache.stats()
+            print(f"   [ML] Model cache: {cache_stats['hits']} loaded, {cache_stats['misses']} trained "
+                  f"({cache_stats['hit_rate']:.0%} hit rate)")
 
         # Fill remaining NaN with neutral score (0.5)
         predictions = predictions.fillna(0.5)
 
         return predictions
 
+    def _fit_or_load_model(self, features: pd.DataFrame, labels: pd.DataFrame,
+                           train_start: pd.Timestamp, train_end: pd.Timestamp):
+        """
+        Train the model for one walk-forward window, reusing a cached model if available
+
+        The cache key covers the feature schema, training window, label params,
+        model params and a fingerprint of the training rows, so any change to
+        data or settings triggers a retrain.
+
+        Args:
+            features: Engineered features
+            labels: Training labels
+            train_start: Training period start date
+            train_end: Training period end date
+
+        Returns:
+            Trained model (or None if no model could be trained)
+        """
+        if self.model_cache is None:
+            return self.train_model(features, labels, train_start, train_end)
+
+        key = self.model_cache.make_key(
+            feature_schema={'columns': [str(c) for c in features.columns],
+                            'dtypes': [str(d) for d in features.dtypes]},
+            train_start=train_start,
+            train_end=train_end,
+            label_params=self.label_params,
+            model_params={'class': type(self).__name__, **self.model_params},
+            data_fingerprint=fingerprint_data(features.loc[train_start:train_end],
+                                              labels.loc[train_start:train_end]),
+            extra=self._cache_key_extra()
+        )
+
+        entry = self.model_cache.load(key)
+        if entry is not None:
+            self._restore_training_state(entry)
+            self._last_model_key = key
+            return entry['model']
+
+        model = self.train_model(features, labels, train_start, train_end)
+        if model is not None:
+            self.model_cache.save(key, self._training_state(model))
+            self._last_model_key = key
+        return model
+
+    def _reset_walk_forward_state(self) -> None:
+        """Reset per-run training state before a new walk-forward pass"""
+        self._last_model_key = None
+
+    def _cache_key_extra(self) -> Dict:
+        """Extra model-cache key parts (overridden by subclasses with training state)"""
+        return {}
+
+    def _training_state(self, model) -> Dict:
+        """Everything needed to predict with a freshly trained model"""
+        return {
+            'model': model,
+            'scaler': copy.deepcopy(self.scaler),
+            'feature_importance': self.feature_importance
+        }
+
+    def _restore_training_state(self, entry: Dict) -> None:
+        """Restore scaler/feature importance saved alongside a cached model"""
+        self.scaler = entry['scaler']
+        self.feature_importance = entry.get('feature_importance')
+
     def get_feature_importance(self) -> Optional[pd.Series]:
         """
         Get feature importance from last trained model
@@ -39,6 +39,13 @@ class XGBoostQualifier(MLQualifier):
     - Learning rate control
     - Early stopping support
     - Better handling of trends
+
+    Incremental mode (incremental=True):
+    - Consecutive quarterly windows overlap by ~90% (3-year window, 1-quarter step)
+    - Instead of refitting from scratch, continue boosting the previous
+      quarter's booster on only the newly added rows (incremental_rounds trees)
+    - Every full_refit_every windows a full refit resets the model, bounding
+      drift from data that has rolled out of the training window
     """
 
     def __init__(self,
@@ -52,7 +59,12 @@ class XGBoostQualifier(MLQualifier):
                  reg_alpha: float = 0.1,
                  reg_lambda: float = 1.0,
                  random_state: int = 42,
-                 retrain_freq: str = 'QS'):
+                 retrain_freq: str = 'QS',
+                 model_cache=None,
+                 feature_store=None,
+                 incremental: bool = False,
+                 incremental_rounds: int = 50,
+                 full_refit_every: int = 4):
         """
         Initialize XGBoost Qualifier
 
@@ -68,6 +80,13 @@ class XGBoostQualifier(MLQualifier):
             reg_lambda: L2 regularization (default: 1.0)
             random_state: Random seed (default: 42)
             retrain_freq: Retraining frequency ('QS' = quarterly)
+            model_cache: ModelCache or cache directory to reuse trained models
+                         across runs (default: None = always retrain)
+            feature_store: FeatureStore or store directory to read engineered
+                           features from disk (default: None = always rebuild)
+            incremental: Warm-start each quarter from the previous booster (default: False)
+            incremental_rounds: Boosting rounds added per incremental update (default: 50)
+            full_refit_every: Full refit every N windows in incremental mode (default: 4 = yearly)
         """
         # Initialize parent class (for feature engineering)
         super().__init__(
@@ -75,7 +94,9 @@ class XGBoostQualifier(MLQualifier):
             n_estimators=n_estimators,
             max_depth=max_depth,
             random_state=random_state,
-            retrain_freq=retrain_freq
+            retrain_freq=retrain_freq,
+            model_cache=model_cache,
+            feature_store=feature_store
         )
 
         self.name = "XGBoost Qualifier"
@@ -85,6 +106,16 @@ class XGBoostQualifier(MLQualifier):
         self.gamma = gamma
         self.reg_alpha = reg_alpha
         self.reg_lambda = reg_lambda
+        self.incremental = incremental
+        self.incremental_rounds = incremental_rounds
+        self.full_refit_every = max(1, full_refit_every)
+
+        # Warm-start state (previous window's model, reset every walk-forward pass)
+        self._prev_model = None
+        self._prev_train_end = None
+        self._updates_since_refit = 0
+        self.full_refits = 0
+        self.incremental_updates = 0
 
         # Override model parameters for XGBoost
         self.model_params = {
@@ -105,24 +136,30 @@ class XGBoostQualifier(MLQualifier):
             'verbosity': 0  # Suppress warnings
         }
 
-    def train_model(self, features: pd.DataFrame, labels: pd.DataFrame,
-                    train_start: pd.Timestamp, train_end: pd.Timestamp) -> XGBClassifier:
+    def _build_training_matrix(self, features: pd.DataFrame, labels: pd.DataFrame,
+                               train_start: pd.Timestamp, train_end: pd.Timestamp,
+                               after: Optional[pd.Timestamp] = None) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
         """
-        Train XGBoost model on training period
+        Stack per-ticker feature rows into a (samples, features) training matrix
 
         Args:
             features: Engineered features
-            labels: Training labels (1 = outperform, 0 = underperform)
+            labels: Training labels
             train_start: Training period start date
             train_end: Training period end date
+            after: Only keep rows strictly after this date (incremental updates)
 
         Returns:
-            Trained XGBClassifier
+            (X, y) arrays, or (None, None) if no valid rows
         """
         # Filter to training period
         train_features = features.loc[train_start:train_end]
         train_labels = labels.loc[train_start:train_end]
 
+        if after is not None:
+            train_features = train_features[train_features.index > after]
+            train_labels = train_labels[train_labels.index > after]
+
         # Determine expected number of features per ticker
         first_ticker = labels.columns[0]
         first_ticker_cols = [col for col in features.columns if col.startswith(f"{first_ticker}_")]
@@ -151,11 +188,38 @@ class XGBoostQualifier(MLQualifier):
                 y_train_list.append(ticker_labels[valid_idx].values)
 
         if len(X_train_list) == 0:
-            return None
+            return None, None
 
         # Combine all stocks
-        X_train = np.vstack(X_train_list)
-        y_train = np.hstack(y_train_list)
+        return np.vstack(X_train_list), np.hstack(y_train_list)
+
+    def train_model(self, features: pd.DataFrame, labels: pd.DataFrame,
+                    train_start: pd.Timestamp, train_end: pd.Timestamp) -> XGBClassifier:
+        """
+        Train XGBoost model on training period
+
+        In incremental mode, continues boosting the previous window's model on
+        the rows added since its training end, except every full_refit_every
+        windows (or when the new rows can't be used) where it refits from scratch.
+
+        Args:
+            features: Engineered features
+            labels: Training labels (1 = outperform, 0 = underperform)
+            train_start: Training period start date
+            train_end: Training period end date
+
+        Returns:
+            Trained XGBClassifier
+        """
+        if self._will_warm_start():
+            model = self._update_model(features, labels, train_start, train_end)
+            if model is not None:
+                return model
+
+        X_train, y_train = self._build_training_matrix(features, labels, train_start, train_end)
+
+        if X_train is None:
+            return None
 
         # Check if we have both classes in training data
         unique_classes = np.unique(y_train)
@@ -171,13 +235,94 @@ class XGBoostQualifier(MLQualifier):
         model = XGBClassifier(**self.model_params)
         model.fit(X_train_scaled, y_train)
 
-        # Store feature importance
+        self._store_feature_importance(model, features)
+
+        self._prev_model = model
+        self._prev_train_end = train_end
+        self._updates_since_refit = 0
+        self.full_refits += 1
+
+        return model
+
+    def _update_model(self, features: pd.DataFrame, labels: pd.DataFrame,
+                      train_start: pd.Timestamp, train_end: pd.Timestamp) -> Optional[XGBClassifier]:
+        """
+        Continue boosting the previous window's booster on newly added rows
+
+        The scaler from the last full refit is kept (not refit) so the new
+        trees see features on the same scale as the existing ones.
+
+        Returns:
+            Updated model, or None to fall back to a full refit
+        """
+        X_new, y_new = self._build_training_matrix(
+            features, labels, train_start, train_end, after=self._prev_train_end
+        )
+
+        if X_new is None:
+            # No new usable rows - previous model is still the best estimate
+            model = self._prev_model
+        else:
+            if len(np.unique(y_new)) < 2:
+                return None
+
+            X_new_scaled = self.scaler.transform(X_new)
+            model = XGBClassifier(**{**self.model_params, 'n_estimators': self.incremental_rounds})
+            model.fit(X_new_scaled, y_new, xgb_model=self._prev_model.get_booster())
+            self._store_feature_importance(model, features)
+
+        self._prev_model = model
+        self._prev_train_end = train_end
+        self._updates_since_refit += 1
+        self.incremental_updates += 1
+
+        return model
+
+    def _store_feature_importance(self, model: XGBClassifier, features: pd.DataFrame) -> None:
+        """Store feature importance from the latest model"""
         self.feature_importance = pd.Series(
             model.feature_importances_,
             index=[col.split('_', 1)[1] for col in features.columns[:len(model.feature_importances_)]]
         ).sort_values(ascending=False)
 
-        return model
+    def _will_warm_start(self) -> bool:
+        """True if the next window continues from the previous booster"""
+        return (self.incremental and
+                self._prev_model is not None and
+                self._updates_since_refit < self.full_refit_every - 1)
+
+    def _reset_walk_forward_state(self) -> None:
+        """Forget the previous booster before a new walk-forward pass"""
+        super()._reset_walk_forward_state()
+        self._prev_model = None
+        self._prev_train_end = None
+        self._updates_since_refit = 0
+        self.full_refits = 0
+        self.incremental_updates = 0
+
+    def _cache_key_extra(self) -> Dict:
+        """Warm-started models depend on their parent model, so chain its key"""
+        if not self._will_warm_start():
+            return {}
+        return {
+            'warm_start_parent': self._last_model_key,
+            'incremental_rounds': self.incremental_rounds,
+            'full_refit_every': self.full_refit_every
+        }
+
+    def _training_state(self, model) -> Dict:
+        """Include warm-start state so cached incremental chains can resume"""
+        state = super()._training_state(model)
+        state['train_end'] = self._prev_train_end
+        state['updates_since_refit'] = self._updates_since_refit
+        return state
+
+    def _restore_training_state(self, entry: Dict) -> None:
+        """Restore scaler and warm-start state from a cached model"""
+        super()._restore_training_state(entry)
+        self._prev_model = entry['model']
+        self._prev_train_end = entry.get('train_end')
+        self._updates_since_refit = entry.get('updates_since_refit', 0)
 
 
 def get_xgboost_qualifier(**kwargs) -> XGBoostQualifier:
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Persistent Model Cache for ML Qualifiers
+
+Walk-forward ML qualifiers retrain one model per quarter. When the data,
+features, labels and hyperparameters are unchanged between runs (repeated
+backtests, parameter sweeps that don't touch the ML settings), those models
+are identical - so we store them on disk and load them instead of refitting.
+
+Cache key = hash of:
+- Feature schema (feature column names + dtypes)
+- Training window (train_start, train_end)
+- Label parameters (forward period, top quantile)
+- Model parameters (n_estimators, max_depth, ...)
+- Data fingerprint (hash of the training features + labels actually used)
+
+Author: Strategy Factory
+"""
+
+import hashlib
+import json
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+def fingerprint_data(*objects) -> str:
+    """
+    Hash pandas/numpy objects (values + index + columns) into a short hex digest
+
+    None entries are hashed as a marker so that e.g. "no volume data" and
+    "volume data" produce different fingerprints.
+
+    Args:
+        *objects: DataFrames, Series, numpy arrays or None
+
+    Returns:
+        16-character hex digest
+    """
+    hasher = hashlib.sha256()
+
+    for obj in objects:
+        if obj is None:
+            hasher.update(b'<none>')
+        elif isinstance(obj, (pd.DataFrame, pd.Series)):
+            hasher.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+            if isinstance(obj, pd.DataFrame):
+                hasher.update(json.dumps([str(c) for c in obj.columns]).encode())
+            else:
+                hasher.update(str(obj.name).encode())
+        elif isinstance(obj, np.ndarray):
+            hasher.update(str(obj.shape).encode())
+            hasher.update(np.ascontiguousarray(obj).tobytes())
+        else:
+            hasher.update(repr(obj).encode())
+
+    return hasher.hexdigest()[:16]
+
+
+class ModelCache:
+    """
+    On-disk store for trained walk-forward models
+
+    Each entry is a pickled dict holding the fitted model plus whatever
+    training state the qualifier needs to predict with it (e.g. the fitted
+    StandardScaler and feature importance).
+
+    Example:
+        cache = ModelCache('cache/ml_models')
+        xgb = XGBoostQualifier(model_cache=cache)
+        scores = xgb.calculate(prices, spy_prices, volumes)  # trains + stores
+        scores = xgb.calculate(prices, spy_prices, volumes)  # loads from disk
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = 'cache/ml_models', verbose: bool = False):
+        """
+        Initialize model cache
+
+        Args:
+            cache_dir: Directory for cached model files (created if missing)
+            verbose: Print a line for every cache hit/miss
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.verbose = verbose
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(feature_schema: Dict,
+                 train_start: pd.Timestamp,
+                 train_end: pd.Timestamp,
+                 label_params: Dict,
+                 model_params: Dict,
+                 data_fingerprint: str,
+                 extra: Optional[Dict] = None) -> str:
+        """
+        Build a deterministic cache key
+
+        Args:
+            feature_schema: Feature column names/dtypes
+            train_start: Training window start
+            train_end: Training window end
+            label_params: Label construction parameters
+            model_params: Model hyperparameters
+            data_fingerprint: Hash of the training data
+            extra: Additional key parts (e.g. warm-start parent key)
+
+        Returns:
+            Hex digest cache key
+        """
+        payload = {
+            'schema': feature_schema,
+            'train_start': str(pd.Timestamp(train_start)),
+            'train_end': str(pd.Timestamp(train_end)),
+            'labels': label_params,
+            'model': model_params,
+            'data': data_fingerprint,
+            'extra': extra or {}
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached entry
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached entry dict, or None on miss/corrupt file
+        """
+        path = self._path(key)
+        if not path.exists():
+            self.misses += 1
+            if self.verbose:
+                print(f"   [CACHE] Miss {key[:12]}")
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            print(f"   [CACHE] WARNING: Unreadable cache entry {path.name} ({e}), retraining")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if self.verbose:
+            print(f"   [CACHE] Hit {key[:12]}")
+        return entry
+
+    def save(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an entry atomically (write to temp file, then rename)
+
+        Args:
+            key: Cache key from make_key()
+            entry: Dict with model and training state
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+
+    def clear(self) -> int:
+        """
+        Delete all cached models
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        for path in self.cache_dir.glob('*.pkl'):
+            path.unlink()
+            removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters for this session"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total > 0 else 0.0
+        }
+
+
+def get_model_cache(model_cache: Union[None, str, Path, ModelCache]) -> Optional[ModelCache]:
+    """
+    Normalize a model_cache argument (None, directory path or ModelCache)
+
+    Args:
+        model_cache: None (disabled), cache directory, or ModelCache instance
+
+    Returns:
+        ModelCache instance or None
+    """
+    if model_cache is None or isinstance(model_cache, ModelCache):
+        return model_cache
+    return ModelCache(model_cache)
@@ -5,16 +5,142 @@ Uses DEAP (Distributed Evolutionary Algorithms in Python) for optimization.
 Implements walk-forward analysis for robustness validation.
 """
 
+import math
+import os
+import time
 import pandas as pd
 import numpy as np
 import vectorbt as vbt
-from typing import Dict, List, Tuple, Callable, Any
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Callable, Any, Optional
+from dataclasses import dataclass, field
 import random
 from deap import base, creator, tools, algorithms
 import warnings
 warnings.filterwarnings('ignore')
 
+from strategy_factory.indicator_table import IndicatorTable
+from strategy_factory.metrics_kernel import annualization_factor, max_drawdown, portfolio_metrics, sharpe_ratio
+from strategy_factory.model_cache import fingerprint_data
+from strategy_factory.monte_carlo import MonteCarloEngine
+
+
+# DEAP classes are created once at import (not per optimization) so that
+# individuals can be pickled to and from worker processes
+if not hasattr(creator, "FitnessMax"):
+    creator.create("FitnessMax", base.Fitness, weights=(1.0,))
+if not hasattr(creator, "Individual"):
+    creator.create("Individual", list, fitness=creator.FitnessMax)
+
+
+def _fitness_state(close: np.ndarray, initial_capital: float, commission: float) -> Dict:
+    """Everything a fitness function needs for one data slice"""
+    close = np.asarray(close, dtype=float)
+    return {
+        'close': close,
+        'indicators': IndicatorTable(close),
+        'initial_capital': initial_capital,
+        'commission': commission,
+        'ann_factor': annualization_factor('5min')
+    }
+
+
+def _sharpe_fitness(state: Dict, entries: np.ndarray, exits: np.ndarray) -> float:
+    """Fitness = Sharpe ratio of the signal backtest (annualized for 5min bars)"""
+    portfolio = vbt.Portfolio.from_signals(
+        close=state['close'],
+        entries=entries,
+        exits=exits,
+        init_cash=state['initial_capital'],
+        fees=state['commission']
+    )
+
+    try:
+        return float(sharpe_ratio(portfolio.value().values, state['initial_capital'], state['ann_factor'])[0])
+    except:
+        return 0
+
+
+def _sma_entries_exits(state: Dict, params: Tuple[int, ...]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """SMA crossover entries/exits (None = invalid individual)"""
+    fast, slow = params
+    if fast >= slow:
+        return None
+    return StrategyOptimizer._sma_signals(state['indicators'], fast, slow)
+
+
+def _rsi_entries_exits(state: Dict, params: Tuple[int, ...]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """RSI mean-reversion entries/exits (None = invalid individual)"""
+    period, oversold, overbought = params
+    if oversold >= overbought:
+        return None
+    rsi = state['indicators'].rsi(period)
+    return rsi < oversold, rsi > overbought
+
+
+def _sma_fitness(state: Dict, params: Tuple[int, ...]) -> Optional[float]:
+    """SMA crossover fitness (None = invalid individual)"""
+    signals = _sma_entries_exits(state, params)
+    return _sharpe_fitness(state, *signals) if signals is not None else None
+
+
+def _rsi_fitness(state: Dict, params: Tuple[int, ...]) -> Optional[float]:
+    """RSI mean-reversion fitness (None = invalid individual)"""
+    signals = _rsi_entries_exits(state, params)
+    return _sharpe_fitness(state, *signals) if signals is not None else None
+
+
+SIGNAL_FUNCTIONS = {
+    'SMA': _sma_entries_exits,
+    'RSI': _rsi_entries_exits
+}
+
+# Parameter names (GA gene order) and default search ranges per strategy
+PARAM_NAMES = {
+    'SMA': ['fast', 'slow'],
+    'RSI': ['period', 'oversold', 'overbought']
+}
+DEFAULT_PARAM_RANGES = {
+    'SMA': [(5, 30), (40, 200)],
+    'RSI': [(5, 30), (15, 40), (60, 85)]
+}
+
+FITNESS_FUNCTIONS = {
+    'SMA': _sma_fitness,
+    'RSI': _rsi_fitness
+}
+
+# Worker-process state (set once per worker by _init_fitness_worker)
+_WORKER_STATE: Optional[Dict] = None
+
+
+def _init_fitness_worker(close: np.ndarray, initial_capital: float, commission: float) -> None:
+    """Process-pool initializer: preload prices and the indicator table once per worker"""
+    global _WORKER_STATE
+    _WORKER_STATE = _fitness_state(close, initial_capital, commission)
+
+
+def _worker_fitness(task: Tuple[str, Tuple[int, ...]]) -> Optional[float]:
+    """Worker task: fitness of one normalized individual"""
+    strategy, params = task
+    return FITNESS_FUNCTIONS[strategy](_WORKER_STATE, params)
+
+
+def _walk_forward_block(config: Dict, df: pd.DataFrame, fold_starts: List[int],
+                        fold_kwargs: Dict, seed: int) -> Tuple[List[Dict], int, int]:
+    """
+    Worker task: run a contiguous block of walk-forward folds
+
+    Returns:
+        Tuple of (fold rows, fitness cache hits, backtests run)
+    """
+    random.seed(seed)
+    np.random.seed(seed % 2**32)
+
+    optimizer = StrategyOptimizer(**config)
+    rows = optimizer._walk_forward_folds(df, fold_starts, **fold_kwargs)
+    return rows, optimizer.fitness_cache_hits, optimizer.fitness_backtests
+
 
 @dataclass
 class OptimizationResult:
@@ -24,6 +150,7 @@ class OptimizationResult:
     all_generations: List
     convergence_history: List
     final_metrics: Dict
+    hall_of_fame: List = field(default_factory=list)
 
 
 class StrategyOptimizer:
@@ -36,16 +163,25 @@ class StrategyOptimizer:
         print(f"Best params: {result.best_params}")
     """
 
-    def __init__(self, initial_capital: float = 10000, commission: float = 0.001):
+    def __init__(self, initial_capital: float = 10000, commission: float = 0.001, n_jobs: int = 1):
         """
         Initialize optimizer
 
         Args:
             initial_capital: Starting capital
             commission: Commission per trade
+            n_jobs: Worker processes for population evaluation
+                    (1 = serial, -1 or None = all cores)
         """
         self.initial_capital = initial_capital
         self.commission = commission
+        self.n_jobs = n_jobs
+
+        # Fitness memo shared across generations, optimize_* calls and
+        # walk-forward folds: (strategy, data fingerprint, costs, params) -> fitness
+        self._fitness_cache: Dict[tuple, float] = {}
+        self.fitness_cache_hits = 0
+        self.fitness_backtests = 0
 
     def optimize_sma(self,
                      df: pd.DataFrame,
@@ -53,7 +189,9 @@ class StrategyOptimizer:
                      slow_range: Tuple[int, int] = (40, 200),
                      generations: int = 50,
                      population: int = 100,
-                     verbose: bool = True) -> OptimizationResult:
+                     verbose: bool = True,
+                     seed_population: Optional[List[List]] = None,
+                     hof_size: int = 1) -> OptimizationResult:
         """
         Optimize SMA crossover parameters using genetic algorithm
 
@@ -64,6 +202,9 @@ class StrategyOptimizer:
             generations: Number of generations to evolve
             population: Population size
             verbose: Print progress
+            seed_population: Individuals placed in the initial population
+                             (e.g. a previous hall of fame, for warm starts)
+            hof_size: Individuals kept in the returned hall of fame
 
         Returns:
             OptimizationResult with best parameters
@@ -72,42 +213,16 @@ class StrategyOptimizer:
             print(f"🧬 Optimizing SMA strategy...")
             print(f"   Generations: {generations}, Population: {population}")
 
-        # Define evaluation function
-        def evaluate(individual):
-            fast, slow = individual
-            if fast >= slow:
-                return (0,)  # Invalid
-
-            close = df['close'].values
-            fast_sma = pd.Series(close).rolling(int(fast)).mean()
-            slow_sma = pd.Series(close).rolling(int(slow)).mean()
-
-            entries = (fast_sma > slow_sma) & (fast_sma.shift(1) <= slow_sma.shift(1))
-            exits = (fast_sma < slow_sma) & (fast_sma.shift(1) >= slow_sma.shift(1))
-
-            portfolio = vbt.Portfolio.from_signals(
-                close=close,
-                entries=entries,
-                exits=exits,
-                init_cash=self.initial_capital,
-                fees=self.commission
-            )
-
-            # Fitness = Sharpe ratio (annualize for 5min data: 252*12*24 periods/year)
-            try:
-                sharpe = portfolio.sharpe_ratio(freq='5min')
-            except:
-                sharpe = 0
-            return (sharpe,)
-
-        # Run optimization
-        result = self._run_genetic_optimization(
-            evaluate_func=evaluate,
+        # Run optimization (indicators shared by all individuals, see _fitness_state)
+        result, cache_stats = self._evolve(
+            strategy='SMA',
+            close=df['close'].values,
             param_ranges=[fast_range, slow_range],
-            param_types=['int', 'int'],
             generations=generations,
             population=population,
-            verbose=verbose
+            verbose=verbose,
+            seed_population=seed_population,
+            hof_size=hof_size
         )
 
         # Format results
@@ -117,13 +232,15 @@ class StrategyOptimizer:
             print(f"✅ Optimization complete!")
             print(f"   Best params: {best_params}")
             print(f"   Best Sharpe: {result['best_fitness']:.2f}")
+            self._print_cache_stats(cache_stats)
 
         return OptimizationResult(
             best_params=best_params,
             best_fitness=result['best_fitness'],
             all_generations=result['log'],
             convergence_history=result['convergence'],
-            final_metrics={}
+            final_metrics={'fitness_cache': self._summarize_cache_stats(cache_stats)},
+            hall_of_fame=result['hall_of_fame']
         )
 
     def optimize_rsi(self,
@@ -133,43 +250,22 @@ class StrategyOptimizer:
                      overbought_range: Tuple[int, int] = (60, 85),
                      generations: int = 50,
                      population: int = 100,
-                     verbose: bool = True) -> OptimizationResult:
-        """Optimize RSI parameters"""
+                     verbose: bool = True,
+                     seed_population: Optional[List[List]] = None,
+                     hof_size: int = 1) -> OptimizationResult:
+        """Optimize RSI parameters (seed_population / hof_size as in optimize_sma)"""
         if verbose:
             print(f"🧬 Optimizing RSI strategy...")
 
-        def evaluate(individual):
-            period, oversold, overbought = individual
-            if oversold >= overbought:
-                return (0,)
-
-            close = df['close'].values
-            rsi = self._calculate_rsi(close, int(period))
-
-            entries = rsi < oversold
-            exits = rsi > overbought
-
-            portfolio = vbt.Portfolio.from_signals(
-                close=close,
-                entries=entries,
-                exits=exits,
-                init_cash=self.initial_capital,
-                fees=self.commission
-            )
-
-            try:
-                sharpe = portfolio.sharpe_ratio(freq='5min')
-            except:
-                sharpe = 0
-            return (sharpe,)
-
-        result = self._run_genetic_optimization(
-            evaluate_func=evaluate,
+        result, cache_stats = self._evolve(
+            strategy='RSI',
+            close=df['close'].values,
             param_ranges=[period_range, oversold_range, overbought_range],
-            param_types=['int', 'int', 'int'],
             generations=generations,
             population=population,
-            verbose=verbose
+            verbose=verbose,
+            seed_population=seed_population,
+            hof_size=hof_size
         )
 
         best_params = {
@@ -182,25 +278,225 @@ class StrategyOptimizer:
         if verbose:
             print(f"✅ Best params: {best_params}")
             print(f"   Best Sharpe: {result['best_fitness']:.2f}")
+            self._print_cache_stats(cache_stats)
 
         return OptimizationResult(
             best_params=best_params,
             best_fitness=result['best_fitness'],
             all_generations=result['log'],
             convergence_history=result['convergence'],
-            final_metrics={}
+            final_metrics={'fitness_cache': self._summarize_cache_stats(cache_stats)},
+            hall_of_fame=result['hall_of_fame']
+        )
+
+    def optimize_successive_halving(self,
+                                    df: pd.DataFrame,
+                                    strategy: str = 'SMA',
+                                    param_ranges: Optional[List[Tuple[int, int]]] = None,
+                                    n_candidates: int = 128,
+                                    min_fraction: float = 0.1,
+                                    eta: float = 2.0,
+                                    max_drawdown_limit: Optional[float] = None,
+                                    verbose: bool = True) -> OptimizationResult:
+        """
+        Optimize parameters by successive halving (alternative to the GA)
+
+        Random candidates are backtested on a growing prefix of the data
+        (min_fraction, x eta, ... up to the full series). After each rung the
+        bottom (1 - 1/eta) by Sharpe are dropped, so obviously bad candidates
+        never see the full 5m history. Each rung is one multi-column vectorbt
+        call per chunk of candidates.
+
+        Args:
+            df: DataFrame with OHLCV data
+            strategy: 'SMA' or 'RSI'
+            param_ranges: (min, max) per parameter (default: optimize_sma/optimize_rsi ranges)
+            n_candidates: Random candidates in the first rung
+            min_fraction: Fraction of bars in the first rung
+            eta: Prefix growth factor and elimination rate (keep 1/eta per rung)
+            max_drawdown_limit: Drop a candidate at the first rung where its
+                                drawdown exceeds this (%, e.g. 30 = -30%)
+            verbose: Print progress
+
+        Returns:
+            OptimizationResult (all_generations = per-rung log, convergence_history
+            = best Sharpe per rung, hall_of_fame = final survivors)
+        """
+        if strategy not in SIGNAL_FUNCTIONS:
+            raise ValueError(f"Unknown strategy: {strategy}. Choose from {list(SIGNAL_FUNCTIONS)}")
+        if eta <= 1:
+            raise ValueError("eta must be > 1")
+
+        param_ranges = param_ranges or DEFAULT_PARAM_RANGES[strategy]
+        state = _fitness_state(df['close'].values, self.initial_capital, self.commission)
+        signal_fn = SIGNAL_FUNCTIONS[strategy]
+        n_bars = len(state['close'])
+
+        # Rung prefixes: min_fraction, min_fraction * eta, ..., 1.0
+        fractions = []
+        fraction = min_fraction
+        while fraction < 1:
+            fractions.append(fraction)
+            fraction *= eta
+        fractions.append(1.0)
+
+        survivors = self._sample_candidates(state, signal_fn, param_ranges, n_candidates)
+        scores = np.zeros(len(survivors))
+
+        if verbose:
+            print(f"🪜 Successive halving for {strategy} strategy...")
+            print(f"   {len(survivors)} candidates, {len(fractions)} rungs, keep 1/{eta:g} per rung")
+
+        log = []
+        bars_backtested = 0
+        total_aborted = 0
+        completed = True
+
+        for rung, fraction in enumerate(fractions):
+            n_prefix = max(2, int(round(n_bars * fraction)))
+            sharpe, drawdown = self._score_prefix(state, signal_fn, survivors, n_prefix)
+            bars_backtested += n_prefix * len(survivors)
+
+            # Drawdown abort: candidates breaching the limit on this prefix stop here
+            alive = np.ones(len(survivors), dtype=bool)
+            if max_drawdown_limit is not None:
+                alive = drawdown * 100 > -abs(max_drawdown_limit)
+            n_aborted = int((~alive).sum())
+            total_aborted += n_aborted
+
+            # Non-finite Sharpe (NaN, or inf from a zero-std prefix without trades) ranks last
+            rank_score = np.where(alive & np.isfinite(sharpe), sharpe, -np.inf)
+            order = np.argsort(-rank_score, kind='stable')
+            is_last = rung == len(fractions) - 1
+            n_keep = len(survivors) if is_last else max(1, math.ceil(len(survivors) / eta))
+            keep = [i for i in order[:n_keep] if alive[i]]
+
+            if not keep:
+                # Every candidate breached the limit: report the best of this rung
+                print(f"   ⚠️  All candidates breached the {max_drawdown_limit}% drawdown limit at rung {rung + 1}")
+                keep = [int(np.argmax(np.where(np.isfinite(sharpe), sharpe, -np.inf)))]
+                completed = False
+
+            finite = sharpe[alive & np.isfinite(sharpe)]
+            log.append({
+                'rung': rung + 1,
+                'bars': n_prefix,
+                'candidates': len(survivors),
+                'aborted': n_aborted,
+                'kept': len(keep),
+                'max': float(sharpe[keep[0]]),
+                'avg': float(finite.mean()) if len(finite) > 0 else np.nan
+            })
+
+            if verbose:
+                print(f"   Rung {rung + 1}: {len(survivors)} candidates on {n_prefix:,} bars ({fraction:.0%}) "
+                      f"→ kept {len(keep)}, aborted {n_aborted}, best Sharpe {log[-1]['max']:.2f}")
+
+            survivors = [survivors[i] for i in keep]
+            scores = sharpe[keep]
+            if not completed:
+                break
+
+        best = survivors[0]
+        best_params = {'type': strategy, **dict(zip(PARAM_NAMES[strategy], best))}
+        full_bars = n_candidates * n_bars
+
+        final_metrics = {
+            'candidates': n_candidates,
+            'rungs': len(log),
+            'aborted': total_aborted,
+            'completed': completed,
+            'bars_backtested': bars_backtested,
+            'full_backtest_bars': full_bars,
+            'bar_savings': 1 - bars_backtested / full_bars if full_bars > 0 else 0.0
+        }
+
+        if verbose:
+            print(f"✅ Successive halving complete!")
+            print(f"   Best params: {best_params}")
+            print(f"   Best Sharpe: {scores[0]:.2f}")
+            print(f"   Backtested {bars_backtested:,} bars vs {full_bars:,} for full backtests "
+                  f"({final_metrics['bar_savings']:.0%} saved)")
+
+        return OptimizationResult(
+            best_params=best_params,
+            best_fitness=float(scores[0]),
+            all_generations=log,
+            convergence_history=[record['max'] for record in log],
+            final_metrics=final_metrics,
+            hall_of_fame=[list(params) for params in survivors]
         )
 
+    @staticmethod
+    def _sample_candidates(state: Dict, signal_fn: Callable, param_ranges: List[Tuple[int, int]],
+                           n_candidates: int) -> List[Tuple[int, ...]]:
+        """Unique valid random parameter tuples (fewer if the space is smaller)"""
+        candidates = {}
+        attempts = 0
+        while len(candidates) < n_candidates and attempts < n_candidates * 20:
+            attempts += 1
+            params = tuple(random.randint(low, high) for low, high in param_ranges)
+            if params not in candidates and signal_fn(state, params) is not None:
+                candidates[params] = None
+        return list(candidates)
+
+    def _score_prefix(self, state: Dict, signal_fn: Callable, candidates: List[Tuple[int, ...]],
+                      n_prefix: int, chunk_size: int = 256) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sharpe and max drawdown of each candidate on the first n_prefix bars
+
+        Indicators are causal, so full-series signals truncated to the prefix
+        equal signals computed on the prefix alone.
+        """
+        close = state['close'][:n_prefix]
+        sharpe = np.empty(len(candidates))
+        drawdown = np.empty(len(candidates))
+
+        for chunk_start in range(0, len(candidates), chunk_size):
+            chunk = candidates[chunk_start:chunk_start + chunk_size]
+            entries = np.empty((n_prefix, len(chunk)), dtype=bool)
+            exits = np.empty((n_prefix, len(chunk)), dtype=bool)
+            for col, params in enumerate(chunk):
+                chunk_entries, chunk_exits = signal_fn(state, params)
+                entries[:, col] = chunk_entries[:n_prefix]
+                exits[:, col] = chunk_exits[:n_prefix]
+
+            portfolio = vbt.Portfolio.from_signals(
+                close=close[:, None],
+                entries=entries,
+                exits=exits,
+                init_cash=self.initial_capital,
+                fees=self.commission
+            )
+            value = portfolio.value().values
+            window = slice(chunk_start, chunk_start + len(chunk))
+            sharpe[window] = sharpe_ratio(value, self.initial_capital, state['ann_factor'])
+            drawdown[window] = max_drawdown(value, self.initial_capital)
+
+        return sharpe, drawdown
+
     def walk_forward_analysis(self,
                               df: pd.DataFrame,
                               strategy_params: Dict,
                               train_window: int = 252,  # 1 year
                               test_window: int = 63,    # 3 months
                               step_size: int = 21,      # 1 month
-                              verbose: bool = True) -> pd.DataFrame:
+                              verbose: bool = True,
+                              generations: int = 20,
+                              population: int = 50,
+                              warm_start: bool = False,
+                              warm_start_generations: int = 8,
+                              parallel_folds: int = 1) -> pd.DataFrame:
         """
         Perform walk-forward analysis on strategy
 
+        Adjacent folds share most of their training data, so with warm_start
+        each fold's initial population is seeded with the previous fold's
+        hall of fame and evolved for warm_start_generations instead of
+        generations. With parallel_folds > 1 the folds are split into
+        contiguous blocks that run in separate processes (warm starts chain
+        within a block; each block's first fold starts cold).
+
         Args:
             df: DataFrame with OHLCV data
             strategy_params: Strategy parameters to test
@@ -208,31 +504,137 @@ class StrategyOptimizer:
             test_window: Testing window size (bars)
             step_size: Step size for rolling window
             verbose: Print progress
+            generations: GA generations per fold (cold start)
+            population: GA population size
+            warm_start: Seed each fold from the previous fold's hall of fame
+            warm_start_generations: GA generations for warm-started folds
+            parallel_folds: Processes running fold blocks (1 = serial)
 
         Returns:
-            DataFrame with walk-forward results
+            DataFrame with walk-forward results (per-fold GA generations,
+            backtests and CPU seconds included; run totals in .attrs['summary'])
         """
         if verbose:
             print(f"🚶 Walk-forward analysis...")
             print(f"   Train: {train_window} bars, Test: {test_window} bars, Step: {step_size}")
 
+        start_time = time.perf_counter()
+        fold_starts = list(range(0, len(df) - train_window - test_window, step_size))
+        total_steps = len(fold_starts)
+        fold_kwargs = {
+            'strategy_type': strategy_params['type'],
+            'train_window': train_window,
+            'test_window': test_window,
+            'generations': generations,
+            'population': population,
+            'warm_start': warm_start,
+            'warm_start_generations': warm_start_generations
+        }
+
+        n_blocks = min(max(1, parallel_folds), total_steps)
+        if n_blocks <= 1:
+            results = self._walk_forward_folds(df, fold_starts, verbose=verbose, **fold_kwargs)
+        else:
+            if verbose:
+                print(f"   Running {total_steps} folds in {n_blocks} parallel blocks")
+
+            config = {'initial_capital': self.initial_capital, 'commission': self.commission, 'n_jobs': 1}
+            blocks = [list(block) for block in np.array_split(fold_starts, n_blocks)]
+            seeds = [random.randrange(2**32) for _ in blocks]
+
+            with ProcessPoolExecutor(max_workers=n_blocks) as pool:
+                futures = []
+                for block, seed in zip(blocks, seeds):
+                    # Ship only the rows this block's folds touch
+                    first, last = block[0], block[-1] + train_window + test_window
+                    futures.append(pool.submit(_walk_forward_block, config, df.iloc[first:last],
+                                               [start - first for start in block], fold_kwargs, seed))
+
+                results = []
+                for n_done, future in enumerate(futures, start=1):
+                    rows, hits, backtests = future.result()
+                    results.extend(rows)
+                    self.fitness_cache_hits += hits
+                    self.fitness_backtests += backtests
+                    if verbose:
+                        print(f"   Completed block {n_done}/{n_blocks} ({len(results)}/{total_steps} folds)")
+
+        for fold, row in enumerate(results, start=1):
+            row['fold'] = fold
+
+        df_results = pd.DataFrame(results)
+
+        wall_time = time.perf_counter() - start_time
+        fold_time = float(df_results['train_cpu_seconds'].sum()) if len(df_results) > 0 else 0.0
+        df_results.attrs['summary'] = {
+            'wall_seconds': wall_time,
+            'fold_cpu_seconds': fold_time,
+            'backtests': int(df_results['train_backtests'].sum()) if len(df_results) > 0 else 0,
+            'generations': int(df_results['train_generations'].sum()) if len(df_results) > 0 else 0,
+            'cold_generations': generations * len(df_results)
+        }
+
+        if verbose:
+            summary = df_results.attrs['summary']
+            print(f"\n✅ Walk-forward complete!")
+            print(f"   Wall-clock: {wall_time:.1f}s (fold optimizations: {fold_time:.1f}s CPU, "
+                  f"{fold_time / max(wall_time, 1e-9):.1f}× CPU/wall)")
+            print(f"   GA generations: {summary['generations']} of {summary['cold_generations']} "
+                  f"for cold starts, {summary['backtests']:,} backtests run")
+            cache = self.fitness_cache_stats()
+            print(f"   Fitness cache: {cache['hit_rate']:.0%} hit rate, {cache['backtests_saved']} backtests saved")
+            print(f"   Avg test return: {df_results['test_return'].mean():.2f}%")
+            print(f"   Avg test Sharpe: {df_results['test_sharpe'].mean():.2f}")
+            print(f"   Consistency: {(df_results['test_return'] > 0).sum() / len(df_results) * 100:.0f}% positive")
+
+        return df_results
+
+    def _walk_forward_folds(self,
+                            df: pd.DataFrame,
+                            fold_starts: List[int],
+                            strategy_type: str,
+                            train_window: int,
+                            test_window: int,
+                            generations: int,
+                            population: int,
+                            warm_start: bool,
+                            warm_start_generations: int,
+                            verbose: bool = False) -> List[Dict]:
+        """
+        Optimize and test a sequence of folds (one block of walk_forward_analysis)
+
+        Returns:
+            List of fold result dicts (fold numbers assigned by the caller)
+        """
+        if strategy_type == 'SMA':
+            optimize = self.optimize_sma
+        elif strategy_type == 'RSI':
+            optimize = self.optimize_rsi
+        else:
+            return []
+
         results = []
-        total_steps = (len(df) - train_window - test_window) // step_size
+        seed_population = None
+        hof_size = max(1, population // 5) if warm_start else 1
 
-        for i in range(0, len(df) - train_window - test_window, step_size):
+        for i in fold_starts:
             # Split data
             train_data = df.iloc[i:i + train_window]
             test_data = df.iloc[i + train_window:i + train_window + test_window]
 
-            # Optimize on train
-            if strategy_params['type'] == 'SMA':
-                train_result = self.optimize_sma(train_data, verbose=False, generations=20, population=50)
-                optimized_params = train_result.best_params
-            elif strategy_params['type'] == 'RSI':
-                train_result = self.optimize_rsi(train_data, verbose=False, generations=20, population=50)
-                optimized_params = train_result.best_params
-            else:
-                continue
+            # Optimize on train (warm-started from the previous fold if available)
+            fold_generations = warm_start_generations if seed_population else generations
+            backtests_before = self.fitness_backtests
+            fold_cpu_start = time.process_time()
+
+            train_result = optimize(train_data, verbose=False, generations=fold_generations,
+                                    population=population, seed_population=seed_population,
+                                    hof_size=hof_size)
+            optimized_params = train_result.best_params
+            if warm_start:
+                seed_population = train_result.hall_of_fame
+
+            train_cpu_seconds = time.process_time() - fold_cpu_start
 
             # Test on out-of-sample
             test_metrics = self._backtest_strategy(test_data, optimized_params)
@@ -247,21 +649,16 @@ class StrategyOptimizer:
                 'test_return': test_metrics['total_return'],
                 'test_sharpe': test_metrics['sharpe_ratio'],
                 'test_drawdown': test_metrics['max_drawdown'],
-                'test_trades': test_metrics['num_trades']
+                'test_trades': test_metrics['num_trades'],
+                'train_generations': fold_generations,
+                'train_backtests': self.fitness_backtests - backtests_before,
+                'train_cpu_seconds': train_cpu_seconds
             })
 
             if verbose and len(results) % 5 == 0:
-                print(f"   Completed {len(results)}/{total_steps} folds")
-
-        df_results = pd.DataFrame(results)
-
-        if verbose:
-            print(f"\n✅ Walk-forward complete!")
-            print(f"   Avg test return: {df_results['test_return'].mean():.2f}%")
-            print(f"   Avg test Sharpe: {df_results['test_sharpe'].mean():.2f}")
-            print(f"   Consistency: {(df_results['test_return'] > 0).sum() / len(df_results) * 100:.0f}% positive")
+                print(f"   Completed {len(results)}/{len(fold_starts)} folds")
 
-        return df_results
+        return results
 
     def monte_carlo_simulation(self,
                               df: pd.DataFrame,
@@ -293,23 +690,13 @@ class StrategyOptimizer:
             print("❌ No trades generated")
             return {}
 
-        # Get trade returns
-        trade_returns = trades['PnL'].values
-
-        # Run simulations
-        simulation_results = []
-
-        for i in range(n_simulations):
-            # Randomly sample trades with replacement
-            sampled_returns = np.random.choice(trade_returns, size=len(trade_returns), replace=True)
-
-            # Calculate cumulative return
-            cumulative = np.cumprod(1 + sampled_returns / self.initial_capital)
-            total_return = (cumulative[-1] - 1) * 100
+        # Get trade returns (PnL relative to initial capital)
+        trade_returns = trades['PnL'].values / self.initial_capital
 
-            simulation_results.append(total_return)
-
-        simulation_results = np.array(simulation_results)
+        # Run simulations (vectorized bootstrap, chunked for memory)
+        simulations = MonteCarloEngine(n_simulations=n_simulations).simulate(trade_returns)
+        simulation_results = simulations['total_return'] * 100
+        max_drawdowns = simulations['max_drawdown'] * 100
 
         # Calculate statistics
         lower_percentile = (1 - confidence_level) / 2
@@ -323,7 +710,9 @@ class StrategyOptimizer:
             f'upper_{int(confidence_level*100)}': np.percentile(simulation_results, upper_percentile * 100),
             'probability_positive': (simulation_results > 0).sum() / n_simulations * 100,
             'worst_case': simulation_results.min(),
-            'best_case': simulation_results.max()
+            'best_case': simulation_results.max(),
+            'median_max_drawdown': np.median(max_drawdowns),
+            f'max_drawdown_{int(confidence_level*100)}': np.percentile(max_drawdowns, (1 - confidence_level) * 100)
         }
 
         if verbose:
@@ -331,6 +720,7 @@ class StrategyOptimizer:
             print(f"   Mean return: {results['mean_return']:.2f}%")
             print(f"   {int(confidence_level*100)}% CI: [{results[f'lower_{int(confidence_level*100)}']:.2f}%, {results[f'upper_{int(confidence_level*100)}']:.2f}%]")
             print(f"   Probability of profit: {results['probability_positive']:.1f}%")
+            print(f"   Median path max drawdown: {results['median_max_drawdown']:.2f}%")
 
         return results
 
@@ -340,18 +730,20 @@ class StrategyOptimizer:
                                    param_types: List[str],
                                    generations: int,
                                    population: int,
-                                   verbose: bool) -> Dict:
-        """Run genetic algorithm optimization"""
-        # Setup DEAP
-        if hasattr(creator, "FitnessMax"):
-            del creator.FitnessMax
-        if hasattr(creator, "Individual"):
-            del creator.Individual
-
-        creator.create("FitnessMax", base.Fitness, weights=(1.0,))
-        creator.create("Individual", list, fitness=creator.FitnessMax)
+                                   verbose: bool,
+                                   map_func: Callable = map,
+                                   seed_population: Optional[List[List]] = None,
+                                   hof_size: int = 1) -> Dict:
+        """
+        Run genetic algorithm optimization
 
+        map_func evaluates a population (e.g. on a pool). seed_population
+        individuals replace the first random individuals of the initial
+        population; the best hof_size individuals are returned as hall_of_fame.
+        """
+        # Setup DEAP (creator.FitnessMax / creator.Individual are created at import)
         toolbox = base.Toolbox()
+        toolbox.register("map", map_func)
 
         # Register parameters
         for i, (param_range, param_type) in enumerate(zip(param_ranges, param_types)):
@@ -374,7 +766,10 @@ class StrategyOptimizer:
 
         # Create initial population
         pop = toolbox.population(n=population)
-        hof = tools.HallOfFame(1)
+        for slot, params in enumerate((seed_population or [])[:population]):
+            pop[slot] = creator.Individual(params)
+
+        hof = tools.HallOfFame(max(1, hof_size))
         stats = tools.Statistics(lambda ind: ind.fitness.values)
         stats.register("avg", np.mean)
         stats.register("max", np.max)
@@ -390,22 +785,203 @@ class StrategyOptimizer:
         return {
             'best_individual': hof[0],
             'best_fitness': hof[0].fitness.values[0],
+            'hall_of_fame': [list(ind) for ind in hof],
             'log': log,
             'convergence': [record['max'] for record in log]
         }
 
-    def _backtest_strategy(self, df: pd.DataFrame, params: Dict, return_portfolio: bool = False):
-        """Backtest strategy with given parameters"""
+    def _n_workers(self) -> int:
+        if self.n_jobs is None or self.n_jobs < 0:
+            return os.cpu_count() or 1
+        return max(1, self.n_jobs)
+
+    def _evolve(self, strategy: str, close: np.ndarray, param_ranges: List[Tuple],
+                generations: int, population: int, verbose: bool,
+                seed_population: Optional[List[List]] = None, hof_size: int = 1) -> Tuple[Dict, Dict]:
+        """
+        Run the GA for a strategy in FITNESS_FUNCTIONS on one close series
+
+        With n_jobs > 1 the population is evaluated on a process pool whose
+        workers preload the prices and indicator table once; cache lookups
+        stay in this process, so only uncached individuals are sent out.
+
+        Returns:
+            Tuple of (_run_genetic_optimization result, cache stats)
+        """
+        n_workers = self._n_workers()
+        pool = None
+
+        if n_workers > 1:
+            try:
+                pool = ProcessPoolExecutor(max_workers=n_workers,
+                                           initializer=_init_fitness_worker,
+                                           initargs=(np.asarray(close, dtype=float),
+                                                     self.initial_capital, self.commission))
+                if verbose:
+                    print(f"   Evaluating population on {n_workers} worker processes")
+            except (OSError, RuntimeError) as e:
+                print(f"   ⚠️  Could not start worker processes ({e}), evaluating serially")
+                pool = None
+
+        try:
+            evaluate, map_func, cache_stats = self._memoized_fitness(strategy, close, pool, n_workers)
+            result = self._run_genetic_optimization(
+                evaluate_func=evaluate,
+                param_ranges=param_ranges,
+                param_types=['int'] * len(param_ranges),
+                generations=generations,
+                population=population,
+                verbose=verbose,
+                map_func=map_func,
+                seed_population=seed_population,
+                hof_size=hof_size
+            )
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+
+        return result, cache_stats
+
+    def _memoized_fitness(self, strategy: str, close: np.ndarray,
+                          pool: Optional[ProcessPoolExecutor] = None,
+                          n_workers: int = 1) -> Tuple[Callable, Callable, Dict]:
+        """
+        Wrap a strategy's fitness function with the shared fitness cache
+
+        Individuals are normalized to int tuples (the parameters actually
+        backtested), so GA individuals that collapse to the same parameters
+        are backtested once per data slice. Invalid individuals (fitness
+        function returns None) score 0 and are not cached.
+
+        Args:
+            strategy: Key of FITNESS_FUNCTIONS (part of the cache key)
+            close: Close prices the fitness is computed on (fingerprinted)
+            pool: Optional worker pool (initialized with the same close prices)
+            n_workers: Pool size (for task chunking)
+
+        Returns:
+            Tuple of (DEAP evaluate function, DEAP map function, stats dict updated in place)
+        """
+        context = (strategy, fingerprint_data(np.asarray(close, dtype=float)),
+                   self.initial_capital, self.commission)
+        fitness_fn = FITNESS_FUNCTIONS[strategy]
+        stats = {'evaluations': 0, 'hits': 0, 'backtests': 0}
+        local_state = {}
+
+        def local_fitness(params: Tuple[int, ...]) -> Optional[float]:
+            if 'state' not in local_state:
+                local_state['state'] = _fitness_state(close, self.initial_capital, self.commission)
+            return fitness_fn(local_state['state'], params)
+
+        def store(key: tuple, fitness: Optional[float]) -> None:
+            if fitness is not None:
+                stats['backtests'] += 1
+                self.fitness_backtests += 1
+                self._fitness_cache[key] = fitness
+
+        def evaluate(individual):
+            params = tuple(int(value) for value in individual)
+            key = context + (params,)
+
+            stats['evaluations'] += 1
+            if key in self._fitness_cache:
+                stats['hits'] += 1
+                self.fitness_cache_hits += 1
+                return (self._fitness_cache[key],)
+
+            fitness = local_fitness(params)
+            store(key, fitness)
+            return (fitness,) if fitness is not None else (0,)
+
+        if pool is None:
+            return evaluate, map, stats
+
+        def parallel_map(func, individuals):
+            # DEAP calls toolbox.map(toolbox.evaluate, invalid_ind); evaluate
+            # uncached unique individuals on the pool, serve the rest from cache
+            keys = [context + (tuple(int(value) for value in ind),) for ind in individuals]
+            misses = list(dict.fromkeys(key for key in keys if key not in self._fitness_cache))
+
+            if misses:
+                tasks = [(strategy, key[-1]) for key in misses]
+                chunksize = max(1, len(tasks) // (n_workers * 4))
+                try:
+                    values = list(pool.map(_worker_fitness, tasks, chunksize=chunksize))
+                except Exception as e:
+                    print(f"   ⚠️  Worker evaluation failed ({e}), evaluating serially")
+                    values = [local_fitness(key[-1]) for key in misses]
+                for key, fitness in zip(misses, values):
+                    store(key, fitness)
+
+            fitnesses = [(self._fitness_cache[key],) if key in self._fitness_cache else (0,) for key in keys]
+
+            served = sum(1 for key in keys if key in self._fitness_cache)
+            n_backtests = sum(1 for key in misses if key in self._fitness_cache)
+            stats['evaluations'] += len(keys)
+            stats['hits'] += served - n_backtests
+            self.fitness_cache_hits += served - n_backtests
+            return fitnesses
+
+        return evaluate, parallel_map, stats
+
+    @staticmethod
+    def _summarize_cache_stats(stats: Dict) -> Dict[str, float]:
+        """Per-run cache report (invalid individuals excluded from the hit rate)"""
+        served = stats['hits'] + stats['backtests']
+        return {
+            'evaluations': stats['evaluations'],
+            'hits': stats['hits'],
+            'backtests': stats['backtests'],
+            'backtests_saved': stats['hits'],
+            'hit_rate': stats['hits'] / served if served > 0 else 0.0
+        }
+
+    def _print_cache_stats(self, stats: Dict) -> None:
+        summary = self._summarize_cache_stats(stats)
+        print(f"   [CACHE] Fitness cache: {summary['hit_rate']:.0%} hit rate, "
+              f"{summary['backtests']} backtests run, {summary['backtests_saved']} saved")
+
+    def fitness_cache_stats(self) -> Dict[str, float]:
+        """Fitness cache counters across all optimizations of this optimizer"""
+        lookups = self.fitness_cache_hits + self.fitness_backtests
+        return {
+            'entries': len(self._fitness_cache),
+            'hits': self.fitness_cache_hits,
+            'backtests': self.fitness_backtests,
+            'backtests_saved': self.fitness_cache_hits,
+            'hit_rate': self.fitness_cache_hits / lookups if lookups > 0 else 0.0
+        }
+
+    def clear_fitness_cache(self) -> None:
+        """Drop memoized fitness values (e.g. after changing data outside optimize_*)"""
+        self._fitness_cache.clear()
+        self.fitness_cache_hits = 0
+        self.fitness_backtests = 0
+
+    @staticmethod
+    def _sma_signals(indicators: IndicatorTable, fast: int, slow: int) -> Tuple[np.ndarray, np.ndarray]:
+        """SMA crossover entries/exits from an indicator table"""
+        fast_sma = indicators.sma(fast)
+        slow_sma = indicators.sma(slow)
+        fast_prev = np.concatenate([[np.nan], fast_sma[:-1]])
+        slow_prev = np.concatenate([[np.nan], slow_sma[:-1]])
+
+        entries = (fast_sma > slow_sma) & (fast_prev <= slow_prev)
+        exits = (fast_sma < slow_sma) & (fast_prev >= slow_prev)
+        return entries, exits
+
+    def _backtest_strategy(self, df: pd.DataFrame, params: Dict, return_portfolio: bool = False,
+                           indicators: IndicatorTable = None):
+        """Backtest strategy with given parameters (optionally reusing an indicator table for df)"""
         close = df['close'].values
+        if indicators is None:
+            indicators = IndicatorTable(close)
 
         if params['type'] == 'SMA':
-            fast_sma = pd.Series(close).rolling(params['fast']).mean()
-            slow_sma = pd.Series(close).rolling(params['slow']).mean()
-            entries = (fast_sma > slow_sma) & (fast_sma.shift(1) <= slow_sma.shift(1))
-            exits = (fast_sma < slow_sma) & (fast_sma.shift(1) >= slow_sma.shift(1))
+            entries, exits = self._sma_signals(indicators, params['fast'], params['slow'])
 
         elif params['type'] == 'RSI':
-            rsi = self._calculate_rsi(close, params['period'])
+            rsi = indicators.rsi(params['period'])
             entries = rsi < params['oversold']
             exits = rsi > params['overbought']
 
@@ -423,16 +999,13 @@ class StrategyOptimizer:
         if return_portfolio:
             return portfolio
 
-        try:
-            sharpe = portfolio.sharpe_ratio(freq='5min')
-        except:
-            sharpe = 0
+        metrics = portfolio_metrics(portfolio, freq='5min')
 
         return {
-            'total_return': portfolio.total_return() * 100,
-            'sharpe_ratio': sharpe,
-            'max_drawdown': portfolio.max_drawdown() * 100,
-            'num_trades': portfolio.trades.count()
+            'total_return': float(metrics['total_return'][0]) * 100,
+            'sharpe_ratio': float(metrics['sharpe_ratio'][0]),
+            'max_drawdown': float(metrics['max_drawdown'][0]) * 100,
+            'num_trades': int(metrics['num_trades'][0])
         }
 
     def _calculate_rsi(self, close: np.ndarray, period: int) -> pd.Series:
@@ -0,0 +1,84 @@
+"""
+Regime Engine - Hysteresis regime state machine on arrays
+
+NickRadgeCryptoHybrid.calculate_regime walked every date through a string
+state machine with repeated .loc lookups. regime_kernel_nb runs the same
+state machine on arrays of lagged price and MA bands, for any number of
+(ma_long, ma_short, hysteresis) combinations at once, and returns small
+integer regime codes (REGIME_LABELS maps them back to names).
+
+Kept in the package (not in the strategy file, which is loaded by path) so
+numba can cache the compiled kernel.
+
+Example:
+    codes = regime_kernel_nb(prices_lagged, ma_long, ma_short, hysteresis)
+    labels = REGIME_LABELS[codes[:, 0]]   # 'BEAR', 'WEAK_BULL', ...
+"""
+
+import numpy as np
+from numba import njit
+
+
+# Regime codes used by the array engine (REGIME_LABELS maps codes back to names)
+REGIME_UNKNOWN = 0
+REGIME_BEAR = 1
+REGIME_WEAK_BULL = 2
+REGIME_STRONG_BULL = 3
+REGIME_LABELS = np.array(['UNKNOWN', 'BEAR', 'WEAK_BULL', 'STRONG_BULL'], dtype=object)
+
+
+@njit(cache=True)
+def regime_kernel_nb(price, ma_long, ma_short, hysteresis):
+    """
+    Hysteresis regime state machine over arrays
+
+    Args:
+        price: Lagged BTC close (bars,)
+        ma_long: Lagged long MA per combination (bars x combos)
+        ma_short: Lagged short MA per combination (bars x combos)
+        hysteresis: Buffer per combination (combos,)
+
+    Returns:
+        Regime codes (bars x combos, int8)
+    """
+    n_bars, n_combos = ma_long.shape
+    codes = np.zeros((n_bars, n_combos), dtype=np.int8)
+
+    for j in range(n_combos):
+        up = 1 + hysteresis[j]
+        down = 1 - hysteresis[j]
+        state = REGIME_UNKNOWN
+
+        for i in range(n_bars):
+            p = price[i]
+            long_ma = ma_long[i, j]
+            short_ma = ma_short[i, j]
+
+            if np.isnan(p) or np.isnan(long_ma) or np.isnan(short_ma):
+                codes[i, j] = state
+                continue
+
+            if state == REGIME_BEAR:
+                # In BEAR: Need to exceed long MA upper band to exit
+                if p > long_ma * up:
+                    state = REGIME_STRONG_BULL if p > short_ma * up else REGIME_WEAK_BULL
+            elif state == REGIME_WEAK_BULL:
+                # Fall below long MA lower band → BEAR, exceed short MA upper band → STRONG_BULL
+                if p < long_ma * down:
+                    state = REGIME_BEAR
+                elif p > short_ma * up:
+                    state = REGIME_STRONG_BULL
+            elif state == REGIME_STRONG_BULL:
+                # Fall below short MA lower band → WEAK_BULL (or BEAR below long MA lower band)
+                if p < short_ma * down:
+                    state = REGIME_BEAR if p < long_ma * down else REGIME_WEAK_BULL
+            else:
+                # First classification (no hysteresis on initial state)
+                if p > long_ma:
+                    state = REGIME_STRONG_BULL if p > short_ma else REGIME_WEAK_BULL
+                else:
+                    state = REGIME_BEAR
+
+            codes[i, j] = state
+
+    return codes
@@ -0,0 +1,334 @@
+"""
+Sweep Results Store - Checkpointed, resumable storage for generator results
+
+StrategyGenerator used to keep every StrategyResult in memory until the
+sweep finished, so a crash or Ctrl-C in a long sweep lost all of it, and
+downstream scripts re-read a top-50 CSV written at the very end.
+
+SweepResultsStore is an append-only SQLite table of results:
+- Rows are buffered and flushed in batches (one transaction per batch)
+- Each row is keyed by a param hash (strategy params + data/cost context),
+  so a restarted sweep skips combinations that are already stored
+- Metric columns are indexed, so top-K queries run in SQL without loading
+  the full table
+
+Example:
+    generator = StrategyGenerator(results_store='results/sweeps.db')
+    generator.generate_sma_strategies(df, fast_range=range(5, 50), slow_range=range(50, 300))
+    # ... interrupted and restarted: finished combinations are read back, not re-run
+
+    store = SweepResultsStore('results/sweeps.db')
+    top_50 = store.top_k(50, metric='sharpe_ratio')
+"""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+# Metric columns stored per result (StrategyResult fields minus id/params)
+METRIC_COLUMNS = ['total_return', 'sharpe_ratio', 'max_drawdown', 'win_rate',
+                  'num_trades', 'profit_factor', 'avg_trade', 'trades_per_year']
+
+# Metrics with a top-K index
+INDEXED_METRICS = ['sharpe_ratio', 'total_return', 'max_drawdown', 'profit_factor']
+
+# SQLite's default limit on bound parameters per statement
+_MAX_SQL_VARIABLES = 900
+
+
+class SweepResultsStore:
+    """
+    Append-only SQLite store for strategy sweep results
+
+    The connection is opened lazily and dropped when pickled, so a
+    generator holding a store can be sent to SweepExecutor workers (each
+    worker opens its own connection; SQLite's WAL mode serializes writes).
+    """
+
+    def __init__(self, path: Union[str, Path] = 'results/sweeps.db', batch_size: int = 500):
+        """
+        Initialize results store
+
+        Args:
+            path: SQLite database file (created if missing)
+            batch_size: Buffered rows per flush (each flush is one transaction)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, batch_size)
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: List[tuple] = []
+        self._create_schema()
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.path), timeout=60)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+        return self._conn
+
+    def _create_schema(self) -> None:
+        metric_sql = ',\n'.join(
+            f"                    {col} {'INTEGER' if col == 'num_trades' else 'REAL'}" for col in METRIC_COLUMNS
+        )
+        with self.conn:
+            self.conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS results (
+                    param_hash TEXT PRIMARY KEY,
+                    context TEXT NOT NULL,
+                    strategy_type TEXT,
+                    strategy_id INTEGER,
+                    params TEXT NOT NULL,
+{metric_sql},
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_results_context ON results (context, strategy_id)')
+            for metric in INDEXED_METRICS:
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS idx_results_{metric} ON results ({metric} DESC)')
+
+    def __getstate__(self) -> Dict:
+        # Unflushed rows stay with (and are flushed by) the original object
+        state = dict(self.__dict__)
+        state['_conn'] = None
+        state['_pending'] = []
+        return state
+
+    def close(self) -> None:
+        """Flush buffered rows and close the connection"""
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> 'SweepResultsStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def param_hash(params: Dict, context: str) -> str:
+        """
+        Deterministic key for one parameter combination
+
+        Args:
+            params: Strategy parameter dict (StrategyResult.params)
+            context: Sweep context (data fingerprint, capital, fees) - the same
+                     params on different data are different results
+
+        Returns:
+            Hex digest
+        """
+        payload = json.dumps({'params': params, 'context': context}, sort_keys=True, default=_json_default)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, param_hash: str, context: str, strategy_id: int, params: Dict, metrics: Dict) -> None:
+        """
+        Buffer one result (flushed automatically every batch_size rows)
+
+        Args:
+            param_hash: Key from param_hash()
+            context: Sweep context string
+            strategy_id: Position of the combination in its generate_* call
+            params: Strategy parameter dict
+            metrics: Dict with METRIC_COLUMNS values
+        """
+        self._pending.append((
+            param_hash, context, str(params.get('type', '')), int(strategy_id),
+            json.dumps(params, default=_json_default),
+            *[_to_sql(metrics[col]) for col in METRIC_COLUMNS]
+        ))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write buffered rows in one transaction
+
+        Returns:
+            Number of rows flushed
+        """
+        if not self._pending:
+            return 0
+
+        columns = ['param_hash', 'context', 'strategy_type', 'strategy_id', 'params'] + METRIC_COLUMNS
+        placeholders = ', '.join('?' for _ in columns)
+        with self.conn:
+            # Append-only: a combination already stored (e.g. by another worker) is kept as is
+            self.conn.executemany(
+                f"INSERT OR IGNORE INTO results ({', '.join(columns)}) VALUES ({placeholders})",
+                self._pending
+            )
+
+        n_rows = len(self._pending)
+        self._pending = []
+        return n_rows
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, param_hashes: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Look up stored results by param hash
+
+        Args:
+            param_hashes: Keys from param_hash()
+
+        Returns:
+            Dict of param_hash -> metrics dict (only for stored hashes)
+        """
+        self.flush()
+        param_hashes = list(param_hashes)
+        found = {}
+
+        for start in range(0, len(param_hashes), _MAX_SQL_VARIABLES):
+            batch = param_hashes[start:start + _MAX_SQL_VARIABLES]
+            rows = self.conn.execute(
+                f"SELECT param_hash, {', '.join(METRIC_COLUMNS)} FROM results "
+                f"WHERE param_hash IN ({', '.join('?' for _ in batch)})",
+                batch
+            ).fetchall()
+            for row in rows:
+                found[row[0]] = {col: _from_sql(col, value) for col, value in zip(METRIC_COLUMNS, row[1:])}
+
+        return found
+
+    def top_k(self,
+              k: int = 50,
+              metric: str = 'sharpe_ratio',
+              ascending: bool = False,
+              strategy_type: Optional[str] = None,
+              context: Optional[str] = None) -> pd.DataFrame:
+        """
+        Best k results by a metric (sorted in SQL, only k rows loaded)
+
+        Args:
+            k: Number of results
+            metric: Metric column to rank by
+            ascending: Rank ascending instead of descending
+            strategy_type: Only this strategy type (e.g. 'SMA')
+            context: Only this sweep context
+
+        Returns:
+            DataFrame with strategy_id, params (dicts) and metric columns
+        """
+        if metric not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric: {metric}. Choose from {METRIC_COLUMNS}")
+
+        where, args = self._filters(strategy_type, context)
+        # Non-finite metrics (NULL = NaN, +/-inf e.g. Sharpe without trades) rank last in both directions
+        order = (f"({metric} IS NULL OR {metric} IN (9e999, -9e999)), "
+                 f"{metric} {'ASC' if ascending else 'DESC'}")
+        return self._query(f"{where} ORDER BY {order} LIMIT ?", args + [int(k)])
+
+    def load(self, strategy_type: Optional[str] = None, context: Optional[str] = None) -> pd.DataFrame:
+        """
+        Load all stored results (optionally filtered), in sweep order
+
+        Args:
+            strategy_type: Only this strategy type
+            context: Only this sweep context
+
+        Returns:
+            DataFrame with strategy_id, params (dicts) and metric columns
+        """
+        where, args = self._filters(strategy_type, context)
+        return self._query(f"{where} ORDER BY context, strategy_id", args)
+
+    def count(self, strategy_type: Optional[str] = None, context: Optional[str] = None) -> int:
+        """Number of stored results (optionally filtered)"""
+        self.flush()
+        where, args = self._filters(strategy_type, context)
+        return int(self.conn.execute(f"SELECT COUNT(*) FROM results {where}", args).fetchone()[0])
+
+    def clear(self) -> int:
+        """
+        Delete all stored results
+
+        Returns:
+            Number of rows removed
+        """
+        self._pending = []
+        with self.conn:
+            return self.conn.execute('DELETE FROM results').rowcount
+
+    @staticmethod
+    def _filters(strategy_type: Optional[str], context: Optional[str]):
+        clauses, args = [], []
+        if strategy_type is not None:
+            clauses.append('strategy_type = ?')
+            args.append(strategy_type)
+        if context is not None:
+            clauses.append('context = ?')
+            args.append(context)
+        return ('WHERE ' + ' AND '.join(clauses)) if clauses else '', args
+
+    def _query(self, tail: str, args: List) -> pd.DataFrame:
+        self.flush()
+        rows = self.conn.execute(
+            f"SELECT strategy_id, params, {', '.join(METRIC_COLUMNS)} FROM results {tail}", args
+        ).fetchall()
+
+        df = pd.DataFrame(rows, columns=['strategy_id', 'params'] + METRIC_COLUMNS)
+        df['params'] = [json.loads(p) for p in df['params']]
+        for col in METRIC_COLUMNS:
+            df[col] = [_from_sql(col, value) for value in df[col]]
+        return df
+
+
+def _json_default(value):
+    """JSON fallback for params: numpy scalars/arrays as Python numbers (5, not '5')"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _to_sql(value):
+    """NaN -> NULL (SQLite has no NaN); inf is stored as is"""
+    value = float(value)
+    return None if np.isnan(value) else value
+
+
+def _from_sql(column: str, value):
+    if column == 'num_trades':
+        return int(value) if value is not None else 0
+    return float(value) if value is not None else np.nan
+
+
+def get_results_store(results_store: Union[None, str, Path, SweepResultsStore]) -> Optional[SweepResultsStore]:
+    """
+    Normalize a results_store argument (None, database path or SweepResultsStore)
+
+    Args:
+        results_store: None (disabled), SQLite file path, or SweepResultsStore instance
+
+    Returns:
+        SweepResultsStore instance or None
+    """
+    if results_store is None or isinstance(results_store, SweepResultsStore):
+        return results_store
+    return SweepResultsStore(results_store)
@@ -0,0 +1,227 @@
+"""
+Stop-Loss Engine - Single-pass portfolio simulation with path-dependent stops
+
+NickRadgeCryptoHybrid used a two-pass backtest: a full vbt.Portfolio run to
+get an equity curve, apply_portfolio_stop_loss on that curve, then a second
+full run with the rewritten allocations. The first-pass equity never sees
+the stop's own effect on later values.
+
+simulate_with_stops_nb runs the target-percent rebalance once and decides
+the portfolio drawdown stop, trough-based re-entry and position stops bar
+by bar against the equity it is producing. It follows vectorbt's
+simulate_from_orders_nb and uses its order primitives, so the returned
+order records build a regular vbt.Portfolio.
+
+Kept in the package (not in the strategy file, which is loaded by path) so
+numba can cache the compiled kernel. The kernel releases the GIL, so sweep
+variants can simulate concurrently on threads.
+
+Example:
+    (order_records, log_records, target, equity, running_peak, trough,
+     stop_state, position_hit, position_hit_entry) = simulate_with_stops_nb(...)
+    wrapper = ArrayWrapper.from_obj(prices, freq='D', group_by=True)
+    portfolio = vbt.Portfolio(wrapper, prices, order_records, log_records, init_cash, True)
+"""
+
+import numpy as np
+from numba import njit
+from vectorbt.portfolio import nb as portfolio_nb
+from vectorbt.portfolio.enums import Direction, ProcessOrderState, SizeType
+from vectorbt.utils.array_ import insert_argsort_nb
+
+
+# Portfolio stop-loss state per bar (single-pass simulator)
+STOP_NONE = 0        # Trading normally
+STOP_TRIGGERED = 1   # Stop-loss triggered on this bar (exit to bear asset)
+STOP_REENTRY = 2     # Re-entry conditions met on this bar (resume signals)
+STOP_HOLDING = 3     # Still in stop-loss mode (holding bear asset)
+
+_NS_PER_DAY = 86_400 * 10**9
+
+
+@njit(cache=True, nogil=True)
+def simulate_with_stops_nb(close, allocations, timestamps, init_cash, fees, slippage, min_size,
+                           bear_col, portfolio_stop, min_cooldown_days, reentry_threshold,
+                           position_stop, position_eligible):
+    """
+    Target-percent portfolio simulation with stop-losses decided on live equity
+
+    Follows vectorbt's simulate_from_orders_nb (one cash-sharing group,
+    auto call sequence, forward-filled valuation price) and uses its order
+    primitives, so the order records are what from_orders would produce for
+    the final allocations. Before each bar's orders, the portfolio stop and
+    position stops are evaluated on the mark-to-market equity at that bar's
+    close and override the bar's target allocations.
+
+    Args:
+        close: Price matrix (bars x assets)
+        allocations: Target percent per asset (NaN = no rebalance)
+        timestamps: Bar timestamps as int64 nanoseconds
+        init_cash: Starting capital
+        fees: Proportional fees
+        slippage: Proportional slippage
+        min_size: Minimum order size (vectorbt default)
+        bear_col: Column of the bear asset (-1 if absent)
+        portfolio_stop: Drawdown from peak that triggers the exit (NaN = disabled)
+        min_cooldown_days: Minimum days in the bear asset before re-entry
+        reentry_threshold: Recovery from trough required for re-entry
+        position_stop: Drop from entry that exits a position (NaN = disabled)
+        position_eligible: Assets the position stop applies to (assets,)
+
+    Returns:
+        Tuple of order records, log records, final allocations, equity
+        (pre-trade, per bar), running peak, stop-mode trough, portfolio
+        stop state per bar, position stop hits (bars x assets) and entry
+        price of each hit
+    """
+    n_bars, n_assets = close.shape
+    order_records, log_records = portfolio_nb.init_records_nb((n_bars, n_assets), n_bars * n_assets, 1, False)
+
+    last_position = np.zeros(n_assets)
+    last_debt = np.zeros(n_assets)
+    last_val_price = np.full(n_assets, np.nan)
+    order_value = np.empty(n_assets)
+    call_seq = np.empty(n_assets, dtype=np.int64)
+    cash_now = init_cash
+    free_cash_now = init_cash
+    oidx = 0
+    lidx = 0
+
+    target = np.full((n_bars, n_assets), np.nan)
+    equity = np.empty(n_bars)
+    running_peak = np.empty(n_bars)
+    trough = np.full(n_bars, np.nan)
+    stop_state = np.zeros(n_bars, dtype=np.int8)
+    position_hit = np.zeros((n_bars, n_assets), dtype=np.bool_)
+    position_hit_entry = np.full((n_bars, n_assets), np.nan)
+
+    use_portfolio_stop = not np.isnan(portfolio_stop)
+    use_position_stop = not np.isnan(position_stop)
+
+    peak = -np.inf
+    in_stop_loss_mode = False
+    trigger_time = 0
+    trough_value = np.nan
+
+    entry_price = np.full(n_assets, np.nan)
+    tracked = np.zeros(n_assets, dtype=np.bool_)
+    stopped = np.zeros(n_assets, dtype=np.bool_)
+    prev_has_alloc = np.zeros(n_assets, dtype=np.bool_)
+
+    for i in range(n_bars):
+        # Valuation at this bar's close (forward-filled, as in from_orders)
+        for col in range(n_assets):
+            if not np.isnan(close[i, col]):
+                last_val_price[col] = close[i, col]
+
+        value_now = portfolio_nb.get_group_value_nb(0, n_assets, cash_now, last_position, last_val_price)
+        equity[i] = value_now
+        peak = max(peak, value_now)
+        running_peak[i] = peak
+
+        row = allocations[i].copy()
+
+        # === Portfolio stop-loss (drawdown from peak, trough-based re-entry) ===
+        if use_portfolio_stop:
+            override = False
+            if in_stop_loss_mode:
+                trough[i] = trough_value
+                days_since_trigger = (timestamps[i] - trigger_time) // _NS_PER_DAY
+                recovery_from_trough = (value_now - trough_value) / trough_value
+
+                if days_since_trigger >= min_cooldown_days and recovery_from_trough >= reentry_threshold:
+                    stop_state[i] = STOP_REENTRY
+                    in_stop_loss_mode = False
+                else:
+                    stop_state[i] = STOP_HOLDING
+                    override = True
+                    if value_now < trough_value:
+                        trough_value = value_now
+
+            elif (value_now - peak) / peak < -portfolio_stop:
+                stop_state[i] = STOP_TRIGGERED
+                in_stop_loss_mode = True
+                trigger_time = timestamps[i]
+                trough_value = value_now
+                trough[i] = trough_value
+                override = True
+
+            if override:
+                # Exit to bear asset
+                row[:] = 0.0
+                if bear_col >= 0:
+                    row[bear_col] = 1.0
+
+        # === Position stop-loss (drop from entry price) ===
+        if use_position_stop:
+            for col in range(n_assets):
+                has_alloc = not np.isnan(row[col]) and row[col] != 0
+                was_out = i > 0 and not prev_has_alloc[col]
+                prev_has_alloc[col] = has_alloc
+
+                price = close[i, col]
+                if not has_alloc or not position_eligible[col] or np.isnan(price) or price <= 0:
+                    continue
+
+                if not tracked[col]:
+                    tracked[col] = True
+                    entry_price[col] = price
+                    stopped[col] = False
+
+                if not stopped[col] and (price - entry_price[col]) / entry_price[col] < -position_stop:
+                    stopped[col] = True
+                    position_hit[i, col] = True
+                    position_hit_entry[i, col] = entry_price[col]
+                    row[col] = 0.0
+
+                # Reset entry if position was exited and is re-entering
+                if was_out:
+                    entry_price[col] = price
+                    stopped[col] = False
+
+        target[i] = row
+
+        # Sort by order value -> selling comes first to release funds early
+        for k in range(n_assets):
+            call_seq[k] = k
+            order_value[k] = portfolio_nb.approx_order_value_nb(
+                row[k], SizeType.TargetPercent, Direction.Both, cash_now,
+                last_position[k], free_cash_now, last_val_price[k], value_now
+            )
+        insert_argsort_nb(order_value, call_seq)
+
+        for k in range(n_assets):
+            col = call_seq[k]
+            order = portfolio_nb.order_nb(
+                size=row[col],
+                price=close[i, col],
+                size_type=SizeType.TargetPercent,
+                direction=Direction.Both,
+                fees=fees,
+                slippage=slippage,
+                min_size=min_size
+            )
+            state = ProcessOrderState(
+                cash=cash_now,
+                position=last_position[col],
+                debt=last_debt[col],
+                free_cash=free_cash_now,
+                val_price=last_val_price[col],
+                value=value_now,
+                oidx=oidx,
+                lidx=lidx
+            )
+            _, new_state = portfolio_nb.process_order_nb(i, col, 0, state, False, order, order_records, log_records)
+
+            cash_now = new_state.cash
+            free_cash_now = new_state.free_cash
+            value_now = new_state.value
+            oidx = new_state.oidx
+            lidx = new_state.lidx
+            last_position[col] = new_state.position
+            last_debt[col] = new_state.debt
+            if not np.isnan(new_state.val_price):
+                last_val_price[col] = new_state.val_price
+
+    return (order_records[:oidx], log_records[:lidx], target, equity, running_peak, trough,
+            stop_state, position_hit, position_hit_entry)
@@ -0,0 +1,253 @@
+"""
+Sweep Executor - Spread StrategyGenerator sweeps across worker processes
+
+StrategyGenerator runs every parameter combination in a single process. The
+SweepExecutor splits a generate_* call's parameter grid into contiguous
+blocks, runs the blocks in a process pool and merges the results in the
+same order (and with the same strategy_ids) as the single-process call.
+
+Price data is placed in shared memory once; each worker attaches to it in
+its initializer and rebuilds the DataFrame locally, so tasks only carry
+their parameter block instead of pickling the full price history.
+
+Example:
+    executor = SweepExecutor(StrategyGenerator(), n_workers=8)
+    results = executor.run('generate_sma_strategies', df,
+                           fast_range=range(5, 50), slow_range=range(50, 300, 5))
+"""
+
+import inspect
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from strategy_factory.generator import StrategyGenerator, RESULT_COLUMNS
+
+
+# Grid arguments of each generate_* method, in the order the method iterates
+# them (itertools.product order), plus the name of its data argument
+SWEEP_METHODS = {
+    'generate_sma_strategies': ('df', ['fast_range', 'slow_range']),
+    'generate_rsi_strategies': ('df', ['period_range', 'oversold_range', 'overbought_range']),
+    'generate_breakout_strategies': ('df', ['lookback_range', 'breakout_pct_range']),
+    'generate_macd_strategies': ('df', ['fast_range', 'slow_range', 'signal_range']),
+    'generate_crypto_momentum_strategies': ('prices', ['roc_periods', 'rebalance_freq', 'num_positions']),
+}
+
+# Worker-process state (set once per worker by _init_worker)
+_WORKER_GENERATOR: Optional[StrategyGenerator] = None
+_WORKER_DATA: Optional[pd.DataFrame] = None
+_WORKER_SHM: List[shared_memory.SharedMemory] = []
+
+
+def _share_array(array: np.ndarray) -> Dict:
+    """Copy an array into a new shared memory block and return its descriptor"""
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return {'shm': shm, 'name': shm.name, 'shape': array.shape, 'dtype': array.dtype.str}
+
+
+def _attach_array(descriptor: Dict) -> np.ndarray:
+    """Attach to a shared array in a worker (view, no copy - workers must not write to it)"""
+    try:
+        shm = shared_memory.SharedMemory(name=descriptor['name'], track=False)
+    except TypeError:
+        # Python < 3.13: workers share the parent's resource tracker, so the
+        # (idempotent) registration is released by the parent's unlink()
+        shm = shared_memory.SharedMemory(name=descriptor['name'])
+
+    _WORKER_SHM.append(shm)
+    # Left writeable: numba-compiled vectorbt kernels and some pandas rolling
+    # paths reject read-only buffers. Generators never modify their inputs.
+    return np.ndarray(descriptor['shape'], dtype=np.dtype(descriptor['dtype']), buffer=shm.buf)
+
+
+def _init_worker(generator: StrategyGenerator, data_descriptor: Dict) -> None:
+    """Process-pool initializer: attach shared prices and rebuild the DataFrame once"""
+    global _WORKER_GENERATOR, _WORKER_DATA
+
+    values = _attach_array(data_descriptor['values'])
+    if data_descriptor['index_i8'] is not None:
+        index = pd.DatetimeIndex(_attach_array(data_descriptor['index_i8']).view('M8[ns]'))
+        if data_descriptor['tz'] is not None:
+            index = index.tz_localize('UTC').tz_convert(data_descriptor['tz'])
+        index.name = data_descriptor['index_name']
+    else:
+        index = data_descriptor['index']
+
+    _WORKER_DATA = pd.DataFrame(values, index=index, columns=data_descriptor['columns'], copy=False)
+    _WORKER_GENERATOR = generator
+
+
+def _run_block(method: str, task_id: int, kwargs: Dict) -> tuple:
+    """Worker task: run one parameter block of a generate_* method"""
+    data_arg, _ = SWEEP_METHODS[method]
+    results = getattr(_WORKER_GENERATOR, method)(**{data_arg: _WORKER_DATA}, **kwargs, verbose=False)
+    # Restore iteration order (generate_* sorts by Sharpe)
+    return task_id, results.sort_values('strategy_id')
+
+
+class SweepExecutor:
+    """
+    Run StrategyGenerator.generate_* sweeps on a process pool
+
+    The grid is split on its leading parameter lists: each task is one
+    combination of leading values times the full remaining lists, so
+    concatenating task results in task order reproduces the serial
+    itertools.product order exactly.
+    """
+
+    def __init__(self,
+                 generator: Optional[StrategyGenerator] = None,
+                 n_workers: Optional[int] = None,
+                 tasks_per_worker: int = 4,
+                 verbose: bool = True):
+        """
+        Initialize sweep executor
+
+        Args:
+            generator: Configured StrategyGenerator (default: StrategyGenerator())
+            n_workers: Worker processes (default: os.cpu_count())
+            tasks_per_worker: Target tasks per worker, for load balancing (default: 4)
+            verbose: Print progress
+        """
+        self.generator = generator or StrategyGenerator()
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.tasks_per_worker = max(1, tasks_per_worker)
+        self.verbose = verbose
+
+    def _split_grid(self, method: str, kwargs: Dict) -> List[Dict]:
+        """
+        Split a method's parameter grid into contiguous task blocks
+
+        Leading grid lists are expanded to single values until there are at
+        least n_workers * tasks_per_worker blocks (or all lists are expanded).
+        """
+        _, grid_args = SWEEP_METHODS[method]
+        defaults = inspect.signature(getattr(self.generator, method)).parameters
+        grid = {arg: list(kwargs.get(arg, defaults[arg].default)) for arg in grid_args}
+        target_tasks = self.n_workers * self.tasks_per_worker
+
+        n_split = 0
+        n_tasks = 1
+        while n_split < len(grid_args) and n_tasks < target_tasks:
+            n_tasks *= len(grid[grid_args[n_split]])
+            n_split += 1
+
+        blocks = []
+        split_args = grid_args[:n_split]
+        for leading_values in product(*[grid[arg] for arg in split_args]):
+            block = dict(kwargs)
+            block.update(grid)
+            block.update({arg: [value] for arg, value in zip(split_args, leading_values)})
+            blocks.append(block)
+        return blocks
+
+    @staticmethod
+    def _share_data(data: pd.DataFrame) -> Dict:
+        """Place numeric price columns (and a DatetimeIndex) in shared memory"""
+        numeric = data.select_dtypes(include=[np.number])
+        descriptor = {
+            'values': _share_array(numeric.values.astype(np.float64)),
+            'columns': list(numeric.columns),
+            'index_i8': None,
+            'index': None,
+            'tz': None,
+            'index_name': data.index.name
+        }
+
+        if isinstance(data.index, pd.DatetimeIndex):
+            index = data.index
+            if index.tz is not None:
+                descriptor['tz'] = str(index.tz)
+                index = index.tz_convert('UTC').tz_localize(None)
+            descriptor['index_i8'] = _share_array(index.values.astype('M8[ns]').view('i8'))
+        else:
+            descriptor['index'] = data.index
+
+        return descriptor
+
+    def run(self, method: str, data: pd.DataFrame, **kwargs) -> pd.DataFrame:
+        """
+        Run a generate_* sweep in parallel
+
+        Args:
+            method: Generator method name ('generate_sma_strategies', ... or 'sma', 'rsi',
+                    'breakout', 'macd', 'crypto_momentum')
+            data: OHLCV DataFrame (or crypto price matrix for crypto momentum)
+            **kwargs: Arguments for the generator method (grid lists, universe_type, ...)
+
+        Returns:
+            DataFrame with all strategy results, sorted by Sharpe ratio
+            (same rows and strategy_ids as the single-process call)
+        """
+        if method not in SWEEP_METHODS:
+            method = f"generate_{method}_strategies"
+        if method not in SWEEP_METHODS:
+            raise ValueError(f"Unknown sweep method: {method}. Choose from {list(SWEEP_METHODS)}")
+
+        kwargs.pop('verbose', None)
+        blocks = self._split_grid(method, kwargs)
+        n_workers = min(self.n_workers, len(blocks))
+
+        if self.verbose:
+            print(f"🔄 Sweep {method} on {n_workers} workers ({len(blocks)} tasks)")
+
+        start_time = time.perf_counter()
+        descriptor = self._share_data(data)
+        block_results: Dict[int, pd.DataFrame] = {}
+
+        try:
+            with ProcessPoolExecutor(max_workers=n_workers,
+                                     initializer=_init_worker,
+                                     initargs=(self.generator, self._worker_descriptor(descriptor))) as pool:
+                futures = [pool.submit(_run_block, method, task_id, block)
+                           for task_id, block in enumerate(blocks)]
+
+                done_combos = 0
+                for n_done, future in enumerate(as_completed(futures), start=1):
+                    task_id, results = future.result()
+                    block_results[task_id] = results
+                    done_combos += len(results)
+
+                    if self.verbose and (n_done == len(blocks) or n_done % max(1, len(blocks) // 10) == 0):
+                        elapsed = time.perf_counter() - start_time
+                        print(f"   [SWEEP] {n_done}/{len(blocks)} tasks ({n_done / len(blocks):.0%}), "
+                              f"{done_combos} strategies, {elapsed:.1f}s")
+        finally:
+            for key in ('values', 'index_i8'):
+                if descriptor[key] is not None:
+                    descriptor[key]['shm'].close()
+                    descriptor[key]['shm'].unlink()
+
+        # Deterministic merge: task order == serial iteration order
+        ordered = [block_results[task_id] for task_id in range(len(blocks))]
+        ordered = [frame for frame in ordered if len(frame) > 0]
+        df_results = pd.concat(ordered, ignore_index=True) if ordered else pd.DataFrame(columns=RESULT_COLUMNS)
+        df_results['strategy_id'] = np.arange(len(df_results))
+        df_results = df_results.sort_values('sharpe_ratio', ascending=False)
+
+        if self.verbose:
+            elapsed = time.perf_counter() - start_time
+            print(f"✅ Generated {len(df_results)} strategies in {elapsed:.1f}s "
+                  f"({len(df_results) / max(elapsed, 1e-9):.0f} strategies/sec)")
+            if len(df_results) > 0:
+                print(f"   Best Sharpe: {df_results['sharpe_ratio'].max():.2f}")
+
+        return df_results
+
+    @staticmethod
+    def _worker_descriptor(descriptor: Dict) -> Dict:
+        """Descriptor without SharedMemory handles (what workers receive)"""
+        worker = dict(descriptor)
+        for key in ('values', 'index_i8'):
+            if worker[key] is not None:
+                worker[key] = {k: v for k, v in worker[key].items() if k != 'shm'}
+        return worker
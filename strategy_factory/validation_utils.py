@@ -18,6 +18,9 @@ from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+from strategy_factory.metrics_kernel import portfolio_metrics
+from strategy_factory.monte_carlo import MonteCarloEngine
+
 
 class WalkForwardValidator:
     """
@@ -160,19 +163,12 @@ class WalkForwardValidator:
                     **strategy_kwargs
                 )
 
-                # Extract metrics
-                total_return = float(portfolio.total_return().iloc[0] if isinstance(portfolio.total_return(), pd.Series)
-                                   else portfolio.total_return()) * 100
-                sharpe = float(portfolio.sharpe_ratio(freq='D').iloc[0] if isinstance(portfolio.sharpe_ratio(freq='D'), pd.Series)
-                             else portfolio.sharpe_ratio(freq='D'))
-                max_dd = float(portfolio.max_drawdown().iloc[0] if isinstance(portfolio.max_drawdown(), pd.Series)
-                             else portfolio.max_drawdown()) * 100
-
-                try:
-                    win_rate = float(portfolio.trades.win_rate().iloc[0] if isinstance(portfolio.trades.win_rate(), pd.Series)
-                                   else portfolio.trades.win_rate()) * 100
-                except:
-                    win_rate = np.nan
+                # Extract metrics (first column/group, one pass over value and trades)
+                metrics = portfolio_metrics(portfolio, freq='D')
+                total_return = float(metrics['total_return'][0]) * 100
+                sharpe = float(metrics['sharpe_ratio'][0])
+                max_dd = float(metrics['max_drawdown'][0]) * 100
+                win_rate = float(metrics['win_rate'][0]) * 100
 
                 num_trades = len(portfolio.trades.records)
 
@@ -296,26 +292,15 @@ class MonteCarloSimulator:
         print(f"Original Total Return: {(portfolio.total_return().iloc[0] if isinstance(portfolio.total_return(), pd.Series) else portfolio.total_return()) * 100:.2f}%")
         print(f"\nResampling {num_trades} trades {self.n_simulations} times...")
 
-        results = []
-
-        for sim in range(self.n_simulations):
-            # Resample trades with replacement
-            resampled_returns = np.random.choice(returns, size=num_trades, replace=True)
-
-            # Calculate cumulative return
-            cumulative_value = initial_capital
-            for ret in resampled_returns:
-                cumulative_value *= (1 + ret)
+        # Resample trades with replacement (vectorized, chunked for memory)
+        simulations = MonteCarloEngine(n_simulations=self.n_simulations).simulate(returns)
 
-            total_return = (cumulative_value / initial_capital - 1) * 100
-
-            results.append({
-                'simulation': sim + 1,
-                'final_value': cumulative_value,
-                'total_return_%': total_return
-            })
-
-        results_df = pd.DataFrame(results)
+        results_df = pd.DataFrame({
+            'simulation': np.arange(1, self.n_simulations + 1),
+            'final_value': initial_capital * (1 + simulations['total_return']),
+            'total_return_%': simulations['total_return'] * 100,
+            'max_drawdown_%': simulations['max_drawdown'] * 100
+        })
 
         # Calculate statistics
         mean_return = results_df['total_return_%'].mean()
@@ -354,6 +339,9 @@ class MonteCarloSimulator:
         print(f"   Worst Case: {worst_case:.2f}%")
         print(f"   Best Case: {best_case:.2f}%")
         print(f"   95th Percentile: {ci_90_upper:.2f}%")
+        print(f"\n📉 Path Max Drawdown:")
+        print(f"   Median: {results_df['max_drawdown_%'].median():.2f}%")
+        print(f"   5th Percentile: {results_df['max_drawdown_%'].quantile(0.05):.2f}%")
         print(f"{'='*80}\n")
 
         return results_df